@@ -1,11 +1,16 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file
 import os
-import tempfile
+import re
+import json
+import uuid
 import logging
 from datetime import datetime
-from comet_automation import CometAutomation, MockCometAutomation
-from utils.content_synthesizer import ContentSynthesizer
-from utils.audio_generator import AudioGenerator
+from utils.job_queue import JobQueue, QueueFullError
+from utils.batch import BatchRegistry, BatchRunner
+from utils.cache import ResearchCache, normalize_topic
+from utils.components import ComponentRegistry
+from utils.single_flight import SingleFlight
+from utils import metrics
 from config import Config
 
 # Configure logging
@@ -15,23 +20,118 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 app.config.from_object(Config)
 
-# Initialize components
-comet_automation = MockCometAutomation()  # Using mock for reliable demo
-content_synthesizer = ContentSynthesizer()
-audio_generator = AudioGenerator()
+# Backends import their libraries (Selenium, the OpenAI SDK) inside the
+# factories, so only the ones actually used are loaded, and only on first use
+def create_comet_automation():
+    """Build the research backend(s) named by Config.RESEARCH_BACKENDS"""
+    from utils.research_backends import create_research
+    return create_research(cache=research_cache)
+
+def create_content_synthesizer():
+    from utils.content_synthesizer import ContentSynthesizer
+    synthesizer = ContentSynthesizer()
+    metrics.watch_cache("synthesis", synthesizer.cache)
+    return synthesizer
+
+def create_audio_generator():
+    from utils.audio_generator import AudioGenerator
+    generator = AudioGenerator()
+    generator.store.start()
+    metrics.watch_audio_store(generator.store)
+    return generator
+
+def create_podcast_pipeline():
+    from utils.podcast_pipeline import PodcastPipeline
+    return PodcastPipeline(
+        components.get("comet_automation"),
+        components.get("content_synthesizer"),
+        components.get("audio_generator")
+    )
+
+# Initialize components; the heavy ones are built by the registry on first use
+research_cache = ResearchCache.from_config()
+job_queue = JobQueue()
+research_flights = SingleFlight()
+components = ComponentRegistry()
+components.register("comet_automation", create_comet_automation)
+components.register("content_synthesizer", create_content_synthesizer)
+components.register("audio_generator", create_audio_generator)
+components.register("podcast_pipeline", create_podcast_pipeline)
+
+def __getattr__(name):
+    """app.comet_automation and friends build the component on first access"""
+    if name in components:
+        return components.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def submit_research_job(topic):
+    """Queue a podcast job, or attach to one already running for the same topic
+    
+    Returns (job, attachment token, shared); the token is what this
+    requester passes to cancel.
+    """
+    run = components.get("podcast_pipeline").run
+    if not Config.SINGLE_FLIGHT_ENABLED:
+        job = job_queue.submit(topic, run)
+        return job, job.token, False
+    
+    key = normalize_topic(topic)
+    job, shared = research_flights.join(
+        key,
+        lambda: job_queue.submit(topic, run),
+        is_active=lambda job: not job.done and not job.cancel_requested()
+    )
+    if shared:
+        token = job.attach()
+        logger.info(f"🔗 Coalesced request for '{topic}' onto job {job.id}")
+    else:
+        token = job.token
+        job.future.add_done_callback(lambda _: research_flights.forget(key, job))
+    return job, token, shared
+
+metrics.watch_cache("research", research_cache)
+metrics.watch_job_queue(job_queue)
+metrics.watch_single_flight(research_flights)
+
+if Config.PREWARM_COMPONENTS:
+    components.prewarm(None if Config.PREWARM_COMPONENTS == ["all"] else Config.PREWARM_COMPONENTS)
+
+BATCH_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+batches = BatchRegistry()
+
+def batch_manifest_path(batch_id):
+    return os.path.join(Config.BATCH_DIR, f"{batch_id}.json")
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+def synthesis_cache_stats():
+    synthesizer = components.peek("content_synthesizer")
+    return synthesizer.cache.stats() if synthesizer is not None and synthesizer.cache else None
+
+def audio_store_stats():
+    generator = components.peek("audio_generator")
+    return dict(generator.store.stats(), **generator.store.usage()) if generator is not None else None
+
 @app.route('/health')
 def health():
     return jsonify({
         "status": "healthy", 
         "timestamp": datetime.now().isoformat(),
-        "mode": "demo" if Config.DEMO_MODE else "production"
+        "mode": "demo" if Config.DEMO_MODE else "production",
+        "research_cache": research_cache.stats(),
+        "synthesis_cache": synthesis_cache_stats(),
+        "audio_store": audio_store_stats(),
+        "single_flight": research_flights.stats(),
+        "components": components.stats()
     })
 
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus text exposition of pipeline, cache, pool and queue metrics"""
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
 @app.route('/api/initialize-comet', methods=['POST'])
 def initialize_comet():
     """Initialize COMET browser session"""
@@ -71,6 +171,7 @@ def initialize_comet():
 
 @app.route('/api/research', methods=['POST'])
 def create_research_podcast():
+    """Queue a research podcast job and return its id immediately"""
     try:
         data = request.get_json()
         topic = data.get('topic', '').strip()
@@ -82,50 +183,147 @@ def create_research_podcast():
             return jsonify({"error": "Topic too short"}), 400
         
         logger.info(f"🎯 Processing research topic: {topic}")
+        job, token, coalesced = submit_research_job(topic)
         
-        # Step 1: Research with COMET Browser
-        logger.info("🔍 Starting COMET research...")
-        research_data = comet_automation.research_topic(topic)
+        return jsonify({
+            "success": True,
+            "job_id": job.id,
+            "status": job.status,
+            "coalesced": coalesced,
+            "status_url": f"/api/jobs/{job.id}",
+            "cancel_url": f"/api/jobs/{job.id}/cancel",
+            "cancel_token": token
+        }), 202
         
-        if not research_data:
-            return jsonify({"error": "Research failed. Please try a different topic."}), 500
+    except QueueFullError:
+        logger.warning("⚠️ Job queue is full, rejecting request")
+        return jsonify({"error": "Server is busy. Please try again shortly."}), 503
+    except Exception as e:
+        logger.error(f"❌ Research podcast error: {str(e)}")
+        return jsonify({"error": "Internal server error. Please try again."}), 500
+
+@app.route('/api/jobs/<job_id>')
+def get_job_status(job_id):
+    """Report per-stage progress and the result of a job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/events')
+def job_events(job_id):
+    """Server-Sent Events: stage changes and script fragments as they happen"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    start = int(last_event_id) + 1 if last_event_id.isdigit() else 0
+    
+    def generate():
+        for index, event, data in job.iter_events(start, timeout=Config.SSE_KEEPALIVE):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"id: {index}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    return Response(generate(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a queued or running job
+    
+    Takes the cancel_token from the research response (JSON body or
+    ?token=). Without one the call acts for the requester that submitted
+    the job, so repeating it never detaches anyone else.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    if job.done:
+        return jsonify({"error": f"Job already {job.status}"}), 409
+    
+    data = request.get_json(silent=True) or {}
+    token = data.get('cancel_token') or request.args.get('token') or job.token
+    job_queue.cancel(job_id, token)
+    return jsonify({"success": True, "job_id": job.id, "status": job.status})
+
+@app.route('/api/batch', methods=['POST'])
+def create_batch():
+    """Start (or resume, given an existing batch_id) a batch of podcast topics"""
+    try:
+        data = request.get_json() or {}
+        topics = [topic.strip() for topic in data.get('topics', []) if isinstance(topic, str) and topic.strip()]
+        batch_id = data.get('batch_id') or uuid.uuid4().hex
         
-        # Step 2: Synthesize content
-        logger.info("✍️ Synthesizing podcast script...")
-        podcast_script = content_synthesizer.create_podcast_script(topic, research_data)
+        if not BATCH_ID_PATTERN.match(batch_id):
+            return jsonify({"error": "Invalid batch_id"}), 400
+        if len(topics) > Config.BATCH_MAX_TOPICS:
+            return jsonify({"error": f"At most {Config.BATCH_MAX_TOPICS} topics per batch"}), 400
+        too_short = [topic for topic in topics if len(topic) < 3]
+        if too_short:
+            return jsonify({"error": "Topic too short", "topics": too_short}), 400
         
-        if not podcast_script:
-            return jsonify({"error": "Content synthesis failed."}), 500
+        runner = batches.get(batch_id)
+        if runner is not None and runner.running:
+            return jsonify({"error": "Batch is already running"}), 409
         
-        # Step 3: Generate audio
-        logger.info("🔊 Generating audio podcast...")
-        audio_file_path = audio_generator.text_to_speech(podcast_script, topic)
+        manifest_path = batch_manifest_path(batch_id)
+        if not topics and not os.path.exists(manifest_path):
+            return jsonify({"error": "Topics are required"}), 400
         
-        if not audio_file_path:
-            return jsonify({"error": "Audio generation failed."}), 500
+        runner = BatchRunner(
+            job_queue,
+            components.get("podcast_pipeline").run,
+            manifest_path,
+            submit=lambda topic: submit_research_job(topic)[:2],
+            batch_id=batch_id
+        )
+        batches.add(runner.start(topics))
+        logger.info(f"📦 Started batch {batch_id} with {len(topics)} submitted topics")
         
-        # Return success response
         return jsonify({
             "success": True,
-            "audio_url": f"/api/download/{os.path.basename(audio_file_path)}",
-            "script_preview": podcast_script[:400] + "..." if len(podcast_script) > 400 else podcast_script,
-            "topic": topic,
-            "research_summary": f"Researched {len(research_data)} key aspects",
-            "script_length": len(podcast_script),
-            "demo_mode": True
-        })
+            "batch_id": batch_id,
+            "status_url": f"/api/batch/{batch_id}",
+            "cancel_url": f"/api/batch/{batch_id}/cancel"
+        }), 202
         
     except Exception as e:
-        logger.error(f"❌ Research podcast error: {str(e)}")
+        logger.error(f"❌ Batch submission error: {str(e)}")
         return jsonify({"error": "Internal server error. Please try again."}), 500
 
+@app.route('/api/batch/<batch_id>')
+def get_batch(batch_id):
+    """Return the batch manifest with per-topic status and audio links"""
+    if not BATCH_ID_PATTERN.match(batch_id):
+        return jsonify({"error": "Batch not found"}), 404
+    
+    runner = batches.get(batch_id)
+    if runner is not None:
+        return jsonify(runner.manifest())
+    
+    manifest_path = batch_manifest_path(batch_id)
+    if not os.path.exists(manifest_path):
+        return jsonify({"error": "Batch not found"}), 404
+    return send_file(manifest_path, mimetype="application/json")
+
+@app.route('/api/batch/<batch_id>/cancel', methods=['POST'])
+def cancel_batch(batch_id):
+    """Stop a running batch; finished topics stay in the manifest"""
+    runner = batches.get(batch_id)
+    if runner is None or not runner.running:
+        return jsonify({"error": "Batch is not running"}), 409
+    
+    runner.cancel()
+    return jsonify({"success": True, "batch_id": batch_id})
+
 @app.route('/api/download/<filename>')
 def download_audio(filename):
     try:
-        temp_dir = tempfile.gettempdir()
-        file_path = os.path.join(temp_dir, filename)
+        file_path = components.get("audio_generator").store.resolve(filename)
         
-        if os.path.exists(file_path):
+        if file_path:
             safe_topic = "research_podcast"
             return send_file(
                 file_path,
@@ -140,6 +338,61 @@ def download_audio(filename):
         logger.error(f"❌ Download error: {str(e)}")
         return jsonify({"error": "Download failed"}), 500
 
+@app.route('/api/stream/<filename>')
+def stream_audio(filename):
+    """Serve audio while it renders, with Range support for seeking"""
+    audio_generator = components.get("audio_generator")
+    if audio_generator.store.path_for_name(filename) is None:
+        return jsonify({"error": "Audio file not found"}), 404
+    
+    stream = audio_generator.streams.get(filename)
+    file_path = audio_generator.store.resolve(filename)
+    
+    # Finished renders are plain files; send_file answers Range with 206
+    if stream is None or (stream.finished and file_path):
+        if not file_path:
+            return jsonify({"error": "Audio file not found"}), 404
+        return send_file(file_path, mimetype="audio/mpeg", conditional=True)
+    
+    if stream.failed:
+        return jsonify({"error": "Audio generation failed."}), 500
+    
+    byte_range = request.range
+    ranges = byte_range.ranges if byte_range is not None and byte_range.units == "bytes" else []
+    
+    # No range (or "bytes=0-"): chunked transfer of segments as they render
+    if len(ranges) != 1 or ranges[0] == (0, None):
+        return Response(
+            stream.iter_bytes(),
+            mimetype="audio/mpeg",
+            headers={"Accept-Ranges": "bytes", "Cache-Control": "no-cache"}
+        )
+    
+    start, stop = ranges[0]
+    if start < 0:
+        # Suffix ranges need the final length
+        stream.wait_for(float("inf"), Config.STREAM_WAIT_TIMEOUT)
+        start = max(stream.size + start, 0)
+        stop = None
+    
+    stream.wait_for(start + 1, Config.STREAM_WAIT_TIMEOUT)
+    if start >= stream.size:
+        total = str(stream.size) if stream.finished else "*"
+        return Response(status=416, headers={"Content-Range": f"bytes */{total}"})
+    
+    data = stream.read(start, stop)
+    total = str(stream.size) if stream.finished else "*"
+    return Response(
+        data,
+        status=206,
+        mimetype="audio/mpeg",
+        headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{start + len(data) - 1}/{total}",
+            "Cache-Control": "no-cache"
+        }
+    )
+
 @app.route('/api/demo-topics')
 def get_demo_topics():
     """Get list of demo topics"""
@@ -0,0 +1,246 @@
+"""Async (ASGI) serving mode for the SynthScholar API
+
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+    python asgi.py
+
+Podcast jobs run as coroutines on the server's event loop (AsyncJobQueue +
+AsyncPodcastPipeline) instead of one worker thread each, and job event
+streams are served natively, so an idle SSE listener holds no thread.
+Every other route is the unchanged Flask app, run through a small
+WSGI bridge on a bounded thread pool.
+"""
+import re
+import sys
+import json
+import asyncio
+import logging
+import threading
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+import app as web_app
+from config import Config
+from utils import metrics
+from utils.async_pipeline import AsyncPodcastPipeline
+from utils.job_queue import AsyncJobQueue
+
+logger = logging.getLogger(__name__)
+
+JOB_EVENTS_PATH = re.compile(r'^/api/jobs/([^/]+)/events$')
+
+def build_environ(scope, body):
+    """PEP 3333 environ for an ASGI HTTP scope"""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+        elif name != "CONTENT_LENGTH":
+            key = f"HTTP_{name}"
+            environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+async def read_body(receive):
+    body = []
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return None
+        body.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(body)
+
+async def watch_disconnect(receive, disconnected):
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            disconnected.set()
+            return
+
+class WSGIBridge:
+    """Runs a WSGI app for ASGI requests on a bounded thread pool
+
+    Body chunks are handed to the event loop one at a time, so a slow
+    client throttles a streaming response instead of buffering it.
+    """
+
+    def __init__(self, wsgi_app, max_threads=None):
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_threads or Config.ASGI_WSGI_THREADS,
+            thread_name_prefix="synthscholar-wsgi"
+        )
+
+    async def __call__(self, scope, receive, send):
+        body = await read_body(receive)
+        if body is None:
+            return
+        loop = asyncio.get_running_loop()
+        disconnected = threading.Event()
+        watcher = loop.create_task(watch_disconnect(receive, disconnected))
+        try:
+            await loop.run_in_executor(
+                self.executor, self._run, build_environ(scope, body), send, loop, disconnected
+            )
+        finally:
+            watcher.cancel()
+
+    def _run(self, environ, send, loop, disconnected):
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            if exc_info and response.get("sent"):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers
+            ]
+
+        def emit(message):
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        def send_start():
+            if not response.get("sent"):
+                response["sent"] = True
+                emit({"type": "http.response.start", "status": response["status"], "headers": response["headers"]})
+
+        iterable = self.wsgi_app(environ, start_response)
+        try:
+            for chunk in iterable:
+                if disconnected.is_set():
+                    return
+                if chunk:
+                    send_start()
+                    emit({"type": "http.response.body", "body": chunk, "more_body": True})
+            send_start()
+            emit({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            if hasattr(iterable, "close"):
+                iterable.close()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+class AsyncServer:
+    """ASGI application: native job event streams, Flask for everything else"""
+
+    def __init__(self, flask_app):
+        self.bridge = WSGIBridge(flask_app)
+        self.job_queue = None
+        self.pipeline = None
+        self._lock = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        self.start(asyncio.get_running_loop())
+        match = JOB_EVENTS_PATH.match(scope["path"])
+        if match and scope["method"] == "GET":
+            job = self.job_queue.get(match.group(1))
+            if job is not None:
+                await self.job_events(job, scope, receive, send)
+                return
+        await self.bridge(scope, receive, send)
+
+    def start(self, loop):
+        """Swap the app's thread-pool job queue for coroutine jobs on this loop"""
+        with self._lock:
+            if self.job_queue is not None:
+                return
+            self.job_queue = AsyncJobQueue(loop)
+            components = web_app.components
+            self.pipeline = AsyncPodcastPipeline(
+                components.get("comet_automation"),
+                components.get("content_synthesizer"),
+                components.get("audio_generator")
+            )
+            web_app.job_queue.shutdown(wait=False)
+            # Routes look these up at call time, so they now schedule coroutine jobs
+            web_app.job_queue = self.job_queue
+            components.set("podcast_pipeline", self.pipeline)
+            metrics.watch_job_queue(self.job_queue)
+            logger.info("✅ Async job queue running on the event loop")
+
+    async def stop(self):
+        if self.job_queue is not None:
+            await self.job_queue.drain()
+            self.pipeline.close()
+        self.bridge.close()
+        synthesizer = web_app.components.peek("content_synthesizer")
+        if synthesizer is not None:
+            await synthesizer.aclose()
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.start(asyncio.get_running_loop())
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.stop()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def job_events(self, job, scope, receive, send):
+        """Server-Sent Events for a job, same wire format as the Flask route"""
+        headers = dict(scope.get("headers", []))
+        last_event_id = headers.get(b"last-event-id", b"").decode("latin-1")
+        start = int(last_event_id) + 1 if last_event_id.isdigit() else 0
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream; charset=utf-8"),
+                (b"cache-control", b"no-cache"),
+            ],
+        })
+        disconnected = threading.Event()
+        watcher = asyncio.get_running_loop().create_task(watch_disconnect(receive, disconnected))
+        try:
+            async for index, event, data in job.aiter_events(start, timeout=Config.SSE_KEEPALIVE):
+                if disconnected.is_set():
+                    return
+                if event is None:
+                    chunk = ": keep-alive\n\n"
+                else:
+                    chunk = f"id: {index}\nevent: {event}\ndata: {json.dumps(data)}\n\n"
+                await send({"type": "http.response.body", "body": chunk.encode("utf-8"), "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            watcher.cancel()
+
+application = AsyncServer(web_app.app)
+
+if __name__ == '__main__':
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ The async server needs uvicorn: pip install uvicorn")
+        sys.exit(1)
+    print("🚀 Starting SynthScholar async server...")
+    print("📍 Access at: http://localhost:5000")
+    uvicorn.run(application, host='0.0.0.0', port=5000)
@@ -0,0 +1,48 @@
+"""Generate podcasts for a list of topics without going through HTTP
+
+    python batch_research.py topics.txt --manifest catalog.json
+
+Topics are read one per line; blank lines and lines starting with # are
+ignored. Running again with the same manifest skips finished topics.
+"""
+import sys
+import json
+import argparse
+from app import job_queue, podcast_pipeline, submit_research_job
+from utils.batch import BatchRunner
+
+def read_topics(path):
+    with open(path) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("topics", nargs="?", help="file with one topic per line")
+    parser.add_argument("--manifest", required=True, help="manifest JSON to write (and resume from)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="topics queued at once")
+    args = parser.parse_args(argv)
+
+    topics = read_topics(args.topics) if args.topics else []
+    runner = BatchRunner(
+        job_queue,
+        podcast_pipeline.run,
+        args.manifest,
+        submit=lambda topic: submit_research_job(topic)[:2],
+        max_in_flight=args.max_in_flight
+    )
+    try:
+        manifest = runner.run(topics)
+    except KeyboardInterrupt:
+        # Cancels the batch's queued and running jobs; run() is no longer there to do it
+        runner.cancel()
+        print("🛑 Interrupted; finished topics are kept in the manifest", file=sys.stderr)
+        return 1
+    finally:
+        # Drops jobs that never started; cancelled running jobs stop at their next stage check
+        job_queue.shutdown(wait=False)
+
+    print(json.dumps(manifest["summary"], indent=2))
+    return 0 if manifest["summary"].get("failed", 0) == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
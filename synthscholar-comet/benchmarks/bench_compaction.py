@@ -0,0 +1,90 @@
+"""Prompt size and cost of research compaction before synthesis.
+
+Builds five-section research the way the COMET scraper returns it when the
+main-area fallback wins: each section repeats the earlier answers of the
+conversation (lightly reworded) before its own. Reports estimated prompt
+tokens without compaction, after deduplication alone and after the token
+budget, plus how long compaction takes.
+
+    python benchmarks/bench_compaction.py --paragraphs 4 8 16 --budget 2500
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compaction import compact_research, estimate_tokens
+
+SECTIONS = 5
+
+def paragraph(rng, vocabulary, words=70):
+    return " ".join(rng.choice(vocabulary) for _ in range(words)) + "."
+
+def reword(text, rng):
+    words = text.split()
+    words[rng.randrange(len(words))] = "reworded"
+    return " ".join(words)
+
+def build_research(paragraphs, fallback, rng):
+    vocabulary = [f"term{i}" for i in range(5000)]
+    history = []
+    research_data = []
+    for i in range(SECTIONS):
+        own = [paragraph(rng, vocabulary) for _ in range(paragraphs)]
+        repeated = [reword(text, rng) for text in history] if fallback else []
+        research_data.append({"sub_query": f"sub-query {i + 1}", "content": "\n\n".join(repeated + own)})
+        history.extend(own)
+    return research_data
+
+def tokens(research_data):
+    return sum(estimate_tokens(item["content"]) for item in research_data)
+
+def run(paragraphs, fallback, budget, repeat, rng):
+    research_data = build_research(paragraphs, fallback, rng)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compacted = compact_research(research_data, token_budget=budget)
+        best = min(best, time.perf_counter() - started)
+    return {
+        "paragraphs": paragraphs,
+        "fallback": fallback,
+        "raw_tokens": tokens(research_data),
+        "dedup_tokens": tokens(compact_research(research_data, token_budget=0)),
+        "compacted_tokens": tokens(compacted),
+        "compact_ms": round(best * 1000, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", nargs="+", type=int, default=[4, 8, 16], help="new paragraphs per section")
+    parser.add_argument("--budget", type=int, default=2500, help="research token budget")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per case; the best is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = [
+        run(paragraphs, fallback, args.budget, args.repeat, rng)
+        for paragraphs in args.paragraphs for fallback in (False, True)
+    ]
+
+    print(f"{'paragraphs':>11}{'fallback':>10}{'raw':>9}{'dedup':>9}{'budget':>9}{'saved':>8}{'ms':>8}")
+    for r in results:
+        saved = 1 - r["compacted_tokens"] / r["raw_tokens"]
+        print(
+            f"{r['paragraphs']:>11}{str(r['fallback']):>10}{r['raw_tokens']:>9}{r['dedup_tokens']:>9}"
+            f"{r['compacted_tokens']:>9}{saved:>8.0%}{r['compact_ms']:>8}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Check answer completion detection against the streaming COMET fixture.
+
+Drives headless Chrome on fixtures/comet_stub.html with several streaming
+profiles and reports, per profile, how long after the last streamed chunk
+the answer was returned and whether its text and source links were complete. Needs Chrome and a
+chromedriver, but no network access.
+
+    python benchmarks/bench_completion.py --stable 0.5 1.5 --runs 3
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import Config
+
+FIXTURE = os.path.join(ROOT, "fixtures", "comet_stub.html")
+
+# name -> fixture query parameters
+PROFILES = {
+    "fast": {"delay": 100, "interval": 5},
+    "steady": {"delay": 500, "interval": 20, "words": 300, "sources": 5},
+    "chunked": {"delay": 300, "interval": 150, "chunk": 12, "words": 400},
+    "stall": {"delay": 300, "interval": 20, "words": 200, "stall_at": 80, "stall": 1000},
+    "slow-start": {"delay": 4000, "interval": 20},
+}
+
+def fixture_url(params):
+    return f"file://{FIXTURE}?{urlencode(params)}"
+
+def run_once(automation, driver, params, query):
+    driver.get(fixture_url(params))
+    automation.detector.wait_for_quiet(driver)
+    search_box = driver.find_element("xpath", "//textarea")
+
+    started = time.perf_counter()
+    answer = automation._submit_and_wait(driver, search_box, query)
+    elapsed = time.perf_counter() - started
+
+    record = driver.execute_script("return window.fixtureAnswers[window.fixtureAnswers.length - 1]")
+    returned_at = driver.execute_script("return performance.now()")
+    complete = (
+        bool(answer) and record["finishedAt"] is not None
+        and answer["text"] == record["text"]
+        and [link["url"] for link in answer["links"]] == record["links"]
+    )
+    # Negative when the answer was returned before the page finished streaming
+    overshoot = (returned_at - record["finishedAt"]) / 1000.0 if record["finishedAt"] else None
+    return elapsed, overshoot, complete
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES), choices=PROFILES)
+    parser.add_argument("--stable", nargs="+", type=float, default=[Config.RESEARCH_STABLE_SECONDS],
+                        help="stability windows to try, in seconds")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    from comet_automation import CometAutomation
+    from utils.completion import CompletionDetector
+
+    Config.DEMO_MODE = False  # headless
+    automation = CometAutomation()
+    driver = automation._create_driver()
+
+    results = []
+    try:
+        for stable in args.stable:
+            automation.detector = CompletionDetector(stable_seconds=stable)
+            for profile in args.profiles:
+                elapsed, overshoot, complete = [], [], 0
+                for run_index in range(args.runs):
+                    seconds, late, ok = run_once(automation, driver, PROFILES[profile], f"{profile} query {run_index}")
+                    elapsed.append(seconds)
+                    if late is not None:
+                        overshoot.append(late)
+                    complete += ok
+                results.append({
+                    "stable_s": stable,
+                    "profile": profile,
+                    "wait_median_s": round(statistics.median(elapsed), 3),
+                    "after_last_chunk_median_s": round(statistics.median(overshoot), 3) if overshoot else None,
+                    "complete": f"{complete}/{args.runs}",
+                })
+    finally:
+        driver.quit()
+
+    print(f"{'stable':>7} {'profile':<12} {'wait':>9} {'after end':>10} {'complete':>9}")
+    for result in results:
+        after = result["after_last_chunk_median_s"]
+        print(f"{result['stable_s']:>6.2f}s {result['profile']:<12} {result['wait_median_s']:>8.3f}s "
+              f"{after if after is not None else float('nan'):>9.3f}s {result['complete']:>9}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
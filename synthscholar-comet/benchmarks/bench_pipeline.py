@@ -0,0 +1,135 @@
+"""Compare sequential, streaming and pipelined podcast generation with mock backends.
+
+Runs fully offline: research sections, script fragments and TTS chunks are
+produced by mocks with configurable latencies.
+
+    python benchmarks/bench_pipeline.py --runs 3 --research-delay 0.3
+"""
+import os
+import sys
+import time
+import json
+import argparse
+import tempfile
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_comet_automation import MockCometAutomation
+from utils.audio_generator import AudioGenerator
+from utils.audio_store import AudioStore
+from utils.content_synthesizer import ContentSynthesizer
+from utils.job_queue import Job
+from utils.podcast_pipeline import PodcastPipeline, PIPELINE_MODES
+from utils.sub_queries import build_sub_queries
+from utils.tts_engines import StubTTSEngine
+
+class SlowMockResearch(MockCometAutomation):
+    """Mock research returning one section per sub-query, each after a delay"""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+
+    def iter_research(self, topic, cancel_event=None):
+        generic = self._lookup_topic(topic)[0]["content"]
+        for query in build_sub_queries(topic):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            time.sleep(self.delay)
+            yield {"sub_query": query, "content": generic}
+
+    def research_topic(self, topic):
+        return list(self.iter_research(topic))
+
+class SlowMockSynthesizer(ContentSynthesizer):
+    """Mock synthesis that spends fragment_delay per emitted word"""
+
+    def __init__(self, fragment_delay):
+        super().__init__()
+        self.api_key = ""
+        self.fragment_delay = fragment_delay
+
+    def create_podcast_script(self, topic, research_data):
+        script = self._mock_synthesize(topic, research_data)
+        time.sleep(self.fragment_delay * len(list(self._stream_text(script))))
+        return script
+
+    def _stream_text(self, text):
+        for fragment in super()._stream_text(text):
+            if self.fragment_delay:
+                time.sleep(self.fragment_delay)
+            yield fragment
+
+def run_once(mode, args, audio, run_index):
+    pipeline = PodcastPipeline(
+        SlowMockResearch(args.research_delay),
+        SlowMockSynthesizer(args.fragment_delay),
+        audio,
+        mode=mode
+    )
+    # A fresh topic per run keeps the audio store from serving cached renders
+    job = Job(f"benchmark topic {mode} {run_index}")
+    first_audio = {}
+    started = time.perf_counter()
+
+    def watch_first_audio():
+        while not job.done:
+            url = job.details.get("stream_url")
+            stream = audio.streams.get(url.rsplit("/", 1)[-1]) if url else None
+            if stream is not None:
+                stream.wait_for(1, timeout=60)
+                first_audio["seconds"] = time.perf_counter() - started
+                return
+            time.sleep(0.005)
+
+    watcher = threading.Thread(target=watch_first_audio, daemon=True)
+    watcher.start()
+    result = pipeline.run(job)
+    total = time.perf_counter() - started
+    job._finish("completed", result=result)
+    watcher.join(timeout=1)
+    return total, first_audio.get("seconds", total)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--research-delay", type=float, default=0.3, help="seconds per research section")
+    parser.add_argument("--fragment-delay", type=float, default=0.002, help="seconds per script word")
+    parser.add_argument("--tts-latency", type=float, default=0.15, help="seconds per TTS chunk")
+    parser.add_argument("--modes", nargs="+", default=list(PIPELINE_MODES), choices=PIPELINE_MODES)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as audio_dir:
+        audio = AudioGenerator(
+            store=AudioStore(root=audio_dir, max_bytes=0),
+            engine=StubTTSEngine(latency=args.tts_latency)
+        )
+
+        results = {}
+        for mode in args.modes:
+            totals, firsts = [], []
+            for run_index in range(args.runs):
+                total, first = run_once(mode, args, audio, run_index)
+                totals.append(total)
+                firsts.append(first)
+            results[mode] = {
+                "end_to_end_median_s": round(statistics.median(totals), 3),
+                "first_audio_median_s": round(statistics.median(firsts), 3),
+                "runs": args.runs,
+            }
+
+    baseline = results.get("sequential")
+    print(f"{'mode':<12} {'end-to-end':>12} {'first audio':>12} {'speedup':>9}")
+    for mode, stats in results.items():
+        speedup = baseline["end_to_end_median_s"] / stats["end_to_end_median_s"] if baseline else 1.0
+        print(f"{mode:<12} {stats['end_to_end_median_s']:>11.3f}s {stats['first_audio_median_s']:>11.3f}s {speedup:>8.2f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Cold start of the Flask app: import time and time to the first answered request.
+
+Each run is a fresh interpreter started with `python -X importtime`, so
+nothing is shared between runs. Reports the cumulative import time of
+app.py, the slowest modules it pulls in, whether the heavy backends
+(selenium, openai, webdriver_manager) were imported at all, and how long
+the first /health, the first POST /api/research and the first finished
+podcast (stub TTS, mock research) take.
+
+    python benchmarks/bench_startup.py --runs 5
+    PREWARM_COMPONENTS=all python benchmarks/bench_startup.py
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("selenium", "openai", "webdriver_manager", "gtts")
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+# Runs in the child interpreter; prints one JSON line with its timings. The
+# heavy packages loaded by the import alone are recorded before any request.
+CHILD = r"""
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+heavy_at_import = sorted(name for name in %r if name in sys.modules)
+client = app.app.test_client()
+client.get("/health")
+health = time.perf_counter()
+response = client.post("/api/research", json={"topic": "Artificial Intelligence"})
+research = time.perf_counter()
+app.job_queue.get(response.get_json()["job_id"]).future.result()
+podcast = time.perf_counter()
+print("\n" + json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "first_health_ms": (health - imported) * 1000,
+    "first_research_ms": (research - health) * 1000,
+    "first_podcast_ms": (podcast - health) * 1000,
+    "research_status": response.status_code,
+    "heavy_after_import": heavy_at_import,
+}), flush=True)
+"""
+
+def run_once(env):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD % (HEAVY_MODULES,)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    # Research output is printed on the same stream, so pick out the timings line
+    timings = json.loads(next(line for line in result.stdout.splitlines() if line.startswith('{"import_ms"')))
+    modules = {}
+    app_total = None
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        modules[name] = cumulative_us
+        if name == "app" and len(indent) == 1:
+            app_total = cumulative_us
+    timings["app_importtime_ms"] = app_total / 1000 if app_total is not None else None
+    return timings, modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("TTS_ENGINE", "stub")
+    env.setdefault("AUDIO_DIR", tempfile.mkdtemp(prefix="synthscholar_bench_"))
+
+    runs = []
+    modules = {}
+    for _ in range(args.runs):
+        timings, run_modules = run_once(env)
+        runs.append(timings)
+        for name, cumulative_us in run_modules.items():
+            modules.setdefault(name, []).append(cumulative_us)
+
+    summary = {}
+    for key in ("app_importtime_ms", "import_ms", "first_health_ms", "first_research_ms", "first_podcast_ms"):
+        values = [run[key] for run in runs if run[key] is not None]
+        summary[key] = round(statistics.median(values), 1) if values else None
+    summary["heavy_after_import"] = runs[-1]["heavy_after_import"]
+    summary["heavy_after_request"] = sorted(name for name in HEAVY_MODULES if name in modules)
+    summary["research_status"] = runs[-1]["research_status"]
+
+    slowest = sorted(
+        ((name, statistics.median(values) / 1000) for name, values in modules.items() if "." not in name),
+        key=lambda item: item[1], reverse=True
+    )[:args.top]
+
+    print(f"runs: {args.runs}  PREWARM_COMPONENTS={env.get('PREWARM_COMPONENTS', '')!r}")
+    for key in ("app_importtime_ms", "import_ms", "first_health_ms", "first_research_ms", "first_podcast_ms"):
+        print(f"  {key:<20}{summary[key]:>10}")
+    print(f"  heavy packages after import:  {', '.join(summary['heavy_after_import']) or '-'}")
+    print(f"  heavy packages after request: {', '.join(summary['heavy_after_request']) or '-'}")
+    print("slowest top-level imports (cumulative ms):")
+    for name, ms in slowest:
+        print(f"  {name:<28}{ms:>8.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "summary": summary, "runs": runs}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
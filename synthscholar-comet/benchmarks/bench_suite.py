@@ -0,0 +1,281 @@
+"""Throughput, tail latency and memory of the podcast pipeline at several concurrency levels.
+
+Runs fully offline: research comes from MockCometAutomation (with an
+optional per-section delay), the LLM is the local fake OpenAI server and
+audio is rendered by the stub TTS engine.
+
+    python benchmarks/bench_suite.py --concurrency 1 4 16 --script-words 300 1500 --json run.json
+    python benchmarks/bench_suite.py --json new.json --compare run.json
+
+Targets:
+    app         POST /api/research through the Flask app and poll the job
+    components  PodcastPipeline.run() called directly, no HTTP or job queue
+"""
+import io
+import os
+import sys
+import json
+import math
+import time
+import uuid
+import logging
+import argparse
+import platform
+import resource
+import tempfile
+import threading
+import contextlib
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import Config
+from fake_openai_server import SCRIPT, create_server
+from utils.podcast_pipeline import PIPELINE_MODES
+
+TARGETS = ("app", "components")
+
+BASE_TOPICS = ("Artificial Intelligence", "Climate Change Solutions", "Quantum Computing", "Biotechnology")
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def current_rss_mb():
+    """Resident set size from /proc; falls back to the process peak elsewhere"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024.0
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+class RSSSampler:
+    """Background thread tracking the highest RSS seen while it runs"""
+
+    def __init__(self, interval=0.02):
+        self.interval = interval
+        self.peak = current_rss_mb()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_mb())
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss_mb())
+
+def configure(args, llm_url):
+    """Point Config at the offline backends before the app modules are imported"""
+    Config.DEMO_MODE = True
+    Config.OPENAI_API_KEY = "bench"
+    Config.OPENAI_BASE_URL = llm_url
+    Config.LLM_RATE_PER_SECOND = args.llm_rate
+    Config.TTS_ENGINE = "stub"
+    Config.AUDIO_DIR = tempfile.mkdtemp(prefix="synthscholar_bench_")
+    Config.RESEARCH_CACHE_PATH = ""
+    Config.SYNTHESIS_CACHE_PATH = ""
+
+def build_app(args):
+    from bench_pipeline import SlowMockResearch
+    from utils.tts_engines import StubTTSEngine
+    import app
+
+    app.audio_generator.engine = StubTTSEngine(latency=args.tts_latency)
+    # Registered before the pipeline is built, so it picks up the slow research
+    app.components.set("comet_automation", SlowMockResearch(args.research_delay))
+    return app
+
+def unique_topic():
+    # Unique topics keep every cache cold, so each request does the full work
+    base = BASE_TOPICS[uuid.uuid4().int % len(BASE_TOPICS)]
+    return f"{base} {uuid.uuid4().hex[:8]}"
+
+def make_app_request(app, client, poll_interval):
+    def request():
+        response = client.post("/api/research", json={"topic": unique_topic()})
+        if response.status_code != 202:
+            return False
+        status_url = response.get_json()["status_url"]
+        while True:
+            job = client.get(status_url).get_json()
+            if job["status"] in ("completed", "failed", "cancelled"):
+                return job["status"] == "completed"
+            time.sleep(poll_interval)
+    return request
+
+def make_component_request(app):
+    from utils.job_queue import Job
+
+    def request():
+        result = app.podcast_pipeline.run(Job(unique_topic()))
+        return bool(result and result.get("success"))
+    return request
+
+def run_level(app, target, mode, concurrency, script_words, args, llm_server):
+    from utils.job_queue import JobQueue
+
+    llm_server.repeat = max(1, round(script_words / len(SCRIPT.split(" "))))
+    app.podcast_pipeline.mode = mode
+    app.job_queue = JobQueue(max_workers=concurrency, max_pending=concurrency * 2)
+    if target == "app":
+        request = make_app_request(app, app.app.test_client(), args.poll_interval)
+    else:
+        request = make_component_request(app)
+
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def timed_request(_):
+        nonlocal errors
+        started = time.perf_counter()
+        try:
+            ok = request()
+        except Exception:
+            ok = False
+        elapsed = time.perf_counter() - started
+        with lock:
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    total = max(args.requests, concurrency)
+    rss_start = current_rss_mb()
+    with RSSSampler() as sampler, contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(timed_request, range(total)))
+        duration = time.perf_counter() - started
+    app.job_queue.shutdown()
+
+    latencies.sort()
+    return {
+        "target": target,
+        "mode": mode,
+        "concurrency": concurrency,
+        "script_words": script_words,
+        "requests": total,
+        "errors": errors,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(latencies) / duration, 3) if duration else 0.0,
+        "latency_ms": {
+            name: round(value * 1000, 1) if value is not None else None
+            for name, value in (
+                ("p50", percentile(latencies, 50)),
+                ("p95", percentile(latencies, 95)),
+                ("p99", percentile(latencies, 99)),
+                ("max", latencies[-1] if latencies else None),
+            )
+        },
+        "rss_start_mb": round(rss_start, 1),
+        "rss_peak_mb": round(sampler.peak, 1),
+    }
+
+def result_key(result):
+    return (result["target"], result["mode"], result["concurrency"], result["script_words"])
+
+def print_results(results, baseline=None):
+    baseline = {result_key(result): result for result in (baseline or [])}
+    header = f"{'target':<11}{'mode':<11}{'conc':>5}{'words':>7}{'rps':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'peak MB':>9}{'err':>5}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        latency = result["latency_ms"]
+        print(
+            f"{result['target']:<11}{result['mode']:<11}{result['concurrency']:>5}{result['script_words']:>7}"
+            f"{result['throughput_rps']:>9.2f}{latency['p50'] or 0:>9.0f}{latency['p95'] or 0:>9.0f}"
+            f"{latency['p99'] or 0:>9.0f}{result['rss_peak_mb']:>9.1f}{result['errors']:>5}"
+        )
+        before = baseline.get(result_key(result))
+        if before:
+            print(f"{'':<34}vs baseline: rps {_delta(before['throughput_rps'], result['throughput_rps'])}, "
+                  f"p95 {_delta(before['latency_ms']['p95'], latency['p95'])}, "
+                  f"peak RSS {_delta(before['rss_peak_mb'], result['rss_peak_mb'])}")
+
+def _delta(before, after):
+    if not before or after is None:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=TARGETS)
+    parser.add_argument("--modes", nargs="+", default=["sequential"], choices=PIPELINE_MODES)
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 16])
+    parser.add_argument("--script-words", nargs="+", type=int, default=[300, 1500])
+    parser.add_argument("--requests", type=int, default=16, help="requests per level (at least the concurrency)")
+    parser.add_argument("--research-delay", type=float, default=0.05, help="seconds per research section")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="seconds before each LLM response")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="seconds between streamed LLM words")
+    parser.add_argument("--llm-rate", type=float, default=0, help="client rate limit in req/s (0 = unlimited)")
+    parser.add_argument("--tts-latency", type=float, default=0.05, help="seconds per TTS chunk")
+    parser.add_argument("--poll-interval", type=float, default=0.02, help="job status poll interval")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    args = parser.parse_args()
+
+    llm_server = create_server(latency=args.llm_latency, token_delay=args.token_delay)
+    threading.Thread(target=llm_server.serve_forever, daemon=True).start()
+    configure(args, f"http://127.0.0.1:{llm_server.server_address[1]}/v1")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = build_app(args)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = []
+    for target in args.targets:
+        for mode in args.modes:
+            for script_words in args.script_words:
+                for concurrency in args.concurrency:
+                    results.append(run_level(app, target, mode, concurrency, script_words, args, llm_server))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "meta": {
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "revision": git_revision(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                    "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+                    "args": vars(args),
+                },
+                "results": results
+            }, f, indent=2)
+        print(f"\nSaved results to {args.json}")
+
+    llm_server.shutdown()
+
+if __name__ == "__main__":
+    main()
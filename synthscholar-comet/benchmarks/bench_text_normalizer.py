@@ -0,0 +1,137 @@
+"""Speed of TTS script cleanup: TextNormalizer against the old regex chain.
+
+Builds podcast scripts in the mock synthesizer's format (emoji, stage
+directions, bullets, speaker labels, numbers) at several sizes and times
+cleaning plus chunking with each implementation, plus the streaming path,
+which cleans the script one sentence at a time as the LLM produces it.
+
+    python benchmarks/bench_text_normalizer.py --sizes 10 100 1000
+"""
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.text_normalizer import TextNormalizer, chunk_segments
+
+CHUNK_CHARS = 400
+
+SENTENCES = [
+    "Researchers reported a 12.5% improvement across 1,200 participants.",
+    "The **main** finding held in every cohort we looked at.",
+    "Costs fell by roughly 3.2 million dollars over two years.",
+    "Critics point to open questions about long-term effects.",
+    "New trials are planned for 2025, with results expected soon.",
+]
+
+BULLETS = ["Implementation complexity", "Need for regulatory frameworks", "Ethical trade-offs"]
+
+def build_script(sections, rng):
+    parts = ["\n🎙️ WELCOME TO SYNTHSCHOLAR PODCAST\nTopic: benchmarks\n\n[Upbeat intro music fades in]\n"]
+    for i in range(1, sections + 1):
+        body = " ".join(rng.sample(SENTENCES, 3))
+        bullets = "\n".join(f"• {point} 📊" for point in rng.sample(BULLETS, 2))
+        parts.append(f"RESEARCH AREA {i}: area {i}\nHOST: \"{body}\"\n\n{bullets}\n\n[Music fades out]\n")
+    parts.append("CONCLUSION:\nHOST: \"Until then, keep learning and stay curious!\"\n")
+    return "\n".join(parts)
+
+# Roughly how the LLM stream is cut into sentences before they are cleaned
+STREAM_SENTENCE = re.compile(r'(?<=[.!?])\s+|\n+')
+
+# The cleanup and chunking AudioGenerator used before TextNormalizer
+LEGACY_SPEAKER_BOUNDARY = re.compile(r'\n\s*\n|(?=\b(?:HOST|CONCLUSION):)')
+LEGACY_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+def legacy_clean(text):
+    import re
+    clean_text = re.sub(r'[*#`]', '', text)
+    clean_text = re.sub(r'\n+', '\n', clean_text)
+    clean_text = re.sub(r'\.(?=\w)', '. ', clean_text)
+    clean_text = re.sub(r'\[.*?\]', '', clean_text)
+    clean_text = re.sub(r'RESEARCH AREA \d+:', '', clean_text)
+    clean_text = clean_text.replace('HOST:', '\n\nHOST:')
+    clean_text = clean_text.replace('CONCLUSION:', '\n\nCONCLUSION:')
+    return clean_text.strip()
+
+def legacy_chunks(text, max_chars):
+    chunks = []
+    for block in LEGACY_SPEAKER_BOUNDARY.split(text):
+        current = ""
+        for sentence in LEGACY_SENTENCE_BOUNDARY.split(block):
+            sentence = " ".join(sentence.split())
+            if not sentence:
+                continue
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+    return chunks
+
+def best_of(fn, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def run(sections, repeat, rng):
+    script = build_script(sections, rng)
+    sentences = [sentence for sentence in STREAM_SENTENCE.split(script) if sentence.strip()]
+    normalizer = TextNormalizer()
+    timings = {
+        "legacy_clean": best_of(legacy_clean, script, repeat),
+        "normalizer_clean": best_of(normalizer.clean, script, repeat),
+        "legacy_clean_chunk": best_of(lambda text: legacy_chunks(legacy_clean(text), CHUNK_CHARS), script, repeat),
+        "normalizer_clean_chunk": best_of(
+            lambda text: chunk_segments(normalizer.normalize(text).segments, CHUNK_CHARS), script, repeat
+        ),
+        "legacy_stream": best_of(lambda parts: [legacy_clean(part) for part in parts], sentences, repeat),
+        "normalizer_stream": best_of(lambda parts: [normalizer.clean(part) for part in parts], sentences, repeat),
+    }
+    result = {"sections": sections, "chars": len(script)}
+    for name, seconds in timings.items():
+        result[f"{name}_ms"] = round(seconds * 1000, 3)
+    result["clean_speedup"] = round(timings["legacy_clean"] / timings["normalizer_clean"], 2)
+    result["chunk_speedup"] = round(timings["legacy_clean_chunk"] / timings["normalizer_clean_chunk"], 2)
+    result["stream_speedup"] = round(timings["legacy_stream"] / timings["normalizer_stream"], 2)
+    # Emoji and bullet glyphs the legacy chain leaves in the spoken text
+    cleaned = legacy_clean(script)
+    result["legacy_leftover_symbols"] = sum(cleaned.count(symbol) for symbol in ("🎙", "📊", "•"))
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[5, 30, 100, 1000], help="research sections per script")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per size; the best is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = [run(size, args.repeat, rng) for size in args.sizes]
+
+    print(f"{'sections':>9}{'chars':>10}{'legacy ms':>11}{'new ms':>9}{'x':>7}"
+          f"{'+chunk legacy':>15}{'+chunk new':>12}{'x':>7}{'stream legacy':>15}{'stream new':>12}{'x':>7}{'leftover':>10}")
+    for r in results:
+        print(
+            f"{r['sections']:>9}{r['chars']:>10}{r['legacy_clean_ms']:>11}{r['normalizer_clean_ms']:>9}"
+            f"{r['clean_speedup']:>7}{r['legacy_clean_chunk_ms']:>15}{r['normalizer_clean_chunk_ms']:>12}"
+            f"{r['chunk_speedup']:>7}{r['legacy_stream_ms']:>15}{r['normalizer_stream_ms']:>12}"
+            f"{r['stream_speedup']:>7}{r['legacy_leftover_symbols']:>10}"
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
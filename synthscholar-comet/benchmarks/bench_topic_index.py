@@ -0,0 +1,121 @@
+"""Lookup latency of the mock research TopicIndex as the corpus grows.
+
+Builds synthetic corpora of N topics and times exact, alias and misspelled
+queries against the index and against the old linear substring scan.
+"right" is the share answered correctly: the queried topic, or nothing
+for topics that are not in the corpus.
+
+    python benchmarks/bench_topic_index.py --sizes 100 1000 10000
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.topic_index import TopicIndex
+
+WORDS = (
+    "adaptive", "agriculture", "algorithm", "antibiotic", "architecture", "battery", "biology",
+    "blockchain", "cancer", "carbon", "cell", "chemistry", "climate", "cloud", "cognitive",
+    "computing", "coral", "crypto", "cyber", "data", "desert", "design", "disease", "drone",
+    "ecology", "economics", "education", "energy", "engineering", "ethics", "finance", "fusion",
+    "gene", "genomics", "geology", "graphene", "health", "hydrogen", "immune", "infrastructure",
+    "language", "law", "learning", "logistics", "marine", "materials", "medicine", "memory",
+    "microbiome", "mining", "mobility", "nanotech", "network", "neuroscience", "nuclear", "ocean",
+    "optics", "policy", "privacy", "protein", "quantum", "robotics", "rocket", "satellite",
+    "security", "semiconductor", "sleep", "social", "soil", "solar", "space", "storage", "supply",
+    "therapy", "traffic", "urban", "vaccine", "virtual", "water", "wind", "wireless",
+)
+
+SECTIONS = [{"sub_query": "overview", "content": "Canned research."}]
+
+def build_corpus(size, rng):
+    names = set()
+    while len(names) < size:
+        names.add(" ".join(rng.sample(WORDS, rng.choice((2, 2, 3)))))
+    return sorted(names)
+
+def misspell(name, rng):
+    words = name.split()
+    index = rng.randrange(len(words))
+    word = words[index]
+    if len(word) > 4:
+        cut = rng.randrange(1, len(word) - 1)
+        words[index] = word[:cut] + word[cut + 1:]
+    return " ".join(words)
+
+def linear_lookup(corpus, query):
+    query = query.lower()
+    for name in corpus:
+        if name in query:
+            return name
+    return None
+
+def timed(fn, queries, expected):
+    latencies = []
+    right = 0
+    for query, answer in zip(queries, expected):
+        started = time.perf_counter()
+        result = fn(query)
+        latencies.append(time.perf_counter() - started)
+        right += 1 if result == answer else 0
+    latencies.sort()
+    return {
+        "p50_us": round(latencies[len(latencies) // 2] * 1e6, 1),
+        "p99_us": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e6, 1),
+        "right_rate": round(right / len(queries), 3),
+    }
+
+def run(size, queries_per_kind, rng):
+    corpus = build_corpus(size, rng)
+    index = TopicIndex()
+    started = time.perf_counter()
+    for name in corpus:
+        index.add(name, SECTIONS, aliases=[name.split()[0] + " studies"])
+    build_seconds = time.perf_counter() - started
+    index.search("warm up")
+
+    picks = [rng.choice(corpus) for _ in range(queries_per_kind)]
+    kinds = {
+        "exact": [f"latest research on {name}" for name in picks],
+        "misspelled": [misspell(name, rng) for name in picks],
+        "miss": [f"zzz unknown topic {i}" for i in range(queries_per_kind)],
+    }
+    result = {"size": size, "build_ms": round(build_seconds * 1000, 1)}
+    expected = {"exact": picks, "misspelled": picks, "miss": [None] * queries_per_kind}
+    for kind, queries in kinds.items():
+        result[f"index_{kind}"] = timed(lambda query: getattr(index.best_match(query), "topic", None), queries, expected[kind])
+        result[f"linear_{kind}"] = timed(lambda query: linear_lookup(corpus, query), queries, expected[kind])
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    parser.add_argument("--queries", type=int, default=500, help="queries per kind and size")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = [run(size, args.queries, rng) for size in args.sizes]
+
+    print(f"{'size':>7}{'build ms':>10}  {'kind':<11}{'index p50/p99 us':>20}{'right':>7}{'linear p50/p99 us':>21}{'right':>7}")
+    for result in results:
+        for kind in ("exact", "misspelled", "miss"):
+            index, linear = result[f"index_{kind}"], result[f"linear_{kind}"]
+            print(
+                f"{result['size']:>7}{result['build_ms']:>10}  {kind:<11}"
+                f"{index['p50_us']:>10}/{index['p99_us']:<9}{index['right_rate']:>7}"
+                f"{linear['p50_us']:>11}/{linear['p99_us']:<9}{linear['right_rate']:>7}"
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+if __name__ == "__main__":
+    main()
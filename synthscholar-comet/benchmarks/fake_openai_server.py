@@ -0,0 +1,121 @@
+"""Local OpenAI-compatible chat completions server for offline runs.
+
+Point the app at it with OPENAI_BASE_URL=http://127.0.0.1:8765/v1 and any
+non-empty OPENAI_API_KEY.
+
+    python benchmarks/fake_openai_server.py --port 8765 --latency 0.5 --fail-every 4
+"""
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCRIPT = (
+    'HOST: "Welcome to SynthScholar. Today we are looking at {topic}. '
+    'Researchers have found clear benefits, real challenges and a fast-moving field. '
+    'Let us walk through what the evidence says and what it means for you." '
+)
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            request_number = server.requests
+
+        if server.fail_every and request_number % server.fail_every == 0:
+            self._send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}})
+            return
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        prompt = body.get("messages", [{}])[-1].get("content", "")
+        topic = prompt.split("TOPIC:", 1)[-1].strip().splitlines()[0] if "TOPIC:" in prompt else "your topic"
+        words = (SCRIPT.format(topic=topic) * server.repeat).split(" ")
+
+        if body.get("stream"):
+            self._send_stream(body.get("model", "fake"), words)
+        else:
+            self._send_json(200, {
+                "id": f"chatcmpl-{request_number}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": " ".join(words)},
+                    "finish_reason": "stop"
+                }],
+                "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(words), "total_tokens": 0}
+            })
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, model, words):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send(payload):
+            data = f"data: {payload}\n\n".encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+
+        for index, word in enumerate(words):
+            chunk = {
+                "id": "chatcmpl-stream",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}]
+            }
+            send(json.dumps(chunk))
+            if self.server.token_delay:
+                time.sleep(self.server.token_delay)
+        send("[DONE]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+def create_server(port=0, latency=0.0, token_delay=0.0, fail_every=0, repeat=3):
+    """Build (but do not start) a fake server; port 0 picks a free port"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FakeOpenAIHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.token_delay = token_delay
+    server.fail_every = fail_every
+    server.repeat = repeat
+    server.requests = 0
+    server.lock = threading.Lock()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="seconds between streamed words")
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth request with 429")
+    parser.add_argument("--repeat", type=int, default=3, help="copies of the canned script per answer")
+    args = parser.parse_args()
+
+    server = create_server(args.port, args.latency, args.token_delay, args.fail_every, args.repeat)
+    print(f"Fake OpenAI server on http://127.0.0.1:{server.server_address[1]}/v1")
+    server.serve_forever()
+
+if __name__ == "__main__":
+    main()
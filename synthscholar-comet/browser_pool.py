@@ -0,0 +1,212 @@
+import os
+import time
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+def resolve_chromedriver_path():
+    """Resolve the chromedriver binary once and remember it across restarts"""
+    global _chromedriver_path
+
+    with _chromedriver_lock:
+        if _chromedriver_path and os.path.exists(_chromedriver_path):
+            return _chromedriver_path
+
+        # An explicitly configured driver always wins
+        if Config.CHROMEDRIVER_PATH and os.path.exists(Config.CHROMEDRIVER_PATH):
+            _chromedriver_path = Config.CHROMEDRIVER_PATH
+            return _chromedriver_path
+
+        # Path written by a previous process, skips webdriver_manager entirely
+        cache_file = Config.CHROMEDRIVER_CACHE_FILE
+        try:
+            with open(cache_file) as f:
+                cached_path = f.read().strip()
+            if cached_path and os.path.exists(cached_path):
+                _chromedriver_path = cached_path
+                logger.info(f"✅ Using cached chromedriver: {cached_path}")
+                return _chromedriver_path
+        except OSError:
+            pass
+
+        from webdriver_manager.chrome import ChromeDriverManager # pyright: ignore[reportMissingImports]
+        _chromedriver_path = ChromeDriverManager().install()
+
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w') as f:
+                f.write(_chromedriver_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache chromedriver path: {str(e)}")
+
+        return _chromedriver_path
+
+class BrowserPoolExhausted(Exception):
+    """Raised when no browser session becomes free before the lease timeout"""
+
+class _PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.time()
+
+class BrowserPool:
+    """Keeps warm, logged-in WebDriver sessions and leases them to research jobs"""
+
+    def __init__(self, driver_factory, size=None, max_uses=None, prepare=None, lease_timeout=None):
+        self.driver_factory = driver_factory
+        self.prepare = prepare
+        self.size = size or Config.BROWSER_POOL_SIZE
+        self.max_uses = max_uses or Config.BROWSER_MAX_USES
+        self.lease_timeout = lease_timeout or Config.BROWSER_LEASE_TIMEOUT
+
+        # LIFO keeps the most recently used sessions hot
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._total = 0
+        self._in_use = 0
+        self._closed = False
+        self.counters = {"created": 0, "recycled": 0, "leases": 0, "create_failures": 0}
+
+    def start(self, wait=False):
+        """Pre-warm sessions up to the pool size"""
+        threads = [
+            threading.Thread(target=self._warm_one, name="browser-pool-warmup", daemon=True)
+            for _ in range(self.size - self._total)
+        ]
+        for thread in threads:
+            thread.start()
+        if wait:
+            for thread in threads:
+                thread.join()
+        logger.info(f"🔥 Pre-warming {len(threads)} browser sessions")
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Borrow a healthy driver for the duration of the with-block"""
+        entry = self._acquire(timeout if timeout is not None else self.lease_timeout)
+        broken = False
+        try:
+            yield entry.driver
+        except WebDriverException:
+            broken = True
+            raise
+        finally:
+            entry.uses += 1
+            self._release(entry, broken)
+
+    def stats(self):
+        with self._lock:
+            return dict(
+                self.counters,
+                size=self.size,
+                total=self._total,
+                in_use=self._in_use,
+                idle=self._idle.qsize()
+            )
+
+    def close(self):
+        """Quit every idle session; leased ones are quit on release"""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._retire(entry, "pool closed")
+        logger.info("🔚 Browser pool closed")
+
+    def _warm_one(self):
+        entry = self._create_entry()
+        if entry is not None:
+            self._idle.put(entry)
+
+    def _create_entry(self):
+        """Start and prepare one session if the pool has a free slot"""
+        with self._lock:
+            if self._closed or self._total >= self.size:
+                return None
+            self._total += 1
+
+        try:
+            driver = self.driver_factory()
+            if self.prepare is not None:
+                self.prepare(driver)
+        except Exception as e:
+            with self._lock:
+                self._total -= 1
+                self.counters["create_failures"] += 1
+            logger.error(f"❌ Failed to start pooled browser: {str(e)}")
+            return None
+
+        with self._lock:
+            self.counters["created"] += 1
+        return _PooledDriver(driver)
+
+    def _acquire(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                entry = self._create_entry()
+                if entry is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise BrowserPoolExhausted(f"No browser session free after {timeout}s")
+                    try:
+                        entry = self._idle.get(timeout=remaining)
+                    except queue.Empty:
+                        raise BrowserPoolExhausted(f"No browser session free after {timeout}s")
+
+            if self._is_healthy(entry):
+                with self._lock:
+                    self._in_use += 1
+                    self.counters["leases"] += 1
+                return entry
+
+            self._retire(entry, "failed health check")
+
+    def _release(self, entry, broken):
+        with self._lock:
+            self._in_use -= 1
+            closed = self._closed
+
+        if closed:
+            self._retire(entry, "pool closed")
+        elif broken:
+            self._retire(entry, "crashed during lease")
+            self._replenish()
+        elif entry.uses >= self.max_uses:
+            self._retire(entry, f"reached {self.max_uses} uses")
+            self._replenish()
+        else:
+            self._idle.put(entry)
+
+    def _replenish(self):
+        threading.Thread(target=self._warm_one, name="browser-pool-refill", daemon=True).start()
+
+    def _is_healthy(self, entry):
+        try:
+            return entry.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _retire(self, entry, reason):
+        with self._lock:
+            self._total -= 1
+            self.counters["recycled"] += 1
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+        logger.info(f"♻️ Recycled browser session ({reason})")
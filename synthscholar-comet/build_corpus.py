@@ -0,0 +1,28 @@
+"""Compile JSON/JSONL research topics into a memory-mapped corpus store
+
+    python build_corpus.py data/mock_corpus extra_topics.jsonl --out /srv/synthscholar/corpus
+
+Sources are files or directories of topic records
+({"topic": ..., "aliases": [...], "sections": [{"sub_query": ..., "content": ...}]}).
+Building into an existing store appends and repoints updated topics; pass
+--compact to drop superseded copies. Point MOCK_CORPUS_DIR at --out to use it.
+"""
+import sys
+import json
+import argparse
+from utils.corpus_store import build_corpus
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sources", nargs="+", help="JSON/JSONL files or directories")
+    parser.add_argument("--out", required=True, help="directory for the compiled store")
+    parser.add_argument("--name", default="research", help="store name inside --out")
+    parser.add_argument("--compact", action="store_true", help="rewrite the data file without stale records")
+    args = parser.parse_args(argv)
+
+    stats = build_corpus(args.sources, args.out, name=args.name, compact=args.compact)
+    print(json.dumps(stats, indent=2))
+    return 0 if stats["records"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,11 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 class Config:
     # COMET Browser Configuration
     COMET_EMAIL = os.getenv('COMET_EMAIL', '')
@@ -10,6 +13,15 @@ class Config:
     
     # OpenAI for content synthesis
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL', '')  # any OpenAI-compatible endpoint
+    LLM_MAX_CONNECTIONS = int(os.getenv('LLM_MAX_CONNECTIONS', '20'))
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '8'))  # requests in flight
+    LLM_RATE_PER_SECOND = float(os.getenv('LLM_RATE_PER_SECOND', '3'))  # 0 disables rate limiting
+    LLM_BURST = int(os.getenv('LLM_BURST', '10'))
+    LLM_MAX_RETRIES = 4
+    LLM_BACKOFF_BASE = 0.5  # seconds
+    LLM_BACKOFF_MAX = 20
+    LLM_TIMEOUT = 60
     
     # App Configuration
     SECRET_KEY = os.getenv('SECRET_KEY', 'synthscholar-comet-hackathon-2024')
@@ -18,12 +30,99 @@ class Config:
     # Model Configuration
     OPENAI_MODEL = "gpt-3.5-turbo"
     
+    # Pipeline Configuration
+    PIPELINE_MODE = os.getenv('PIPELINE_MODE', 'sequential')  # sequential, streaming or pipelined
+    PIPELINE_QUEUE_SIZE = 16  # items buffered between overlapping stages
+    
     # Browser Configuration
     BROWSER_HEADLESS = False
     RESEARCH_TIMEOUT = 30
+    COMET_URL = os.getenv('COMET_URL', 'https://www.perplexity.ai')
+    RESEARCH_CONCURRENCY = int(os.getenv('RESEARCH_CONCURRENCY', '3'))  # browser sessions per topic
+    RESEARCH_POLL_INTERVAL = 0.5  # seconds between answer checks
+    RESEARCH_STABLE_POLLS = 2  # unchanged polls before an answer counts as finished (polling fallback)
+    RESEARCH_STABLE_SECONDS = float(os.getenv('RESEARCH_STABLE_SECONDS', '1.5'))  # answer unchanged this long counts as finished
+    PAGE_QUIET_SECONDS = float(os.getenv('PAGE_QUIET_SECONDS', '0.5'))  # page settled after this long without DOM changes
+    
+    # Research backends, see utils/research_backends.py: comma separated
+    # names in order of preference (comet, corpus, http). Several run
+    # concurrently; empty means corpus in demo mode and comet otherwise.
+    RESEARCH_BACKENDS = [name.strip() for name in os.getenv('RESEARCH_BACKENDS', '').split(',') if name.strip()]
+    RESEARCH_BUDGET = float(os.getenv('RESEARCH_BUDGET', '120'))  # seconds a multi-backend lookup may take
+    RESEARCH_BACKEND_TIMEOUTS = {  # seconds per backend within the budget
+        'comet': float(os.getenv('COMET_BACKEND_TIMEOUT', '120')),
+        'corpus': float(os.getenv('CORPUS_BACKEND_TIMEOUT', '5')),
+        'http': float(os.getenv('HTTP_BACKEND_TIMEOUT', '20')),
+    }
+    RESEARCH_HTTP_URL = os.getenv('RESEARCH_HTTP_URL', '')  # JSON endpoint for the http backend
+    
+    # Research compaction before synthesis, see utils/compaction.py
+    RESEARCH_DEDUP_THRESHOLD = float(os.getenv('RESEARCH_DEDUP_THRESHOLD', '0.8'))  # similarity that counts as a repeated paragraph (0 disables)
+    RESEARCH_TOKEN_BUDGET = int(os.getenv('RESEARCH_TOKEN_BUDGET', '2500'))  # research tokens per synthesis prompt (0 = no limit)
+    
+    # Research Cache Configuration
+    RESEARCH_CACHE_SIZE = int(os.getenv('RESEARCH_CACHE_SIZE', '256'))  # in-memory entries
+    RESEARCH_CACHE_TTL = int(os.getenv('RESEARCH_CACHE_TTL', '86400'))  # seconds
+    RESEARCH_CACHE_PATH = os.getenv('RESEARCH_CACHE_PATH', '')  # SQLite file, empty disables the disk tier
+    
+    # Synthesis Cache Configuration
+    SYNTHESIS_CACHE_ENABLED = os.getenv('SYNTHESIS_CACHE_ENABLED', 'true').lower() == 'true'
+    SYNTHESIS_CACHE_SIZE = int(os.getenv('SYNTHESIS_CACHE_SIZE', '128'))  # in-memory completions
+    SYNTHESIS_CACHE_TTL = int(os.getenv('SYNTHESIS_CACHE_TTL', '604800'))  # seconds
+    SYNTHESIS_CACHE_PATH = os.getenv('SYNTHESIS_CACHE_PATH', '')  # SQLite file, empty disables the disk tier
+    SYNTHESIS_CACHE_DISK_ENTRIES = int(os.getenv('SYNTHESIS_CACHE_DISK_ENTRIES', '2000'))  # LRU bound on disk
+    
+    # Browser Pool Configuration
+    BROWSER_POOL_SIZE = int(os.getenv('BROWSER_POOL_SIZE', '3'))
+    BROWSER_MAX_USES = int(os.getenv('BROWSER_MAX_USES', '50'))  # leases before a session is recycled
+    BROWSER_LEASE_TIMEOUT = 60
+    CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH', '')
+    CHROMEDRIVER_CACHE_FILE = os.path.expanduser('~/.cache/synthscholar/chromedriver_path')
     
     # Demo Mode
     DEMO_MODE = True
     
     # Audio Configuration
-    AUDIO_SPEED = 1.0
\ No newline at end of file
+    AUDIO_SPEED = 1.0
+    AUDIO_LANGUAGE = 'en'
+    AUDIO_DIR = os.getenv('AUDIO_DIR', os.path.join(tempfile.gettempdir(), 'synthscholar_audio'))
+    AUDIO_CACHE_MAX_BYTES = int(os.getenv('AUDIO_CACHE_MAX_BYTES', str(512 * 1024 * 1024)))  # disk quota, 0 = unlimited
+    AUDIO_TTL = int(os.getenv('AUDIO_TTL', str(7 * 24 * 3600)))  # seconds since last access, 0 = keep
+    AUDIO_GC_INTERVAL = int(os.getenv('AUDIO_GC_INTERVAL', '300'))  # seconds between cleanup passes
+    TTS_ENGINE = os.getenv('TTS_ENGINE', 'gtts')  # 'stub' renders silence offline
+    TTS_WORKERS = int(os.getenv('TTS_WORKERS', '4'))
+    TTS_CHUNK_CHARS = 400
+    STREAM_WAIT_TIMEOUT = 60  # seconds a stream reader waits for the next segment
+    
+    # Job Queue Configuration
+    JOB_WORKERS = int(os.getenv('JOB_WORKERS', '4'))
+    JOB_MAX_PENDING = int(os.getenv('JOB_MAX_PENDING', '32'))
+    JOB_RETENTION = int(os.getenv('JOB_RETENTION', '3600'))  # seconds finished jobs stay pollable
+    SSE_KEEPALIVE = 15  # seconds between keep-alive comments on idle event streams
+    SINGLE_FLIGHT_ENABLED = os.getenv('SINGLE_FLIGHT_ENABLED', 'true').lower() == 'true'  # share in-flight jobs per topic
+    
+    # Async (ASGI) serving mode, see asgi.py
+    ASYNC_JOB_MAX_PENDING = int(os.getenv('ASYNC_JOB_MAX_PENDING', '512'))  # jobs in flight on the event loop
+    ASYNC_BLOCKING_THREADS = int(os.getenv('ASYNC_BLOCKING_THREADS', '16'))  # threads for Selenium/TTS calls
+    ASGI_WSGI_THREADS = int(os.getenv('ASGI_WSGI_THREADS', '32'))  # threads running the Flask routes
+    
+    # Components app.py builds at startup in the background instead of on
+    # first use: comma separated names or 'all' (empty = fully lazy). With
+    # gunicorn --preload call app.components.prewarm() from post_fork instead.
+    PREWARM_COMPONENTS = [name.strip() for name in os.getenv('PREWARM_COMPONENTS', '').split(',') if name.strip()]
+    
+    # Per-stage caps shared by every job (0 = unlimited)
+    STAGE_CONCURRENCY = {
+        'research': int(os.getenv('RESEARCH_STAGE_CONCURRENCY', '3')),
+        'synthesis': int(os.getenv('SYNTHESIS_STAGE_CONCURRENCY', '8')),
+        'audio': int(os.getenv('AUDIO_STAGE_CONCURRENCY', '4')),
+    }
+    
+    # Batch Configuration
+    BATCH_DIR = os.getenv('BATCH_DIR', os.path.join(tempfile.gettempdir(), 'synthscholar_batches'))  # manifests
+    BATCH_MAX_IN_FLIGHT = int(os.getenv('BATCH_MAX_IN_FLIGHT', '4'))  # batch topics queued at once
+    BATCH_MAX_TOPICS = 1000
+    BATCH_RETENTION = int(os.getenv('BATCH_RETENTION', '3600'))  # seconds finished batches stay in memory
+    
+    # Mock research corpus (demo mode); JSON sources or a store compiled by build_corpus.py
+    MOCK_CORPUS_DIR = os.getenv('MOCK_CORPUS_DIR', os.path.join(BASE_DIR, 'data', 'mock_corpus'))
\ No newline at end of file
@@ -0,0 +1,75 @@
+from utils.metrics import timed
+from utils.sub_queries import SUB_QUERY_TEMPLATES
+from utils.topic_index import default_index
+
+class MockCometAutomation:
+    """Mock version for reliable hackathon demo"""
+    
+    name = "corpus"
+    
+    def __init__(self, cache=None, index=None):
+        self.cache = cache
+        self._cache_templates = SUB_QUERY_TEMPLATES + ["backend:" + self.name]
+        # Canned research lives in Config.MOCK_CORPUS_DIR (JSON/JSONL topic records)
+        self.index = index if index is not None else default_index()
+    
+    def initialize_browser(self):
+        print("✅ Mock COMET browser initialized")
+        return True
+    
+    def login_to_comet(self, email, password):
+        print(f"✅ Mock login successful for {email}")
+        return True
+    
+    @timed("research_topic")
+    def research_topic(self, topic):
+        if self.cache is not None:
+            cached = self.cache.get_research(topic, self._cache_templates)
+            if cached is not None:
+                return cached
+        
+        research_data = self._lookup_topic(topic)
+        if self.cache is not None:
+            self.cache.put_research(topic, self._cache_templates, research_data)
+        return research_data
+    
+    def iter_research(self, topic, cancel_event=None):
+        """Yield research sections one at a time, like CometAutomation.iter_research"""
+        yield from self.research_topic(topic)
+    
+    def _lookup_topic(self, topic):
+        # Find best matching topic
+        match = self.index.best_match(topic)
+        if match is not None:
+            print(f"✅ Found mock research data for: {match.topic}")
+            return [dict(section) for section in match.sections]
+        
+        # Generic response for unknown topics
+        print(f"⚠️ Using generic mock data for: {topic}")
+        return [
+            {
+                "sub_query": f"comprehensive analysis of {topic}",
+                "content": f"""COMPREHENSIVE RESEARCH SUMMARY: {topic.upper()}
+
+📊 EXECUTIVE OVERVIEW:
+{topic} represents a significant technological/social/scientific advancement with far-reaching implications. Current adoption rates show 45% year-over-year growth across major industries.
+
+🎯 KEY FINDINGS:
+• Major efficiency improvements of 60-80% in target applications
+• Cost reduction potential of 30-50% through automation
+• Environmental impact reduction of 25% in sustainable implementations
+• User satisfaction increases of 40% in deployed systems
+
+🔬 TECHNICAL INSIGHTS:
+Recent research from MIT, Stanford, and industry leaders demonstrates compelling evidence for widespread adoption. Peer-reviewed studies show consistent positive outcomes across multiple metrics.
+
+💡 FUTURE OUTLOOK:
+Market analysts project 10x growth in the next 5 years, with potential to disrupt traditional approaches and create new economic opportunities worth billions annually.
+
+⚠️ CONSIDERATIONS:
+Implementation requires careful planning, stakeholder buy-in, and addressing potential ethical concerns through transparent governance frameworks."""
+            }
+        ]
+    
+    def close_browser(self):
+        print("🔚 Mock browser session closed")
\ No newline at end of file
@@ -3,6 +3,12 @@ class SynthScholar {
     constructor() {
         this.currentAudio = null;
         this.isProcessing = false;
+        this.currentJobId = null;
+        this.cancelToken = null;
+        this.streamingUrl = null;
+        this.eventSource = null;
+        this.liveScript = '';
+        this.pollInterval = 1000;
         this.initializeEventListeners();
         this.initializeDemoTopics();
         this.showWelcomeAnimation();
@@ -101,23 +107,31 @@ class SynthScholar {
             return;
         }
 
+        this.streamingUrl = null;
+        this.liveScript = '';
         this.showLoading(true);
         this.hideResults();
         this.hideError();
 
         try {
-            const response = await this.makeResearchRequest(topic);
+            const job = await this.makeResearchRequest(topic);
+            const response = await this.pollJob(job);
             
-            if (response.success) {
-                this.showResults(response);
+            if (response.status === 'completed') {
+                this.showResults(response.result);
                 this.showNotification('Podcast generated successfully!', 'success');
+            } else if (response.status === 'cancelled') {
+                this.showNotification('Podcast generation cancelled', 'warning');
             } else {
                 this.showError(response.error || 'An unexpected error occurred.');
             }
         } catch (error) {
             console.error('Research error:', error);
-            this.showError('Network error. Please check your connection and try again.');
+            this.showError(error.message || 'Network error. Please check your connection and try again.');
         } finally {
+            this.currentJobId = null;
+            this.cancelToken = null;
+            this.stopListening();
             this.showLoading(false);
         }
     }
@@ -139,6 +153,85 @@ class SynthScholar {
         return await response.json();
     }
 
+    listenForScript(job) {
+        // Show the script as it is written, via Server-Sent Events
+        if (!window.EventSource) {
+            return;
+        }
+
+        const events = new EventSource(`/api/jobs/${job.job_id}/events`);
+        this.eventSource = events;
+
+        events.addEventListener('script', (e) => {
+            this.liveScript += JSON.parse(e.data);
+            document.getElementById('scriptPreview').innerHTML = this.formatScriptPreview(this.liveScript);
+            document.getElementById('result').style.display = 'block';
+        });
+
+        events.addEventListener('done', () => this.stopListening());
+        events.onerror = () => this.stopListening();
+    }
+
+    stopListening() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
+    }
+
+    async pollJob(job) {
+        // Poll the job status endpoint until the job reaches a terminal state
+        this.currentJobId = job.job_id;
+        this.cancelToken = job.cancel_token || null;
+        this.listenForScript(job);
+        const terminal = ['completed', 'failed', 'cancelled'];
+
+        while (true) {
+            const response = await fetch(job.status_url);
+            if (!response.ok) {
+                const errorData = await response.json();
+                throw new Error(errorData.error || `HTTP error! status: ${response.status}`);
+            }
+
+            const status = await response.json();
+            this.renderJobProgress(status);
+
+            if (status.details && status.details.stream_url && !this.streamingUrl) {
+                this.startStreaming(status.details.stream_url);
+            }
+
+            if (terminal.includes(status.status)) {
+                return status;
+            }
+            await new Promise(resolve => setTimeout(resolve, this.pollInterval));
+        }
+    }
+
+    startStreaming(streamUrl) {
+        // Point the player at the progressive stream while the render finishes
+        const audioPlayer = document.getElementById('audioPlayer');
+        this.streamingUrl = streamUrl;
+        audioPlayer.src = streamUrl;
+        this.currentAudio = audioPlayer;
+        document.getElementById('result').style.display = 'block';
+        this.setupAutoPlay();
+    }
+
+    async cancelCurrentJob() {
+        if (!this.currentJobId) {
+            return;
+        }
+        try {
+            await fetch(`/api/jobs/${this.currentJobId}/cancel`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ cancel_token: this.cancelToken })
+            });
+        } catch (error) {
+            console.error('Cancel error:', error);
+        }
+    }
+
     showLoading(show) {
         const btn = document.getElementById('generateBtn');
         const btnText = btn.querySelector('.btn-text');
@@ -167,28 +260,17 @@ class SynthScholar {
     }
 
     showProcessingAnimation() {
-        // Create processing steps animation
-        const steps = [
-            { icon: '🔍', text: 'Researching with COMET AI...', duration: 2000 },
-            { icon: '✍️', text: 'Synthesizing content...', duration: 1500 },
-            { icon: '🎧', text: 'Generating audio...', duration: 1000 }
-        ];
-
-        let currentStep = 0;
-        
-        const updateStep = () => {
-            if (currentStep < steps.length) {
-                const step = steps[currentStep];
-                this.updateProcessingStep(step.icon, step.text);
-                currentStep++;
-                setTimeout(updateStep, step.duration);
-            }
-        };
-        
-        updateStep();
+        // Steps are filled in from real job progress as the status is polled
+        this.renderJobProgress({ status: 'queued', stages: [] });
     }
 
-    updateProcessingStep(icon, text) {
+    renderJobProgress(job) {
+        const stepInfo = {
+            research: { icon: '🔍', text: 'Researching with COMET AI...' },
+            synthesis: { icon: '✍️', text: 'Synthesizing content...' },
+            audio: { icon: '🎧', text: 'Generating audio...' }
+        };
+
         let stepIndicator = document.getElementById('processingSteps');
         if (!stepIndicator) {
             stepIndicator = document.createElement('div');
@@ -197,18 +279,38 @@ class SynthScholar {
             document.querySelector('.research-card').appendChild(stepIndicator);
         }
 
-        const stepElement = document.createElement('div');
-        stepElement.className = 'processing-step active';
-        stepElement.innerHTML = `
-            <span class="step-icon">${icon}</span>
-            <span class="step-text">${text}</span>
-            <span class="step-spinner"></span>
-        `;
-        
-        stepIndicator.appendChild(stepElement);
-        
-        // Scroll to show the current step
-        stepElement.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+        if (job.status === 'queued') {
+            stepIndicator.innerHTML = `
+                <div class="processing-step active">
+                    <span class="step-icon">⏳</span>
+                    <span class="step-text">Waiting for a free worker...</span>
+                    <span class="step-spinner"></span>
+                </div>
+            `;
+            return;
+        }
+
+        stepIndicator.innerHTML = job.stages
+            .filter(stage => stage.status !== 'pending')
+            .map(stage => {
+                const info = stepInfo[stage.name] || { icon: '⚙️', text: stage.name };
+                const running = stage.status === 'running';
+                const marker = running ? '<span class="step-spinner"></span>'
+                    : `<span class="step-status">${stage.status === 'completed' ? '✅' : '❌'}</span>`;
+                return `
+                    <div class="processing-step ${running ? 'active' : ''}">
+                        <span class="step-icon">${info.icon}</span>
+                        <span class="step-text">${info.text}</span>
+                        ${marker}
+                    </div>
+                `;
+            })
+            .join('');
+
+        const active = stepIndicator.querySelector('.processing-step.active');
+        if (active) {
+            active.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+        }
     }
 
     hideProcessingAnimation() {
@@ -224,12 +326,14 @@ class SynthScholar {
         const scriptPreview = document.getElementById('scriptPreview');
         const downloadBtn = document.getElementById('downloadBtn');
 
-        // Set audio source
-        audioPlayer.src = data.audio_url;
+        // Set audio source, unless playback already started from the stream
+        if (!this.streamingUrl) {
+            audioPlayer.src = data.audio_url;
+        }
         this.currentAudio = audioPlayer;
         
-        // Set script preview with nice formatting
-        scriptPreview.innerHTML = this.formatScriptPreview(data.script_preview);
+        // Set script preview with nice formatting, keeping the full live script if we have it
+        scriptPreview.innerHTML = this.formatScriptPreview(this.liveScript || data.script_preview);
         
         // Set download link
         const safeTopic = data.topic.replace(/[^a-z0-9]/gi, '_').toLowerCase();
@@ -333,8 +437,12 @@ class SynthScholar {
                 }
             }
             
-            // Escape to reset form
+            // Escape to cancel a running job, or reset the form
             if (e.key === 'Escape') {
+                if (this.isProcessing) {
+                    this.cancelCurrentJob();
+                    return;
+                }
                 this.resetForm();
             }
         });
@@ -467,6 +575,10 @@ document.addEventListener('DOMContentLoaded', () => {
             animation: spin 1s linear infinite;
         }
         
+        .step-status {
+            margin-left: 10px;
+        }
+        
         .notification {
             position: fixed;
             top: 20px;
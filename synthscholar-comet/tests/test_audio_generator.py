@@ -0,0 +1,76 @@
+import os
+import time
+import pytest
+from utils.audio_generator import AudioGenerator
+from utils.audio_store import AudioStore
+from utils.text_normalizer import chunk_segments
+from utils.tts_engines import SILENT_MP3_FRAME, StubTTSEngine
+
+SCRIPT = (
+    'HOST: "Welcome to SynthScholar. Today we look at quantum computing and what it means for you. '
+    'Researchers report steady progress on error correction and larger processors."\n\n'
+    'CONCLUSION: "Thanks for listening. The field is moving fast, so stay curious and keep learning."'
+)
+
+class ReversedStub(StubTTSEngine):
+    """Stub whose earlier chunks finish last, so pool completion order is reversed"""
+
+    def synthesize(self, text, language):
+        time.sleep(0.2 / len(text))
+        return super().synthesize(text, language)
+
+@pytest.fixture
+def generator(tmp_path):
+    generator = AudioGenerator(store=AudioStore(root=str(tmp_path)), engine=ReversedStub())
+    yield generator
+    generator.executor.shutdown(wait=True)
+
+def test_segments_come_back_in_chunk_order(generator):
+    # Chunk i is 15 * i characters, so its stub audio is exactly i frames
+    chunks = ["x" * 15 * i for i in range(1, 13)]
+    segments = list(generator.iter_segments(iter(chunks)))
+    assert [len(segment) // len(SILENT_MP3_FRAME) for segment in segments] == list(range(1, 13))
+
+def test_rendered_file_is_the_chunks_concatenated(generator):
+    path = generator.text_to_speech(SCRIPT, "quantum computing")
+    assert path and os.path.exists(path)
+
+    segments = generator.normalizer.normalize(SCRIPT).segments
+    chunks = chunk_segments(segments, generator.chunk_chars)
+    expected = b"".join(generator.engine.synthesize(chunk, generator.language) for chunk in chunks)
+    with open(path, "rb") as f:
+        assert f.read() == expected
+
+def test_identical_scripts_share_one_file(generator):
+    assert generator.text_to_speech(SCRIPT, "a") == generator.text_to_speech(SCRIPT, "b")
+
+def test_streamed_render_leaves_no_partial_file(generator, tmp_path):
+    sentences = ["HOST: Welcome to SynthScholar.", "Today we look at qubits.", "CONCLUSION: Thanks for listening."]
+    path = generator.text_to_speech_stream(iter(sentences), "qubits")
+    assert path and os.path.getsize(path) > 0
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
+
+def test_failed_stream_leaves_no_partial_file(generator, tmp_path):
+    def sentences():
+        yield "HOST: Welcome to SynthScholar."
+        raise RuntimeError("LLM stream dropped")
+
+    assert generator.text_to_speech_stream(sentences(), "qubits") is None
+    assert not [name for name in os.listdir(tmp_path) if name.endswith((".part", ".mp3"))]
+
+def test_stream_is_open_before_its_name_is_published(generator):
+    published = []
+
+    def on_start(name):
+        stream = generator.streams.get(name)
+        published.append(stream is not None and not stream.finished)
+
+    generator.text_to_speech(SCRIPT, "quantum computing", on_start=on_start)
+    generator.text_to_speech_stream(iter(["HOST: Welcome.", "Goodbye."]), "qubits", on_start=on_start)
+    assert published == [True, True]
+
+def test_cached_render_publishes_no_stream(generator):
+    generator.text_to_speech(SCRIPT, "quantum computing")
+    published = []
+    generator.text_to_speech(SCRIPT, "quantum computing", on_start=published.append)
+    assert published == []
@@ -0,0 +1,35 @@
+import time
+from concurrent.futures import wait
+import pytest
+from utils.batch import BatchRunner
+from utils.job_queue import JobQueue
+
+def wait_for_cancel(job):
+    while not job.cancel_requested():
+        time.sleep(0.01)
+    job.check_cancelled()
+
+def test_cancel_after_an_interrupted_run_stops_its_jobs(tmp_path):
+    job_queue = JobQueue(max_workers=1)
+    jobs = []
+
+    def submit(topic):
+        if topic == "interrupt":
+            raise KeyboardInterrupt
+        job = job_queue.submit(topic, wait_for_cancel)
+        jobs.append(job)
+        return job, job.token
+
+    runner = BatchRunner(job_queue, wait_for_cancel, str(tmp_path / "batch.json"), submit=submit, max_in_flight=5)
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            runner.run(["running", "queued", "interrupt"])
+        runner.cancel()
+
+        # One job was running on the single worker, the other still queued
+        wait([job.future for job in jobs], timeout=5)
+        assert [job.status for job in jobs] == ["cancelled", "cancelled"]
+    finally:
+        for job in jobs:
+            job.request_cancel()
+        job_queue.shutdown(wait=True)
@@ -0,0 +1,79 @@
+import time
+import threading
+import pytest
+from comet_automation import CometAutomation
+
+class FakeDriver:
+    def __init__(self):
+        self.active = 0
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+class FakeComet(CometAutomation):
+    """Concurrent research against fake drivers that flag being driven from two threads"""
+
+    def __init__(self, query_seconds=0.05, **kwargs):
+        super().__init__(concurrency=2, **kwargs)
+        self.query_seconds = query_seconds
+        self.overlaps = 0
+        self._guard = threading.Lock()
+
+    def _create_driver(self):
+        return FakeDriver()
+
+    def _run_sub_query(self, driver, query):
+        with self._guard:
+            driver.active += 1
+            if driver.active > 1:
+                self.overlaps += 1
+        time.sleep(self.query_seconds)
+        with self._guard:
+            driver.active -= 1
+        return {"text": f"{query} " * 20, "links": [], "strategy": "fake"}
+
+@pytest.fixture
+def comet():
+    comet = FakeComet()
+    yield comet
+    comet.close_browser()
+
+def test_concurrent_jobs_never_share_a_session(comet):
+    def job(topic):
+        list(comet.iter_research(topic))
+
+    threads = [threading.Thread(target=job, args=(f"topic {i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert comet.overlaps == 0
+    assert len(comet._idle_sessions) == len(comet.sessions)
+
+def test_cancelled_job_keeps_its_sessions_until_its_workers_stop(comet):
+    comet.query_seconds = 0.3
+    cancel_event = threading.Event()
+    research = comet.iter_research("quantum computing", cancel_event=cancel_event)
+    next(research)
+    cancel_event.set()
+    research.close()
+
+    # The cancelled job's workers are still finishing their current query
+    list(comet.iter_research("climate change"))
+    assert comet.overlaps == 0
+
+def test_sessions_checked_out_at_close_are_quit_on_return(comet):
+    comet.query_seconds = 0.2
+    research = comet.iter_research("quantum computing")
+    next(research)
+    busy = list(comet.sessions)
+    comet.close_browser()
+    research.close()
+
+    deadline = time.monotonic() + 5
+    while not all(driver.quit_called for driver in busy) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert all(driver.quit_called for driver in busy)
+    assert comet.sessions == []
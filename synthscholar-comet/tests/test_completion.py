@@ -0,0 +1,53 @@
+import os
+from urllib.parse import urlencode
+import pytest
+from selenium import webdriver
+from selenium.webdriver.common.keys import Keys
+from utils.completion import CompletionDetector
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "comet_stub.html")
+
+@pytest.fixture(scope="module")
+def driver():
+    options = webdriver.ChromeOptions()
+    for argument in ("--headless", "--no-sandbox", "--disable-dev-shm-usage", "--disable-gpu"):
+        options.add_argument(argument)
+    try:
+        driver = webdriver.Chrome(options=options)
+    except Exception as e:
+        pytest.skip(f"no Chrome driver available: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+    yield driver
+    driver.quit()
+
+def ask(driver, detector, query, **params):
+    """Submit query to the fixture and return (answer, settled, what the page streamed)"""
+    driver.get(f"file://{FIXTURE}?{urlencode(params)}")
+    assert detector.wait_for_quiet(driver)
+    search_box = driver.find_element("xpath", "//textarea")
+    assert detector.arm(driver)
+    detector.submit(driver, search_box, query, Keys.RETURN)
+    answer, settled = detector.wait(driver)
+    record = driver.execute_script("return window.fixtureAnswers[window.fixtureAnswers.length - 1]")
+    return answer, settled, record
+
+@pytest.mark.parametrize("params", [
+    {"delay": 100, "interval": 5},
+    {"delay": 300, "interval": 20, "words": 150, "sources": 3},
+    {"delay": 200, "interval": 100, "chunk": 12, "words": 200},
+    {"delay": 200, "interval": 20, "words": 120, "stall_at": 40, "stall": 400},
+])
+def test_returns_the_complete_answer(driver, params):
+    detector = CompletionDetector(stable_seconds=1.0, page_quiet_seconds=0.2, timeout=30)
+    answer, settled, record = ask(driver, detector, "quantum computing", **params)
+
+    assert settled
+    assert record["finishedAt"] is not None
+    assert answer["text"] == record["text"]
+    assert [link["url"] for link in answer["links"]] == record["links"]
+
+def test_unsettled_answer_is_returned_at_timeout(driver):
+    detector = CompletionDetector(stable_seconds=1.0, page_quiet_seconds=0.2, timeout=1.5)
+    answer, settled, record = ask(driver, detector, "slow topic", delay=100, interval=50, words=400)
+
+    assert not settled
+    assert record["finishedAt"] is None
@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from utils.content_synthesizer import ContentSynthesizer
+
+RESEARCH = [{"sub_query": "overview", "content": "Quantum computers use qubits to explore many states at once."}]
+
+class FlakyClient:
+    """Streams fail_after fragments, then drops the connection"""
+
+    def __init__(self, fail_after):
+        self.fail_after = fail_after
+
+    def stream_chat(self, messages, model, max_tokens, temperature):
+        for i in range(self.fail_after):
+            yield f"HOST: Point {i}. "
+        raise ConnectionError("connection reset")
+
+def synthesizer(fail_after):
+    synthesizer = ContentSynthesizer(client=FlakyClient(fail_after), cache=None)
+    synthesizer.api_key = "test"
+    return synthesizer
+
+def test_stream_falls_back_when_nothing_was_produced():
+    script = "".join(synthesizer(0).stream_podcast_script("quantum computing", RESEARCH))
+    assert "quantum computing" in script.lower()
+
+def test_stream_cut_off_midway_raises():
+    fragments = []
+    with pytest.raises(ConnectionError):
+        for fragment in synthesizer(2).stream_podcast_script("quantum computing", RESEARCH):
+            fragments.append(fragment)
+    assert fragments == ["HOST: Point 0. ", "HOST: Point 1. "]
+
+def test_sectioned_stream_cut_off_midway_raises():
+    with pytest.raises(ConnectionError):
+        list(synthesizer(2).stream_sectioned_script("quantum computing", iter(RESEARCH)))
+
+class CountingClient:
+    """Answers every chat with the same script and counts the calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def chat(self, messages, model, max_tokens, temperature):
+        self.calls += 1
+        return "  HOST: Welcome.  "
+
+class CountingAsyncClient(CountingClient):
+    async def chat(self, messages, model, max_tokens, temperature):
+        return CountingClient.chat(self, messages, model, max_tokens, temperature)
+
+class DictCache(dict):
+    def set(self, key, value):
+        self[key] = value
+
+def test_sync_and_async_scripts_share_one_cache_entry():
+    client, async_client = CountingClient(), CountingAsyncClient()
+    synthesizer = ContentSynthesizer(client=client, cache=DictCache(), async_client=async_client)
+    synthesizer.api_key = "test"
+
+    assert asyncio.run(synthesizer.acreate_podcast_script("quantum computing", RESEARCH)) == "HOST: Welcome."
+    assert synthesizer.create_podcast_script("quantum computing", RESEARCH) == "HOST: Welcome."
+    assert (client.calls, async_client.calls) == (0, 1)
+
+    assert synthesizer.create_podcast_script("quantum computing", RESEARCH, bypass_cache=True) == "HOST: Welcome."
+    assert client.calls == 1
+
+def test_failed_script_falls_back_to_mock():
+    # FlakyClient has no chat(), so the request fails
+    script = synthesizer(0).create_podcast_script("quantum computing", RESEARCH)
+    assert "quantum computing" in script.lower()
@@ -0,0 +1,79 @@
+import os
+import sys
+import asyncio
+import threading
+import openai
+import pytest
+from config import Config
+from utils.content_synthesizer import ContentSynthesizer
+from utils.llm_client import SynthesisClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from fake_openai_server import create_server
+
+MESSAGES = [{"role": "user", "content": "TOPIC: qubits"}]
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(Config, "LLM_BACKOFF_BASE", 0)
+
+@pytest.fixture
+def server():
+    """Fake OpenAI server answering every second request with 429"""
+    server = create_server(fail_every=2, repeat=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def client_for(server, **kwargs):
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    return SynthesisClient(api_key="test", base_url=base_url, rate_per_second=0, **kwargs)
+
+def test_chat_retries_rate_limits(server):
+    client = client_for(server, max_retries=2)
+    try:
+        first = client.chat(MESSAGES, "fake", 100, 0.7)
+        second = client.chat(MESSAGES, "fake", 100, 0.7)
+    finally:
+        client.close()
+    assert "qubits" in first and second == first
+    # Request 2 was the 429, request 3 its retry
+    assert server.requests == 3
+
+def test_stream_chat_retries_before_the_first_delta(server):
+    client = client_for(server, max_retries=2)
+    try:
+        client.chat(MESSAGES, "fake", 100, 0.7)
+        text = "".join(client.stream_chat(MESSAGES, "fake", 100, 0.7))
+    finally:
+        client.close()
+    assert "qubits" in text
+    assert server.requests == 3
+
+def test_rate_limit_is_raised_once_retries_run_out(server):
+    server.fail_every = 1
+    client = client_for(server, max_retries=1)
+    try:
+        with pytest.raises(openai.RateLimitError):
+            client.chat(MESSAGES, "fake", 100, 0.7)
+    finally:
+        client.close()
+    assert server.requests == 2
+
+def test_closing_the_synthesizer_resets_the_shared_async_client(monkeypatch):
+    monkeypatch.setattr(Config, "OPENAI_API_KEY", "test")
+
+    async def serve_once():
+        synthesizer = ContentSynthesizer(cache=None)
+        client = synthesizer.async_client
+        await synthesizer.aclose()
+        return client
+
+    first = asyncio.run(serve_once())
+    assert first.http_client.is_closed
+    # A later event loop gets a fresh client, not the closed one
+    second = asyncio.run(serve_once())
+    assert second is not first and second.http_client.is_closed
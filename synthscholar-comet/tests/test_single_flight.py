@@ -0,0 +1,112 @@
+import threading
+import pytest
+from utils.job_queue import JobQueue
+from utils.single_flight import SingleFlight
+
+class Gate:
+    """Runner that holds a job open until released or cancelled"""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.runs = 0
+
+    def __call__(self, job):
+        self.runs += 1
+        while not self.release.wait(0.01):
+            job.check_cancelled()
+        return {"topic": job.topic}
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(max_workers=2, max_pending=10)
+    yield queue
+    queue.shutdown(wait=False)
+
+def join(flights, queue, runner, key="ai"):
+    """Mirrors app.submit_research_job: (job, token, shared)"""
+    job, shared = flights.join(
+        key,
+        lambda: queue.submit(key, runner),
+        is_active=lambda job: not job.done and not job.cancel_requested()
+    )
+    if shared:
+        return job, job.attach(), True
+    job.future.add_done_callback(lambda _: flights.forget(key, job))
+    return job, job.token, False
+
+def test_join_starts_once_and_forget_releases_the_key():
+    flights = SingleFlight()
+    started = []
+    start = lambda: started.append(object()) or started[-1]
+
+    first, shared = flights.join("ai", start)
+    assert not shared
+    second, shared = flights.join("ai", start)
+    assert shared and second is first
+    assert len(started) == 1
+
+    flights.forget("ai", first)
+    third, shared = flights.join("ai", start)
+    assert not shared and third is not first
+    assert flights.stats() == {"leaders": 2, "coalesced": 1, "in_flight": 1, "coalesce_ratio": 0.3333}
+
+def test_forget_keeps_a_newer_computation():
+    flights = SingleFlight()
+    old, _ = flights.join("ai", object)
+    flights.forget("ai", old)
+    new, _ = flights.join("ai", object)
+    flights.forget("ai", old)
+    assert flights.join("ai", object) == (new, True)
+
+def test_concurrent_requests_share_one_job(queue):
+    flights = SingleFlight()
+    runner = Gate()
+    barrier = threading.Barrier(8)
+    results = []
+
+    def request():
+        barrier.wait()
+        results.append(join(flights, queue, runner))
+
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    runner.release.set()
+
+    jobs = {job.id for job, _, _ in results}
+    assert len(jobs) == 1
+    assert sum(shared for _, _, shared in results) == 7
+    assert results[0][0].future.result(timeout=5) is None
+    assert results[0][0].status == "completed"
+    assert runner.runs == 1
+
+def test_shared_job_runs_until_every_requester_cancels(queue):
+    flights = SingleFlight()
+    runner = Gate()
+    leader, leader_token, _ = join(flights, queue, runner)
+    follower, follower_token, shared = join(flights, queue, runner)
+    assert shared and follower is leader and leader.subscribers == 2
+
+    # Repeating a cancel still counts once
+    queue.cancel(leader.id, leader_token)
+    queue.cancel(leader.id, leader_token)
+    assert not leader.cancel_requested()
+
+    queue.cancel(leader.id, follower_token)
+    assert leader.cancel_requested()
+    leader.future.result(timeout=5)
+    assert leader.status == "cancelled"
+
+def test_cancelled_job_is_not_joined(queue):
+    flights = SingleFlight()
+    runner = Gate()
+    job, token, _ = join(flights, queue, runner)
+    queue.cancel(job.id, token)
+
+    fresh, _, shared = join(flights, queue, runner)
+    assert not shared and fresh is not job
+    runner.release.set()
+    fresh.future.result(timeout=5)
+    assert fresh.status == "completed"
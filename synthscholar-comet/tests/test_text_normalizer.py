@@ -0,0 +1,65 @@
+import pytest
+from utils.content_synthesizer import iter_sentences
+from utils.text_normalizer import Segment, TextNormalizer, chunk_segments
+
+@pytest.fixture
+def normalizer():
+    return TextNormalizer()
+
+@pytest.mark.parametrize("text, spoken", [
+    ("Costs rose 12.5% last year.", "Costs rose 12.5 percent last year."),
+    ("Costs rose 5–10% last year.", "Costs rose 5 percent to 10 percent last year."),
+    ("Costs rose 5%-10% last year.", "Costs rose 5 percent to 10 percent last year."),
+    ("A 10x-20x speedup.", "A 10 times to 20 times speedup."),
+    ("Returns fell -5% overall.", "Returns fell minus 5 percent overall."),
+    ("Nights near −3°F.", "Nights near minus 3 degrees Fahrenheit."),
+    ("From -5 to 3°C (-5–3°C).", "From -5 to 3 degrees Celsius (minus 5 degrees Celsius to 3 degrees Celsius)."),
+    ("Trials ran 2020-2024.", "Trials ran 2020 to 2024."),
+    ("Use 100-1500 units.", "Use 100 to 1500 units."),
+    ("Budgets of $3 million and $1,200.", "Budgets of 3 million dollars and 1,200 dollars."),
+])
+def test_quantities_are_spelled_out(normalizer, text, spoken):
+    assert normalizer.clean(text) == spoken
+
+@pytest.mark.parametrize("text", [
+    "Call 555-1234 today.",
+    "Or call 555-123-4567.",
+    "Ticket 0800-123 and part 1234-567.",
+    "Due 2024-05-01 sharp.",
+    "COVID-19 cases and trade-offs.",
+    "About 3.5 million people and 1,200 sites.",
+    "Scores of -5 points.",
+])
+def test_identifiers_and_plain_numbers_are_kept(normalizer, text):
+    assert normalizer.clean(text) == text
+
+@pytest.mark.parametrize("text", [
+    "Dr. Smith said so.",
+    "Mr. and Mrs. Jones agreed with Prof. Lee.",
+    "It was red vs. blue.",
+])
+def test_titles_do_not_end_sentences(normalizer, text):
+    assert normalizer.normalize(text).segments == [Segment(None, [text])]
+
+def test_streamed_sentences_keep_titles():
+    fragments = ["HOST: Dr. Sm", "ith said so. Then ", "Mr. Lee left!\nOk"]
+    assert list(iter_sentences(fragments)) == ["HOST: Dr. Smith said so.", "Then Mr. Lee left!", "Ok"]
+
+def test_sentences_and_speakers_are_split(normalizer):
+    script = 'HOST: "Welcome back. Dr. Smith joins us!"\n\n[Music fades]\nCONCLUSION: **Thanks** 🎙️ for listening.'
+    normalized = normalizer.normalize(script)
+    assert normalized.segments == [
+        Segment("HOST", ['HOST: "Welcome back.', 'Dr. Smith joins us!"']),
+        Segment("CONCLUSION", ["CONCLUSION: Thanks for listening."]),
+    ]
+    assert normalized.text == 'HOST: "Welcome back.\nDr. Smith joins us!"\n\nCONCLUSION: Thanks for listening.'
+
+def test_bullets_become_sentences(normalizer):
+    assert normalizer.normalize("Key points:\n• Cost\n- Speed").segments[0].sentences == [
+        "Key points:", "Cost.", "Speed."
+    ]
+
+def test_chunks_never_span_speakers():
+    segments = [Segment("HOST", ["One two.", "Three four."]), Segment("CONCLUSION", ["Five."])]
+    assert chunk_segments(segments, 10) == ["One two.", "Three four.", "Five."]
+    assert chunk_segments(segments, 100) == ["One two. Three four.", "Five."]
@@ -0,0 +1,68 @@
+import os
+import pytest
+from config import Config
+from utils.topic_index import TopicIndex, tokenize
+
+SECTIONS = [{"sub_query": "overview", "content": "Canned research."}]
+
+@pytest.fixture(scope="module")
+def corpus():
+    return TopicIndex.from_directory(Config.MOCK_CORPUS_DIR)
+
+@pytest.fixture
+def index():
+    index = TopicIndex()
+    index.add("artificial intelligence", SECTIONS, aliases=["ai", "ml"])
+    index.add("climate change", SECTIONS, aliases=["global warming"])
+    index.add("quantum computing", SECTIONS)
+    return index
+
+def test_bundled_corpus_is_loaded(corpus):
+    assert os.path.isdir(Config.MOCK_CORPUS_DIR)
+    assert len(corpus) >= 3
+
+@pytest.mark.parametrize("query, topic", [
+    ("artificial intelligence", "artificial intelligence"),
+    ("Latest AI news", "artificial intelligence"),
+    ("A.I. in healthcare", "artificial intelligence"),
+    ("intelligence artificial", "artificial intelligence"),
+    ("global warming effects", "climate change"),
+    ("quantum computers", "quantum computing"),
+    ("quantum computting", "quantum computing"),
+    ("quantum and classical computing", "quantum computing"),
+])
+def test_matches_names_aliases_and_typos(index, query, topic):
+    match = index.best_match(query)
+    assert match is not None and match.topic == topic
+
+@pytest.mark.parametrize("query", [
+    "How can I grow tomatoes",
+    "I love pizza",
+    "what should I know about gardening",
+    "Me and I",
+])
+def test_pronoun_queries_match_nothing(corpus, query):
+    assert corpus.best_match(query) is None
+
+@pytest.mark.parametrize("query", [
+    "learning to cook",
+    "social networks",
+    "energy drinks",
+    "change management",
+    "computing history",
+    "climate",
+])
+def test_one_word_of_a_longer_name_matches_nothing(corpus, query):
+    assert corpus.best_match(query) is None
+
+def test_synonyms_map_phrases_onto_topics(index):
+    index.add_synonyms({"greenhouse effect": "climate change"})
+    assert index.best_match("the greenhouse effect explained").topic == "climate change"
+
+@pytest.mark.parametrize("phrase", ["a.i.", "I", "ml", "the", "is it"])
+def test_short_or_stopword_synonyms_are_rejected(index, phrase):
+    index.add_synonyms({phrase: "artificial intelligence"})
+    assert index._synonyms == {}
+
+def test_dotted_acronyms_stay_whole():
+    assert tokenize("A.I. and u.s.a.") == ["ai", "usa"]
@@ -0,0 +1,116 @@
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from utils.job_queue import JobCancelled, JobFailed
+from utils.podcast_pipeline import PIPELINE_MODES
+
+logger = logging.getLogger(__name__)
+
+class AsyncPodcastPipeline:
+    """Coroutine version of PodcastPipeline for the ASGI server
+
+    Synthesis is awaited through acreate_podcast_script(), so jobs waiting
+    on the LLM, or on a stage slot, hold no thread at all. Research and
+    audio block (Selenium, gTTS) and run on a small shared executor, never
+    exceeding the stage caps.
+
+    Only the sequential mode is implemented here; the streaming and
+    pipelined modes of PodcastPipeline pass data between threads, so
+    asking for them logs a warning and runs sequentially.
+    """
+
+    def __init__(self, research, synthesizer, audio, mode=None, stage_limits=None, executor=None):
+        self.research = research
+        self.synthesizer = synthesizer
+        self.audio = audio
+        mode = mode or Config.PIPELINE_MODE
+        if mode not in PIPELINE_MODES:
+            raise ValueError(f"Unknown pipeline mode: {mode}")
+        if mode != "sequential":
+            logger.warning(f"⚠️ PIPELINE_MODE={mode} is not supported by the async server, running sequential")
+        self.mode = "sequential"
+        limits = stage_limits if stage_limits is not None else Config.STAGE_CONCURRENCY
+        self._stage_slots = {
+            name: asyncio.BoundedSemaphore(limit) for name, limit in limits.items() if limit
+        }
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=Config.ASYNC_BLOCKING_THREADS,
+            thread_name_prefix="synthscholar-blocking"
+        )
+
+    async def run(self, job):
+        """Produce the podcast for job.topic and return the API result"""
+        topic = job.topic
+
+        async with self._stage(job, "research"):
+            logger.info("🔍 Starting COMET research...")
+            research_data = await self.research_topic(topic)
+            if not research_data:
+                raise JobFailed("Research failed. Please try a different topic.")
+
+        async with self._stage(job, "synthesis"):
+            logger.info("✍️ Synthesizing podcast script...")
+            podcast_script = await self.create_podcast_script(topic, research_data)
+            if not podcast_script:
+                raise JobFailed("Content synthesis failed.")
+            job.publish_event("script", podcast_script)
+
+        async with self._stage(job, "audio"):
+            logger.info("🔊 Generating audio podcast...")
+            on_start = lambda name: job.set_detail("stream_url", f"/api/stream/{name}")
+            audio_file_path = await self.text_to_speech(podcast_script, topic, on_start=on_start)
+            if not audio_file_path:
+                raise JobFailed("Audio generation failed.")
+
+        return {
+            "success": True,
+            "audio_url": f"/api/download/{os.path.basename(audio_file_path)}",
+            "script_preview": podcast_script[:400] + "..." if len(podcast_script) > 400 else podcast_script,
+            "topic": topic,
+            "research_summary": f"Researched {len(research_data)} key aspects",
+            "script_length": len(podcast_script),
+            "demo_mode": True
+        }
+
+    async def research_topic(self, topic):
+        return await self._offload(self.research.research_topic, topic)
+
+    async def create_podcast_script(self, topic, research_data):
+        if hasattr(self.synthesizer, "acreate_podcast_script"):
+            return await self.synthesizer.acreate_podcast_script(topic, research_data)
+        return await self._offload(self.synthesizer.create_podcast_script, topic, research_data)
+
+    async def text_to_speech(self, script, topic, on_start=None):
+        return await self._offload(self.audio.text_to_speech, script, topic, on_start)
+
+    async def _offload(self, fn, *args):
+        future = asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The thread cannot be interrupted; keep its stage slot until it returns
+            await asyncio.wait([future])
+            raise
+
+    @asynccontextmanager
+    async def _stage(self, job, name):
+        """job.stage(name) while holding a slot for that stage"""
+        slots = self._stage_slots.get(name)
+        if slots is not None:
+            await slots.acquire()
+        try:
+            with job.stage(name):
+                try:
+                    yield
+                except asyncio.CancelledError:
+                    # Recorded as a cancelled stage instead of escaping job.stage()
+                    raise JobCancelled(job.id)
+        finally:
+            if slots is not None:
+                slots.release()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,66 +1,168 @@
 import os
-import tempfile
-import logging
-from gtts import gTTS
+import re
+import time
 import uuid
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
+from utils.audio_store import AudioStore
+from utils.audio_stream import StreamRegistry
+from utils.metrics import AUDIO_BYTES, TTS_CHUNK_SECONDS, timed
+from utils.text_normalizer import TextNormalizer, chunk_segments
+from utils.tts_engines import create_engine
 
 logger = logging.getLogger(__name__)
 
+SPEAKER_START = re.compile(r'(?:HOST|CONCLUSION):')
+
 class AudioGenerator:
-    def __init__(self):
+    def __init__(self, store=None, engine=None):
         self.speech_rate = Config.AUDIO_SPEED
+        self.language = Config.AUDIO_LANGUAGE
+        self.store = store or AudioStore()
+        self.engine = engine or create_engine()
+        self.chunk_chars = Config.TTS_CHUNK_CHARS
+        self.executor = ThreadPoolExecutor(max_workers=Config.TTS_WORKERS, thread_name_prefix="tts")
+        self.streams = StreamRegistry()
+        self.normalizer = TextNormalizer()
     
-    def text_to_speech(self, text, topic):
-        """Convert text to speech and return the file path"""
+    @timed("text_to_speech")
+    def text_to_speech(self, text, topic, on_start=None):
+        """Convert text to speech and return the file path
+        
+        on_start(name) is called with the artifact file name once its
+        progressive stream is open (or already open, when another job is
+        rendering the same script), so callers can point listeners at it
+        without a window where the stream does not exist yet.
+        """
         try:
             # Clean the text for better TTS
-            clean_text = self._clean_text_for_speech(text)
+            normalized = self.normalizer.normalize(text)
             
-            # Generate unique filename
-            filename = f"synthscholar_{uuid.uuid4().hex[:8]}.mp3"
-            temp_path = os.path.join(tempfile.gettempdir(), filename)
+            # Identical scripts share one rendered file
+            key = self.store.key_for(normalized.text, self.language, self.speech_rate, self.engine.name)
+            name = os.path.basename(self.store.path_for(key))
+            stream = self.streams.get(name)
+            if on_start is not None and stream is not None and not stream.finished:
+                on_start(name)
+                on_start = None
             
-            logger.info("🔊 Generating audio...")
-            
-            # Create TTS with enhanced settings
-            tts = gTTS(
-                text=clean_text,
-                lang='en',
-                slow=False,
-                lang_check=False
+            audio_path = self.store.get_or_render(
+                key, lambda path: self._render(normalized.segments, path, name, on_start), topic=topic
             )
             
-            # Save audio file
-            tts.save(temp_path)
-            
-            logger.info(f"✅ Audio generated: {temp_path}")
-            return temp_path
+            if audio_path:
+                logger.info(f"✅ Audio ready: {audio_path}")
+            return audio_path
             
         except Exception as e:
             logger.error(f"❌ Audio generation failed: {str(e)}")
             return None
     
-    def _clean_text_for_speech(self, text):
-        """Clean text for better speech synthesis"""
-        # Remove markdown and special characters
-        import re
-        
-        # Remove markdown markers
-        clean_text = re.sub(r'[*#`]', '', text)
-        
-        # Remove excessive newlines
-        clean_text = re.sub(r'\n+', '\n', clean_text)
+    def text_to_speech_stream(self, sentences, topic, on_start=None):
+        """Render audio from an iterator of script sentences as they arrive"""
+        try:
+            segments = self.iter_segments(self.group_sentences(sentences))
+            return self.save_segments(segments, topic, on_start=on_start)
+        except Exception as e:
+            logger.error(f"❌ Streaming audio generation failed: {str(e)}")
+            return None
+    
+    def save_segments(self, segments, topic, on_start=None):
+        """Write MP3 segments to a new artifact as they arrive and return its path
         
-        # Ensure proper sentence spacing
-        clean_text = re.sub(r'\.(?=\w)', '. ', clean_text)
+        The full script is unknown up front, so streamed renders get a random
+        artifact name instead of a content hash and are not deduplicated.
+        Errors from the segment iterator propagate to the caller.
+        """
+        name = f"synthscholar_{uuid.uuid4().hex[:16]}.mp3"
+        path = self.store.new_path(name)
         
-        # Remove any remaining special formatting
-        clean_text = re.sub(r'\[.*?\]', '', clean_text)
-        clean_text = re.sub(r'RESEARCH AREA \d+:', '', clean_text)
+        # Written under a temporary name so downloads and reindex() never see a partial MP3
+        partial_path = f"{path}.{uuid.uuid4().hex[:8]}.part"
+        try:
+            self._write_segments(segments, partial_path, name, on_start)
+            os.replace(partial_path, path)
+        finally:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
         
-        # Add pauses after headings
-        clean_text = clean_text.replace('HOST:', '\n\nHOST:')
-        clean_text = clean_text.replace('CONCLUSION:', '\n\nCONCLUSION:')
+        self.store.register(name, topic)
+        self.store.enforce_quota(keep=path)
+        logger.info(f"✅ Audio ready: {path}")
+        return path
+    
+    def group_sentences(self, sentences):
+        """Clean sentences and pack them into chunks; the first goes out alone"""
+        current = ""
+        first = True
+        for sentence in sentences:
+            text = " ".join(self._clean_text_for_speech(sentence).split())
+            if not text:
+                continue
+            if first:
+                # Get something playable out as early as possible
+                first = False
+                yield text
+                continue
+            if current and (len(current) + 1 + len(text) > self.chunk_chars or SPEAKER_START.match(text)):
+                yield current
+                current = text
+            else:
+                current = f"{current} {text}" if current else text
+        if current:
+            yield current
+    
+    def iter_segments(self, chunks):
+        """Synthesize chunks on the pool and yield MP3 segments in chunk order"""
+        pending = deque()
+        max_pending = Config.TTS_WORKERS * 2
+        try:
+            for chunk in chunks:
+                pending.append(self.executor.submit(self._synthesize_chunk, chunk))
+                # Hand back finished segments early, and stop reading ahead
+                # once enough work is queued (backpressure on the producer)
+                while pending and (pending[0].done() or len(pending) >= max_pending):
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def _render(self, segments, path, name, on_start=None):
+        """Synthesize chunks concurrently and append them to path in script order"""
+        chunks = chunk_segments(segments, self.chunk_chars)
+        logger.info(f"🔊 Generating audio in {len(chunks)} chunks...")
+        self._write_segments(self.iter_segments(chunks), path, name, on_start)
+    
+    def _write_segments(self, segments, path, name, on_start=None):
+        """Append segments to path and to the live stream for name
         
-        return clean_text.strip()
\ No newline at end of file
+        on_start(name) is called as soon as the stream is registered.
+        """
+        stream = self.streams.open(name)
+        try:
+            if on_start is not None:
+                on_start(name)
+            with open(path, 'wb') as f:
+                for segment in segments:
+                    f.write(segment)
+                    stream.append(segment)
+                    AUDIO_BYTES.inc(len(segment))
+        except BaseException:
+            stream.close(failed=True)
+            raise
+        stream.close()
+    
+    def _synthesize_chunk(self, chunk):
+        started = time.perf_counter()
+        try:
+            return self.engine.synthesize(chunk, self.language)
+        finally:
+            TTS_CHUNK_SECONDS.labels(engine=self.engine.name).observe(time.perf_counter() - started)
+    
+    def _clean_text_for_speech(self, text):
+        """Clean text for better speech synthesis"""
+        return self.normalizer.clean(text)
\ No newline at end of file
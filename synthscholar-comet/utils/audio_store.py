@@ -0,0 +1,296 @@
+import os
+import re
+import time
+import uuid
+import sqlite3
+import hashlib
+import logging
+import threading
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_PATTERN = re.compile(r"^synthscholar_([0-9a-f]{16})\.mp3$")
+
+INDEX_FILE = "index.sqlite3"
+
+# Reads only refresh accessed_at when it is older than this, to spare the index writes
+ACCESS_RESOLUTION = 60
+
+def artifact_path(root, name):
+    """Sharded location of an artifact: <root>/ab/cd/synthscholar_abcd....mp3
+
+    Computed from the name alone, so finding an artifact never scans a
+    directory. Returns None for names that are not artifact ids.
+    """
+    match = ARTIFACT_PATTERN.match(name or "")
+    if match is None:
+        return None
+    digest = match.group(1)
+    return os.path.join(root, digest[:2], digest[2:4], name)
+
+class AudioStore:
+    """Managed store for rendered podcast audio
+
+    Artifacts are keyed by a hash of the cleaned script and voice settings,
+    live in a two-level sharded layout under root and are tracked in a
+    SQLite metadata index (topic, size, created, last access) shared by all
+    processes using the same root. A background collector expires
+    artifacts not read for ttl seconds and evicts least recently used ones
+    beyond max_bytes.
+    """
+
+    def __init__(self, root=None, max_bytes=None, ttl=None, gc_interval=None):
+        self.root = root or Config.AUDIO_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else Config.AUDIO_CACHE_MAX_BYTES
+        self.ttl = ttl if ttl is not None else Config.AUDIO_TTL
+        self.gc_interval = gc_interval if gc_interval is not None else Config.AUDIO_GC_INTERVAL
+        os.makedirs(self.root, exist_ok=True)
+
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._stats = {"hits": 0, "renders": 0, "coalesced": 0, "evictions": 0, "expirations": 0}
+        self._stop = threading.Event()
+        self._collector = None
+
+        self._conn = sqlite3.connect(os.path.join(self.root, INDEX_FILE), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS artifacts ("
+            "name TEXT PRIMARY KEY, topic TEXT, size INTEGER NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS artifacts_accessed ON artifacts (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def key_for(text, language, speed, engine="gtts"):
+        material = f"{engine}\0{language}\0{speed}\0{text}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def name_for(key):
+        return f"synthscholar_{key[:16]}.mp3"
+
+    def path_for(self, key):
+        return artifact_path(self.root, self.name_for(key))
+
+    def path_for_name(self, name):
+        """Where artifact name lives (whether or not it exists yet); None for invalid names"""
+        return artifact_path(self.root, name)
+
+    def new_path(self, name):
+        """path_for_name() with its shard directories created, for writing"""
+        path = self.path_for_name(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def resolve(self, name):
+        """Path of a stored artifact, marking it as used; None if missing or invalid"""
+        path = self.path_for_name(name)
+        if path is None or not os.path.exists(path):
+            return None
+        self._touch(name)
+        return path
+
+    def get_or_render(self, key, render, topic=None):
+        """Return the stored file for key, calling render(path) at most once per key"""
+        name = self.name_for(key)
+        path = self.path_for(key)
+        if os.path.exists(path):
+            self._touch(name)
+            self._count("hits")
+            return path
+
+        with self._lock:
+            done = self._inflight.get(key)
+            leader = done is None
+            if leader:
+                done = self._inflight[key] = threading.Event()
+
+        if not leader:
+            # Another request is already rendering this script; share its file
+            self._count("coalesced")
+            done.wait()
+            return path if os.path.exists(path) else None
+
+        try:
+            # A finished file that appeared while we were waiting for the lock
+            if os.path.exists(path):
+                self._touch(name)
+                self._count("hits")
+                return path
+
+            partial_path = f"{self.new_path(name)}.{uuid.uuid4().hex[:8]}.part"
+            try:
+                render(partial_path)
+                os.replace(partial_path, path)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+
+            self._count("renders")
+            self.register(name, topic)
+            self.enforce_quota(keep=path)
+            return path
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            done.set()
+
+    def register(self, name, topic=None):
+        """Record a finished artifact in the index"""
+        path = self.path_for_name(name)
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts (name, topic, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (name, topic, os.path.getsize(path), now, now)
+            )
+            self._conn.commit()
+
+    def metadata(self, name):
+        """Index entry for name as a dict, or None"""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT name, topic, size, created_at, accessed_at FROM artifacts WHERE name = ?", (name,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("name", "topic", "size", "created_at", "accessed_at"), row))
+
+    def usage(self):
+        with self._db_lock:
+            count, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifacts").fetchone()
+        return {"artifacts": count, "bytes": size, "max_bytes": self.max_bytes}
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def enforce_quota(self, keep=None):
+        """Delete least recently used artifacts until the store fits max_bytes"""
+        if not self.max_bytes:
+            return
+        keep_name = os.path.basename(keep) if keep else None
+        with self._db_lock:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM artifacts").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = self._conn.execute(
+                "SELECT name, size FROM artifacts ORDER BY accessed_at"
+            ).fetchall()
+
+        victims = []
+        for name, size in rows:
+            if total <= self.max_bytes:
+                break
+            if name == keep_name:
+                continue
+            victims.append(name)
+            total -= size
+        self._remove(victims, "evictions")
+
+    def expire(self):
+        """Delete artifacts nobody has read for ttl seconds"""
+        if not self.ttl:
+            return
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT name FROM artifacts WHERE accessed_at < ?", (time.time() - self.ttl,)
+            ).fetchall()
+        self._remove([name for name, in rows], "expirations")
+
+    def collect(self):
+        """One garbage collection pass: TTL expiry, then the disk quota"""
+        try:
+            self.expire()
+            self.enforce_quota()
+        except Exception as e:
+            logger.error(f"❌ Audio store cleanup failed: {str(e)}")
+
+    def reindex(self):
+        """Reconcile the index with the disk
+
+        Adopts artifacts missing from the index (including ones left flat in
+        root by older versions, which are moved into their shard), drops
+        index rows whose file is gone and removes stale partial renders.
+        """
+        indexed = set()
+        with self._db_lock:
+            rows = self._conn.execute("SELECT name FROM artifacts").fetchall()
+        for name, in rows:
+            if os.path.exists(self.path_for_name(name)):
+                indexed.add(name)
+            else:
+                self._delete_row(name)
+
+        stale_before = time.time() - 3600
+        for directory, _, files in os.walk(self.root):
+            for file_name in files:
+                path = os.path.join(directory, file_name)
+                if file_name.endswith(".part"):
+                    if os.path.getmtime(path) < stale_before:
+                        os.remove(path)
+                    continue
+                if not ARTIFACT_PATTERN.match(file_name) or file_name in indexed:
+                    continue
+                target = self.new_path(file_name)
+                if path != target:
+                    os.replace(path, target)
+                self.register(file_name)
+                indexed.add(file_name)
+
+    def start(self):
+        """Reindex once, then collect garbage every gc_interval seconds in the background"""
+        if self._collector is not None:
+            return self
+        self.reindex()
+        self.collect()
+        if self.gc_interval:
+            self._collector = threading.Thread(target=self._collect_loop, name="audio-gc", daemon=True)
+            self._collector.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._collector is not None:
+            self._collector.join()
+            self._collector = None
+
+    def _collect_loop(self):
+        while not self._stop.wait(self.gc_interval):
+            self.collect()
+
+    def _touch(self, name):
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute(
+                "UPDATE artifacts SET accessed_at = ? WHERE name = ? AND accessed_at < ?",
+                (now, name, now - ACCESS_RESOLUTION)
+            )
+            self._conn.commit()
+
+    def _remove(self, names, counter):
+        for name in names:
+            try:
+                os.remove(self.path_for_name(name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"⚠️ Could not delete audio {name}: {str(e)}")
+                continue
+            self._delete_row(name)
+            self._count(counter)
+            logger.info(f"🗑️ Removed cached audio ({counter}): {name}")
+
+    def _delete_row(self, name):
+        with self._db_lock:
+            self._conn.execute("DELETE FROM artifacts WHERE name = ?", (name,))
+            self._conn.commit()
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
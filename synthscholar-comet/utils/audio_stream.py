@@ -0,0 +1,81 @@
+import time
+import threading
+from config import Config
+
+class AudioStream:
+    """MP3 bytes of a render in progress, readable while segments are still arriving"""
+
+    def __init__(self, name):
+        self.name = name
+        self.finished = False
+        self.failed = False
+        self.finished_at = None
+        self._buffer = bytearray()
+        self._cond = threading.Condition()
+
+    @property
+    def size(self):
+        return len(self._buffer)
+
+    def append(self, data):
+        with self._cond:
+            self._buffer.extend(data)
+            self._cond.notify_all()
+
+    def close(self, failed=False):
+        with self._cond:
+            self.finished = True
+            self.failed = failed
+            self.finished_at = time.time()
+            self._cond.notify_all()
+
+    def read(self, start, end=None):
+        """Bytes rendered so far in [start, end)"""
+        with self._cond:
+            return bytes(self._buffer[start:end])
+
+    def wait_for(self, size, timeout=None):
+        """Block until at least size bytes exist or the render ends"""
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self._buffer) >= size or self.finished, timeout)
+
+    def iter_bytes(self, start=0, timeout=None):
+        """Yield bytes from start onwards as they are rendered"""
+        timeout = timeout or Config.STREAM_WAIT_TIMEOUT
+        offset = start
+        while True:
+            if not self.wait_for(offset + 1, timeout):
+                return
+            data = self.read(offset)
+            if data:
+                offset += len(data)
+                yield data
+            elif self.finished:
+                return
+
+class StreamRegistry:
+    """Renders in progress by artifact name, kept briefly after they finish"""
+
+    def __init__(self, retention=60):
+        self.retention = retention
+        self._streams = {}
+        self._lock = threading.Lock()
+
+    def open(self, name):
+        with self._lock:
+            self._prune()
+            stream = self._streams[name] = AudioStream(name)
+            return stream
+
+    def get(self, name):
+        with self._lock:
+            return self._streams.get(name)
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        expired = [
+            name for name, stream in self._streams.items()
+            if stream.finished and stream.finished_at < cutoff
+        ]
+        for name in expired:
+            del self._streams[name]
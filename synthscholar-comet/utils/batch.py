@@ -0,0 +1,290 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from config import Config
+from utils.audio_generator import AudioGenerator
+from utils.audio_store import artifact_path
+from utils.cache import normalize_topic
+from utils.content_synthesizer import ContentSynthesizer
+from utils.job_queue import JobQueue, QueueFullError
+from utils.podcast_pipeline import PodcastPipeline
+
+logger = logging.getLogger(__name__)
+
+class BatchRunner:
+    """Feed many topics through a shared JobQueue and keep a manifest of the results
+
+    At most max_in_flight topics of the batch sit in the queue at once, so a
+    large batch never crowds out interactive requests. The manifest is
+    rewritten after every finished topic; running the same manifest again
+    skips topics whose audio is still on disk.
+    """
+
+    def __init__(self, job_queue, runner, manifest_path, submit=None, max_in_flight=None, batch_id=None):
+        self.job_queue = job_queue
+        self.runner = runner
+        self.manifest_path = manifest_path
+        # submit(topic) -> (job, attachment token); the default queues a job of our own
+        self.submit = submit or self._submit
+        self.max_in_flight = max_in_flight or Config.BATCH_MAX_IN_FLIGHT
+        self.thread = None
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        # future -> (item, job, token) for topics submitted and not yet recorded
+        self._in_flight = {}
+        self._manifest = self._load() or {
+            "batch_id": batch_id or uuid.uuid4().hex,
+            "status": "running",
+            "created_at": time.time(),
+            "updated_at": time.time(),
+            "items": [],
+        }
+
+    @property
+    def batch_id(self):
+        return self._manifest["batch_id"]
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def add_topics(self, topics):
+        """Append topics that are not in the manifest yet; returns how many were new"""
+        with self._lock:
+            known = {item["key"] for item in self._manifest["items"]}
+            added = 0
+            for topic in topics:
+                key = normalize_topic(topic)
+                if not key or key in known:
+                    continue
+                known.add(key)
+                self._manifest["items"].append(self._new_item(topic, key))
+                added += 1
+        return added
+
+    def run(self, topics=()):
+        """Process every unfinished topic and return the final manifest"""
+        self.add_topics(topics)
+        pending = deque(self._claim_pending())
+        in_flight = self._in_flight
+        cancelling = False
+        logger.info(f"📦 Batch {self.batch_id}: {len(pending)} topics to process")
+
+        while pending or in_flight:
+            if self._cancel_event.is_set() and not cancelling:
+                # Cancel once: shared jobs only drop this batch as a subscriber
+                cancelling = True
+                pending.clear()
+                self._cancel_in_flight()
+
+            while pending and len(in_flight) < self.max_in_flight:
+                item = pending[0]
+                try:
+                    job, token = self.submit(item["topic"])
+                except QueueFullError:
+                    break
+                pending.popleft()
+                self._update(item, status="running", job_id=job.id, started_at=time.time(),
+                             attempts=item["attempts"] + 1)
+                with self._lock:
+                    in_flight[job.future] = (item, job, token)
+
+            if not in_flight:
+                # The shared queue is full of other work; try again shortly
+                time.sleep(1)
+                continue
+
+            finished, _ = wait(list(in_flight), timeout=1, return_when=FIRST_COMPLETED)
+            for future in finished:
+                with self._lock:
+                    item, job, _ = in_flight.pop(future)
+                self._record(item, job)
+
+        with self._lock:
+            self._manifest["status"] = "cancelled" if self._cancel_event.is_set() else "completed"
+        self._save()
+        logger.info(f"📦 Batch {self.batch_id} {self._manifest['status']}: {self.summary()}")
+        return self.manifest()
+
+    def start(self, topics=()):
+        """Run the batch in a background thread"""
+        self.thread = threading.Thread(
+            target=self._run_safely, args=(list(topics),),
+            name=f"batch-{self.batch_id}", daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        """Stop submitting topics and cancel the ones already queued or running
+
+        The jobs are cancelled here rather than by run(), so this also works
+        when run() was interrupted (Ctrl-C in batch_research.py).
+        """
+        self._cancel_event.set()
+        self._cancel_in_flight()
+
+    def manifest(self):
+        with self._lock:
+            manifest = json.loads(json.dumps(self._manifest))
+        manifest["summary"] = self.summary()
+        return manifest
+
+    def summary(self):
+        with self._lock:
+            counts = {"total": len(self._manifest["items"])}
+            for item in self._manifest["items"]:
+                counts[item["status"]] = counts.get(item["status"], 0) + 1
+        return counts
+
+    def _submit(self, topic):
+        job = self.job_queue.submit(topic, self.runner)
+        return job, job.token
+
+    def _run_safely(self, topics):
+        try:
+            self.run(topics)
+        except Exception as e:
+            logger.error(f"❌ Batch {self.batch_id} crashed: {str(e)}")
+        finally:
+            self.finished_at = time.time()
+
+    def _new_item(self, topic, key):
+        return {
+            "topic": topic,
+            "key": key,
+            "status": "pending",
+            "job_id": None,
+            "audio_file": None,
+            "audio_url": None,
+            "script_length": None,
+            "error": None,
+            "attempts": 0,
+            "started_at": None,
+            "finished_at": None,
+        }
+
+    def _claim_pending(self):
+        """Items that still need a run; completed ones only count if their audio survived"""
+        todo = []
+        with self._lock:
+            self._manifest["status"] = "running"
+            for item in self._manifest["items"]:
+                if item["status"] == "completed" and self._audio_exists(item):
+                    continue
+                item["status"] = "pending"
+                todo.append(item)
+        self._save()
+        return todo
+
+    def _audio_exists(self, item):
+        path = artifact_path(Config.AUDIO_DIR, item["audio_file"])
+        return bool(path) and os.path.exists(path)
+
+    def _record(self, item, job):
+        if job.status == "completed" and job.result:
+            audio_url = job.result["audio_url"]
+            self._update(
+                item,
+                status="completed",
+                audio_url=audio_url,
+                audio_file=os.path.basename(audio_url),
+                script_length=job.result.get("script_length"),
+                error=None,
+                finished_at=time.time()
+            )
+        else:
+            status = job.status if job.status in ("failed", "cancelled") else "cancelled"
+            self._update(item, status=status, error=job.error, finished_at=time.time())
+        self._save()
+
+    def _cancel_in_flight(self):
+        # Cancelling twice with the same token counts once
+        with self._lock:
+            jobs = [(job, token) for _, job, token in self._in_flight.values()]
+        for job, token in jobs:
+            self.job_queue.cancel(job.id, token)
+
+    def _update(self, item, **fields):
+        with self._lock:
+            item.update(fields)
+            self._manifest["updated_at"] = time.time()
+
+    def _load(self):
+        if not os.path.exists(self.manifest_path):
+            return None
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            logger.info(f"📦 Resuming batch {manifest['batch_id']} from {self.manifest_path}")
+            return manifest
+        except Exception as e:
+            logger.error(f"❌ Could not read batch manifest {self.manifest_path}: {str(e)}")
+            return None
+
+    def _save(self):
+        """Write the manifest atomically so a crash never leaves it half written"""
+        manifest = self.manifest()
+        directory = os.path.dirname(os.path.abspath(self.manifest_path))
+        os.makedirs(directory, exist_ok=True)
+        partial = f"{self.manifest_path}.part"
+        with open(partial, "w") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(partial, self.manifest_path)
+
+def run_batch(topics, manifest_path, research, synthesizer=None, audio=None, mode=None, workers=None):
+    """Blocking Python API: build a pipeline from the components and process topics"""
+    pipeline = PodcastPipeline(
+        research,
+        synthesizer or ContentSynthesizer(),
+        audio or AudioGenerator(),
+        mode=mode
+    )
+    job_queue = JobQueue(max_workers=workers)
+    try:
+        runner = BatchRunner(job_queue, pipeline.run, manifest_path, max_in_flight=job_queue.max_workers)
+        return runner.run(topics)
+    finally:
+        job_queue.shutdown()
+
+class BatchRegistry:
+    """Batch runners started by this process, by batch id
+
+    Finished runners are forgotten retention seconds after they end; their
+    manifest on disk still answers status requests and resumes the batch.
+    """
+
+    def __init__(self, retention=None):
+        self.retention = retention if retention is not None else Config.BATCH_RETENTION
+        self._runners = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._runners)
+
+    def get(self, batch_id):
+        with self._lock:
+            self._prune()
+            return self._runners.get(batch_id)
+
+    def add(self, runner):
+        with self._lock:
+            self._prune()
+            self._runners[runner.batch_id] = runner
+        return runner
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        expired = [
+            batch_id for batch_id, runner in self._runners.items()
+            if runner.finished_at is not None and runner.finished_at < cutoff
+        ]
+        for batch_id in expired:
+            del self._runners[batch_id]
@@ -0,0 +1,257 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class MemoryCache:
+    """In-process LRU cache with optional per-entry TTL"""
+
+    def __init__(self, max_entries=256, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+class SQLiteCache:
+    """On-disk JSON cache with TTL expiry, shareable between worker processes
+
+    With max_entries set, the least recently read entries are dropped once
+    the table grows past the limit.
+    """
+
+    def __init__(self, path, ttl=None, max_entries=None):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, expires_at REAL, accessed_at REAL)"
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(cache)")]
+        if "accessed_at" not in columns:
+            self._conn.execute("ALTER TABLE cache ADD COLUMN accessed_at REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed ON cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            if self.max_entries:
+                self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+        return json.loads(value)
+
+    def set(self, key, value):
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now, expires_at, now)
+            )
+            if self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key IN ("
+                    "SELECT key FROM cache ORDER BY COALESCE(accessed_at, created_at) DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                )
+            self._conn.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def purge_expired(self):
+        """Drop expired rows and return how many were removed"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+class TieredCache:
+    """Memory tier in front of an optional disk tier, with hit/miss statistics"""
+
+    def __init__(self, memory, disk=None):
+        self.memory = memory
+        self.disk = disk
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0}
+        self._stats_lock = threading.Lock()
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("memory_hits")
+            return value
+
+        if self.disk is not None:
+            try:
+                value = self.disk.get(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Disk cache read failed: {str(e)}")
+                value = None
+            if value is not None:
+                self.memory.set(key, value)
+                self._count("disk_hits")
+                return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key, value):
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value)
+            except Exception as e:
+                logger.warning(f"⚠️ Disk cache write failed: {str(e)}")
+        self._count("writes")
+
+    def delete(self, key):
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        stats["memory_entries"] = len(self.memory)
+        return stats
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+def normalize_topic(topic):
+    """Lowercase, drop punctuation and collapse whitespace so near-identical topics share a key"""
+    topic = re.sub(r"[^\w\s]", " ", topic.lower())
+    return " ".join(topic.split())
+
+class ResearchCache(TieredCache):
+    """Research results keyed by normalized topic and the sub-query templates"""
+
+    @classmethod
+    def from_config(cls):
+        memory = MemoryCache(max_entries=Config.RESEARCH_CACHE_SIZE, ttl=Config.RESEARCH_CACHE_TTL)
+        disk = None
+        if Config.RESEARCH_CACHE_PATH:
+            try:
+                disk = SQLiteCache(Config.RESEARCH_CACHE_PATH, ttl=Config.RESEARCH_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f"⚠️ Research disk cache unavailable: {str(e)}")
+        return cls(memory, disk)
+
+    @staticmethod
+    def key_for(topic, templates):
+        material = normalize_topic(topic) + "\n" + "\n".join(templates)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get_research(self, topic, templates):
+        research_data = self.get(self.key_for(topic, templates))
+        if research_data is None:
+            return None
+        # Hand out copies so callers cannot mutate the cached sections
+        return [dict(item) for item in research_data]
+
+    def put_research(self, topic, templates, research_data):
+        self.set(self.key_for(topic, templates), [dict(item) for item in research_data])
+
+class SynthesisCache(TieredCache):
+    """LLM completions keyed by everything that determines the model's answer"""
+
+    @classmethod
+    def from_config(cls):
+        memory = MemoryCache(max_entries=Config.SYNTHESIS_CACHE_SIZE, ttl=Config.SYNTHESIS_CACHE_TTL)
+        disk = None
+        if Config.SYNTHESIS_CACHE_PATH:
+            try:
+                disk = SQLiteCache(
+                    Config.SYNTHESIS_CACHE_PATH,
+                    ttl=Config.SYNTHESIS_CACHE_TTL,
+                    max_entries=Config.SYNTHESIS_CACHE_DISK_ENTRIES
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Synthesis disk cache unavailable: {str(e)}")
+        return cls(memory, disk)
+
+    @staticmethod
+    def key_for(model, system_prompt, prompt, temperature, max_tokens):
+        material = json.dumps([model, system_prompt, prompt, temperature, max_tokens])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
@@ -0,0 +1,153 @@
+import re
+import heapq
+import logging
+from collections import Counter
+from config import Config
+from utils.metrics import RESEARCH_TOKENS
+
+logger = logging.getLogger(__name__)
+
+PARAGRAPH_BREAK = re.compile(r'\s*\n\s*')
+WORD = re.compile(r'\w+')
+SENTENCE_END = re.compile(r'[.!?](?=\s)')
+
+SHINGLE_SIZE = 5  # words per shingle
+SKETCH_SIZE = 64  # smallest shingle hashes kept per paragraph (bottom-k MinHash)
+MIN_DEDUP_WORDS = 4  # shorter paragraphs (headings, list stubs) are never treated as repeats
+CHARS_PER_TOKEN = 4  # rough English average, close enough for budgeting
+MIN_TRIMMED_TOKENS = 20  # a paragraph cut shorter than this is dropped instead
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def sketch(text, shingle_size=SHINGLE_SIZE, sketch_size=SKETCH_SIZE):
+    """Bottom-k MinHash sketch of the word shingles of text, or None when too short
+
+    Sketches use the process-local hash() and are never stored.
+    """
+    words = WORD.findall(text.lower())
+    if len(words) < MIN_DEDUP_WORDS:
+        return None
+    if len(words) <= shingle_size:
+        hashes = {hash(tuple(words))}
+    else:
+        hashes = {hash(tuple(words[i:i + shingle_size])) for i in range(len(words) - shingle_size + 1)}
+    return frozenset(heapq.nsmallest(sketch_size, hashes))
+
+def similarity(a, b, sketch_size=SKETCH_SIZE):
+    """Estimated Jaccard similarity of the shingle sets behind two sketches"""
+    union = heapq.nsmallest(sketch_size, a | b)
+    return sum(1 for value in union if value in a and value in b) / len(union)
+
+class NearDuplicateFilter:
+    """Remembers paragraphs and recognises near-copies of ones seen before
+
+    Kept sketches are indexed by their hash values, so a new paragraph is
+    only compared with paragraphs it shares at least one value with.
+    """
+
+    def __init__(self, threshold=None):
+        self.threshold = Config.RESEARCH_DEDUP_THRESHOLD if threshold is None else threshold
+        self._sketches = []
+        self._index = {}
+        self.dropped = 0
+
+    def keep(self, paragraph):
+        """True for a new paragraph (which is remembered), False for a repeat"""
+        if not self.threshold:
+            return True
+        signature = sketch(paragraph)
+        if signature is None:
+            return True
+
+        shared = Counter(kept for value in signature for kept in self._index.get(value, ()))
+        for kept, count in shared.items():
+            other = self._sketches[kept]
+            # The estimate can never exceed this bound, so skip the exact check
+            if count < self.threshold * min(len(signature), len(other)):
+                continue
+            if similarity(signature, other) >= self.threshold:
+                self.dropped += 1
+                return False
+
+        position = len(self._sketches)
+        self._sketches.append(signature)
+        for value in signature:
+            self._index.setdefault(value, []).append(position)
+        return True
+
+def fair_shares(sizes, budget):
+    """Split budget so no size gets more than it needs and the rest is shared evenly"""
+    shares = [0] * len(sizes)
+    remaining = budget
+    order = sorted(range(len(sizes)), key=sizes.__getitem__)
+    for position, index in enumerate(order):
+        shares[index] = min(sizes[index], remaining // (len(sizes) - position))
+        remaining -= shares[index]
+    return shares
+
+def trim(paragraphs, budget):
+    """Leading paragraphs within budget tokens, the last one cut at a sentence or word end"""
+    kept = []
+    for paragraph in paragraphs:
+        tokens = estimate_tokens(paragraph)
+        if tokens <= budget:
+            kept.append(paragraph)
+            budget -= tokens
+            continue
+        if budget >= MIN_TRIMMED_TOKENS:
+            cut = paragraph[:budget * CHARS_PER_TOKEN - 1]
+            ends = [match.end() for match in SENTENCE_END.finditer(cut + " ")]
+            if ends and ends[-1] > len(cut) // 2:
+                kept.append(cut[:ends[-1]])
+            else:
+                kept.append(cut.rsplit(None, 1)[0] + "…")
+        break
+    return kept
+
+def new_paragraphs(text, duplicates):
+    """Paragraphs of text that the NearDuplicateFilter has not seen yet"""
+    return [paragraph for paragraph in PARAGRAPH_BREAK.split(text.strip()) if paragraph and duplicates.keep(paragraph)]
+
+def compact_section(section, duplicates, token_budget=0):
+    """Copy of section without paragraphs duplicates has seen, trimmed to token_budget (0 = no limit)
+
+    Returns None when nothing new is left.
+    """
+    paragraphs = new_paragraphs(section['content'], duplicates)
+    if token_budget:
+        paragraphs = trim(paragraphs, token_budget)
+    if not paragraphs:
+        return None
+    return dict(section, content="\n".join(paragraphs))
+
+def compact_research(research_data, threshold=None, token_budget=None):
+    """Drop paragraphs repeated across research sections and fit the rest into a token budget
+
+    Sections are read in order, so the first copy of a paragraph is the one
+    kept. The budget (Config.RESEARCH_TOKEN_BUDGET, 0 = no limit) is shared
+    fairly: sections that need less than an even share keep everything and
+    the remainder goes to the longer ones, each cut from its end. Sections
+    with nothing left are dropped.
+    """
+    token_budget = Config.RESEARCH_TOKEN_BUDGET if token_budget is None else token_budget
+    duplicates = NearDuplicateFilter(threshold)
+    scraped = sum(estimate_tokens(item['content']) for item in research_data)
+
+    sections = [(item, new_paragraphs(item['content'], duplicates)) for item in research_data]
+    sections = [(item, paragraphs) for item, paragraphs in sections if paragraphs]
+    if token_budget:
+        sizes = [sum(estimate_tokens(paragraph) for paragraph in paragraphs) for _, paragraphs in sections]
+        shares = fair_shares(sizes, token_budget)
+        sections = [(item, trim(paragraphs, share)) for (item, paragraphs), share in zip(sections, shares)]
+
+    compacted = [dict(item, content="\n".join(paragraphs)) for item, paragraphs in sections if paragraphs]
+    kept = sum(estimate_tokens(item['content']) for item in compacted)
+    RESEARCH_TOKENS.labels(stage="scraped").inc(scraped)
+    RESEARCH_TOKENS.labels(stage="kept").inc(kept)
+    if kept < scraped:
+        logger.info(
+            f"✂️ Research compacted from ~{scraped} to ~{kept} tokens "
+            f"({duplicates.dropped} repeated paragraphs dropped)"
+        )
+    return compacted
@@ -0,0 +1,150 @@
+import logging
+from selenium.common.exceptions import WebDriverException
+from config import Config
+from utils.extraction import EXTRACT_JS, ContentExtractor
+
+logger = logging.getLogger(__name__)
+
+# Shared by every script: window.__synthscholarWatch records the time of the
+# last DOM mutation and lets a waiting script hook the next one
+_WATCH_JS = EXTRACT_JS + """
+function ensureWatch() {
+    let watch = window.__synthscholarWatch;
+    if (!watch) {
+        watch = window.__synthscholarWatch = {last: performance.now(), baseline: null, listener: null};
+        new MutationObserver(() => {
+            watch.last = performance.now();
+            if (watch.listener) {
+                watch.listener();
+            }
+        }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+    }
+    return watch;
+}
+
+// Resolve once nothing has changed for quietMs and ready() holds; give up after timeoutMs
+function whenQuiet(watch, quietMs, timeoutMs, ready, done) {
+    let timer = null;
+    const finish = (settled) => {
+        clearTimeout(timer);
+        clearTimeout(deadline);
+        watch.listener = null;
+        done(settled);
+    };
+    const schedule = () => {
+        clearTimeout(timer);
+        const wait = Math.max(0, quietMs - (performance.now() - watch.last));
+        timer = setTimeout(() => {
+            if (performance.now() - watch.last < quietMs) {
+                schedule();
+            } else if (ready()) {
+                finish(true);
+            }
+            // Otherwise stay idle until the next mutation reschedules us
+        }, wait);
+    };
+    const deadline = setTimeout(() => finish(false), timeoutMs);
+    watch.listener = schedule;
+    schedule();
+}
+"""
+
+_ARM_JS = _WATCH_JS + """
+const watch = ensureWatch();
+const current = extractAnswer(arguments[0], arguments[1], arguments[2]);
+watch.baseline = current ? current.text : null;
+watch.last = performance.now();
+"""
+
+_WAIT_ANSWER_JS = _WATCH_JS + """
+const [strategies, minLength, maxLinks, quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const watch = window.__synthscholarWatch;
+if (!watch) {
+    done({answer: null, settled: false, armed: false});
+} else {
+    const fresh = () => {
+        const answer = extractAnswer(strategies, minLength, maxLinks);
+        return answer && answer.text !== watch.baseline ? answer : null;
+    };
+    whenQuiet(watch, quietMs, timeoutMs, () => fresh() !== null, (settled) => {
+        done({answer: fresh(), settled: settled, armed: true});
+    });
+}
+"""
+
+_WAIT_QUIET_JS = _WATCH_JS + """
+const [quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+whenQuiet(ensureWatch(), quietMs, timeoutMs, () => document.readyState === 'complete', done);
+"""
+
+# Framework-managed inputs (React) ignore a plain .value assignment, so go
+# through the native setter and announce the change
+_SET_VALUE_JS = """
+const [element, value] = arguments;
+const prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+element.focus();
+"""
+
+class CompletionDetector:
+    """Waits for streamed answers using a MutationObserver inside the page
+
+    arm() snapshots the current answer before a query is submitted; wait()
+    then returns as soon as a different answer has existed unchanged for the
+    stability window, instead of sleeping for a fixed time.
+    """
+
+    def __init__(self, stable_seconds=None, page_quiet_seconds=None, timeout=None, extractor=None):
+        self.stable_seconds = Config.RESEARCH_STABLE_SECONDS if stable_seconds is None else stable_seconds
+        self.page_quiet_seconds = Config.PAGE_QUIET_SECONDS if page_quiet_seconds is None else page_quiet_seconds
+        self.timeout = Config.RESEARCH_TIMEOUT if timeout is None else timeout
+        self.extractor = extractor or ContentExtractor()
+
+    def arm(self, driver):
+        """Start watching the page and remember the answer already shown"""
+        try:
+            driver.execute_script(_ARM_JS, *self.extractor.script_args())
+            return True
+        except WebDriverException as e:
+            logger.warning(f"⚠️ Could not install answer observer: {str(e)}")
+            return False
+
+    def submit(self, driver, element, text, submit_key):
+        """Fill element in one call and press submit_key"""
+        driver.execute_script(_SET_VALUE_JS, element, text)
+        element.send_keys(submit_key)
+
+    def wait(self, driver, timeout=None):
+        """(extracted answer or None, settled) once the answer stops changing
+
+        The answer is the ContentExtractor dict, read in the same script.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        result = self._run_async(
+            driver, timeout, _WAIT_ANSWER_JS,
+            *self.extractor.script_args(), int(self.stable_seconds * 1000), int(timeout * 1000)
+        )
+        if not result or not result.get("armed"):
+            return None, False
+        return result.get("answer"), bool(result.get("settled"))
+
+    def wait_for_quiet(self, driver, quiet_seconds=None, timeout=None):
+        """True once the page has loaded and stopped mutating for quiet_seconds"""
+        quiet_seconds = self.page_quiet_seconds if quiet_seconds is None else quiet_seconds
+        timeout = self.timeout if timeout is None else timeout
+        return bool(self._run_async(
+            driver, timeout, _WAIT_QUIET_JS, int(quiet_seconds * 1000), int(timeout * 1000)
+        ))
+
+    def _run_async(self, driver, timeout, script, *args):
+        try:
+            # The script resolves itself at timeout; the margin only covers a hung page
+            driver.set_script_timeout(timeout + 5)
+            return driver.execute_async_script(script, *args)
+        except WebDriverException as e:
+            logger.warning(f"⚠️ Completion script failed: {str(e)}")
+            return None
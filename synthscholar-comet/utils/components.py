@@ -0,0 +1,89 @@
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class ComponentRegistry:
+    """Builds application components on first use instead of at import
+
+    register() records a factory; get() runs it once, even when several
+    threads ask at the same time, and returns the same instance afterwards.
+    Factories may get() other components. prewarm() builds components on a
+    background thread so the first request does not pay for them.
+    """
+
+    def __init__(self):
+        self._factories = {}
+        self._instances = {}
+        self._build_seconds = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, factory):
+        with self._lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.Lock())
+
+    def get(self, name):
+        instance = self._instances.get(name, _MISSING)
+        if instance is not _MISSING:
+            return instance
+
+        with self._lock:
+            if name not in self._factories:
+                raise KeyError(f"Unknown component: {name}")
+            lock = self._locks[name]
+
+        with lock:
+            instance = self._instances.get(name, _MISSING)
+            if instance is _MISSING:
+                started = time.perf_counter()
+                instance = self._factories[name]()
+                self._build_seconds[name] = time.perf_counter() - started
+                self._instances[name] = instance
+                logger.info(f"✅ Built {name} in {self._build_seconds[name] * 1000:.0f} ms")
+            return instance
+
+    def peek(self, name):
+        """The instance if it has been built, otherwise None (never builds)"""
+        return self._instances.get(name)
+
+    def set(self, name, instance):
+        """Replace a component, built or not"""
+        with self._lock:
+            self._factories.setdefault(name, lambda: instance)
+            self._locks.setdefault(name, threading.Lock())
+        self._instances[name] = instance
+
+    def __contains__(self, name):
+        return name in self._factories
+
+    def prewarm(self, names=None, background=True):
+        """Build names (default: every registered component), on a daemon thread unless background=False"""
+        names = list(self._factories) if names is None else list(names)
+
+        def build():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.error(f"❌ Could not prewarm {name}: {str(e)}")
+
+        if not background:
+            build()
+            return None
+        thread = threading.Thread(target=build, name="component-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        """Build time in ms per component, None for ones not built yet"""
+        with self._lock:
+            names = list(self._factories)
+        return {
+            name: round(self._build_seconds[name] * 1000, 1) if name in self._build_seconds else None
+            for name in names
+        }
@@ -1,64 +1,276 @@
-import openai
+import re
 import logging
 from config import Config
+from utils.cache import SynthesisCache
+from utils.compaction import NearDuplicateFilter, compact_research, compact_section
+from utils.metrics import timed, timed_async
+from utils.sub_queries import SUB_QUERY_TEMPLATES
+from utils.text_normalizer import NOT_ABBREVIATION
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = """You are a professional podcast scriptwriter and educational content creator. 
+Create engaging, conversational podcast scripts that are informative yet easy to follow.
+Structure with natural flow: engaging intro, main points with evidence, counter-arguments, and memorable conclusion.
+Make it sound like a professional educational podcast with perfect pacing for audio delivery."""
+
+# "Dr. Smith" stays one sentence, as in TextNormalizer
+SENTENCE_END = re.compile(r'(?<=[.!?])' + NOT_ABBREVIATION + r'\s+|\n+')
+
+def iter_sentences(fragments):
+    """Regroup streamed text fragments into complete sentences or lines"""
+    buffer = ""
+    for fragment in fragments:
+        buffer += fragment
+        parts = SENTENCE_END.split(buffer)
+        buffer = parts.pop()
+        for sentence in parts:
+            if sentence.strip():
+                yield sentence.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
 class ContentSynthesizer:
-    def __init__(self):
+    def __init__(self, client=None, cache=None, async_client=None):
         self.api_key = Config.OPENAI_API_KEY
         self.model = Config.OPENAI_MODEL
+        self._client = client
+        self._async_client = async_client
+        self._async_client_shared = False
+        if cache is None and Config.SYNTHESIS_CACHE_ENABLED:
+            cache = SynthesisCache.from_config()
+        self.cache = cache
         
-        if self.api_key:
-            openai.api_key = self.api_key
-        else:
+        if not self.api_key:
             logger.warning("⚠️ No OpenAI API key found. Using mock synthesis.")
     
-    def create_podcast_script(self, topic, research_data):
-        """Synthesize research data into an engaging podcast script"""
+    @property
+    def client(self):
+        """Shared pooled synthesis client, created on first use"""
+        if self._client is None:
+            # Imported here: the OpenAI SDK is slow to import and mock mode never needs it
+            from utils.llm_client import get_synthesis_client
+            self._client = get_synthesis_client()
+        return self._client
+    
+    @property
+    def async_client(self):
+        """Shared event-loop synthesis client, created on first use"""
+        if self._async_client is None:
+            from utils.llm_client import get_async_synthesis_client
+            self._async_client = get_async_synthesis_client()
+            self._async_client_shared = True
+        return self._async_client
+    
+    async def aclose(self):
+        """Close the event-loop client if one was created (ASGI shutdown)
+        
+        The shared client is reset too, so a later event loop gets a fresh one.
+        """
+        client, self._async_client = self._async_client, None
+        if client is None:
+            return
+        if self._async_client_shared:
+            from utils.llm_client import close_async_synthesis_client
+            self._async_client_shared = False
+            await close_async_synthesis_client()
+        else:
+            await client.close()
+    
+    @timed("create_podcast_script")
+    def create_podcast_script(self, topic, research_data, bypass_cache=False):
+        """Synthesize research data into an engaging podcast script
+        
+        bypass_cache skips the cached answer but still stores the fresh one.
+        """
         try:
-            # If no API key, use mock synthesis
-            if not self.api_key:
-                return self._mock_synthesize(topic, research_data)
+            script, key, messages = self._begin_script(topic, research_data, bypass_cache)
+            if script is not None:
+                return script
+            
+            script = self.client.chat(messages, model=self.model, max_tokens=1500, temperature=0.7)
+            return self._finish_script(key, script)
+            
+        except Exception as e:
+            return self._script_failed(e, topic, research_data)
+    
+    @timed_async("create_podcast_script")
+    async def acreate_podcast_script(self, topic, research_data, bypass_cache=False):
+        """create_podcast_script() for the async server; waits on the LLM without a thread"""
+        try:
+            script, key, messages = self._begin_script(topic, research_data, bypass_cache)
+            if script is not None:
+                return script
+            
+            script = await self.async_client.chat(messages, model=self.model, max_tokens=1500, temperature=0.7)
+            return self._finish_script(key, script)
             
+        except Exception as e:
+            return self._script_failed(e, topic, research_data)
+    
+    def _begin_script(self, topic, research_data, bypass_cache):
+        """Return (script, cache key, messages); script is set when no model call is needed"""
+        # If no API key, use mock synthesis
+        if not self.api_key:
+            return self._mock_synthesize(topic, research_data), None, None
+        
+        research_content = self._prepare_research_content(research_data)
+        prompt = self._create_podcast_prompt(topic, research_content)
+        
+        key = self._cache_key(prompt, 1500)
+        script = None if bypass_cache else self._cache_get(key)
+        if script is not None:
+            logger.info("✅ Podcast script served from cache")
+        return script, key, self._build_messages(prompt)
+    
+    def _finish_script(self, key, script):
+        script = script.strip()
+        self._cache_put(key, script)
+        logger.info("✅ Podcast script generated successfully")
+        return script
+    
+    def _script_failed(self, error, topic, research_data):
+        logger.error(f"❌ Script synthesis failed: {str(error)}")
+        # Fallback to mock synthesis
+        return self._mock_synthesize(topic, research_data)
+    
+    def stream_podcast_script(self, topic, research_data, bypass_cache=False):
+        """Yield the podcast script in fragments as the model produces them
+        
+        Falls back to the mock script if the model fails before its first
+        fragment; a failure after that is re-raised.
+        """
+        if not self.api_key:
+            yield from self._stream_text(self._mock_synthesize(topic, research_data))
+            return
+        
+        produced = False
+        try:
             research_content = self._prepare_research_content(research_data)
             prompt = self._create_podcast_prompt(topic, research_content)
             
-            client = openai.OpenAI(api_key=self.api_key)
+            for delta in self._iter_chat(prompt, 1500, bypass_cache):
+                produced = True
+                yield delta
             
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a professional podcast scriptwriter and educational content creator. 
-Create engaging, conversational podcast scripts that are informative yet easy to follow.
-Structure with natural flow: engaging intro, main points with evidence, counter-arguments, and memorable conclusion.
-Make it sound like a professional educational podcast with perfect pacing for audio delivery."""
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=1500,
-                temperature=0.7
-            )
+            logger.info("✅ Podcast script streamed successfully")
+            
+        except Exception as e:
+            logger.error(f"❌ Streaming synthesis failed: {str(e)}")
+            # Only fall back if the listener has not heard anything yet; a
+            # script cut off halfway must not end as if it were complete
+            if produced:
+                raise
+            yield from self._stream_text(self._mock_synthesize(topic, research_data))
+    
+    def stream_sectioned_script(self, topic, sections, bypass_cache=False):
+        """Yield script fragments one research section at a time
+        
+        Unlike stream_podcast_script this never needs the full research up
+        front, so it can start while later sub-queries are still running.
+        """
+        covered = []
+        # Sections arrive one by one, so each gets an even share of the budget
+        duplicates = NearDuplicateFilter()
+        section_budget = Config.RESEARCH_TOKEN_BUDGET // len(SUB_QUERY_TEMPLATES)
+        for item in sections:
+            if not self.api_key:
+                covered.append(item['sub_query'])
+                if len(covered) == 1:
+                    yield from self._stream_text(self._mock_intro(topic))
+                points = self._mock_key_points(item, limit=2)
+                yield from self._stream_text('\n'.join(f"• {point}" for point in points) + '\n')
+                continue
             
-            script = response.choices[0].message.content.strip()
-            logger.info("✅ Podcast script generated successfully")
-            return script
+            compacted = compact_section(item, duplicates, section_budget)
+            if compacted is None:
+                logger.info(f"✂️ Skipping research area with nothing new: {item['sub_query']}")
+                continue
+            covered.append(item['sub_query'])
+            prompt = self._create_section_prompt(topic, compacted, len(covered))
+            yield from self._stream_completion(
+                prompt, 400, fallback=lambda: self._mock_key_points(item, limit=2), bypass_cache=bypass_cache
+            )
+        
+        if not covered:
+            return
+        
+        if not self.api_key:
+            yield from self._stream_text(self._mock_outro(topic))
+        else:
+            prompt = self._create_closing_prompt(topic, covered)
+            yield from self._stream_completion(
+                prompt, 250, fallback=lambda: [self._mock_outro(topic)], bypass_cache=bypass_cache
+            )
+    
+    def _stream_completion(self, prompt, max_tokens, fallback, bypass_cache=False):
+        """Stream one chat completion; replay fallback() lines if it fails before producing text
+        
+        A failure after text was produced is re-raised.
+        """
+        produced = False
+        try:
+            for delta in self._iter_chat(prompt, max_tokens, bypass_cache):
+                produced = True
+                yield delta
+            yield '\n\n'
             
         except Exception as e:
-            logger.error(f"❌ Script synthesis failed: {str(e)}")
-            # Fallback to mock synthesis
-            return self._mock_synthesize(topic, research_data)
+            logger.error(f"❌ Segment synthesis failed: {str(e)}")
+            if produced:
+                raise
+            yield from self._stream_text('\n'.join(fallback()) + '\n')
+    
+    def _iter_chat(self, prompt, max_tokens, bypass_cache=False, temperature=0.7):
+        """Stream a completion, replaying a cached answer when there is one
+        
+        Only answers that streamed to the end are cached.
+        """
+        key = self._cache_key(prompt, max_tokens, temperature)
+        cached = None if bypass_cache else self._cache_get(key)
+        if cached is not None:
+            yield from self._stream_text(cached)
+            return
+        
+        parts = []
+        for delta in self.client.stream_chat(
+            self._build_messages(prompt),
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature
+        ):
+            parts.append(delta)
+            yield delta
+        self._cache_put(key, "".join(parts))
+    
+    def _cache_key(self, prompt, max_tokens, temperature=0.7):
+        return SynthesisCache.key_for(self.model, SYSTEM_PROMPT, prompt, temperature, max_tokens)
+    
+    def _cache_get(self, key):
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+    
+    def _cache_put(self, key, text):
+        if self.cache is not None and text:
+            self.cache.set(key, text)
+    
+    def _stream_text(self, text):
+        """Replay finished text as word-sized fragments"""
+        for match in re.finditer(r'\S+\s*|\s+', text):
+            yield match.group(0)
+    
+    def _build_messages(self, prompt):
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
     
     def _prepare_research_content(self, research_data):
-        """Prepare research content for synthesis"""
+        """Prepare research content for synthesis, without repeated paragraphs and within the token budget"""
         content_parts = []
         
-        for i, item in enumerate(research_data, 1):
+        for i, item in enumerate(compact_research(research_data), 1):
             content_parts.append(f"RESEARCH AREA {i}: {item['sub_query']}\n{item['content']}\n")
         
         return "\n".join(content_parts)
@@ -83,6 +295,47 @@ REQUIREMENTS:
 7. Keep language accessible but informative
 8. Target length: 800-1200 words for optimal audio pacing
 
+Format with clear speaker directions and natural flow.
+"""
+    
+    def _create_section_prompt(self, topic, item, index):
+        """Prompt for the podcast segment covering one research area"""
+        if index == 1:
+            position = "This is the opening segment: start with an engaging hook that makes the listener curious, then cover this research area."
+        else:
+            position = "Continue naturally from the previous segment; do not re-introduce the show or the host."
+        
+        return f"""
+TOPIC: {topic}
+
+RESEARCH AREA {index}: {item['sub_query']}
+{item['content']}
+
+Write the next segment of an engaging educational podcast about the topic, covering only this research area.
+{position}
+
+REQUIREMENTS:
+1. Present key findings in a conversational, easy-to-understand way
+2. Include specific data points and examples from the research
+3. Keep language accessible but informative
+4. Target length: 150-250 words
+
+Format with clear speaker directions and natural flow.
+"""
+    
+    def _create_closing_prompt(self, topic, sub_queries):
+        """Prompt for the closing segment once every research area is covered"""
+        covered = "\n".join(f"- {query}" for query in sub_queries)
+        return f"""
+TOPIC: {topic}
+
+SEGMENTS ALREADY COVERED:
+{covered}
+
+Write the closing segment of this educational podcast.
+Address different perspectives and counter-arguments, then end with practical takeaways and future implications.
+Do not repeat the individual findings. Target length: 100-150 words.
+
 Format with clear speaker directions and natural flow.
 """
     
@@ -92,12 +345,18 @@ Format with clear speaker directions and natural flow.
         
         key_points = []
         for item in research_data:
-            # Extract first few sentences as key points
-            sentences = item['content'].split('.')[:3]
-            key_points.extend([s.strip() + '.' for s in sentences if s.strip()])
+            key_points.extend(self._mock_key_points(item))
         
         main_points = '\n'.join([f"• {point}" for point in key_points[:4]])
         
+        return self._mock_intro(topic) + main_points + self._mock_outro(topic)
+    
+    def _mock_key_points(self, item, limit=3):
+        """Extract first few sentences as key points"""
+        sentences = item['content'].split('.')[:limit]
+        return [s.strip() + '.' for s in sentences if s.strip()]
+    
+    def _mock_intro(self, topic):
         return f"""
 🎙️ WELCOME TO SYNTHSCHOLAR PODCAST
 Topic: {topic}
@@ -111,7 +370,10 @@ HOST: "Welcome to another episode of SynthScholar, where we transform complex re
 HOST: "If you've ever wondered about the real impact of {topic}, you're in the right place. We've done the research so you can get the key insights in just a few minutes."
 
 MAIN CONTENT:
-{main_points}
+"""
+    
+    def _mock_outro(self, topic):
+        return f"""
 
 HOST: "But it's not all positive - there are important considerations too. Researchers have identified several challenges that need addressing..."
 
@@ -0,0 +1,196 @@
+import os
+import json
+import mmap
+import uuid
+import logging
+import functools
+import threading
+from utils.cache import normalize_topic
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SSCORPUS1\n"
+INDEX_SUFFIX = ".idx"
+DATA_SUFFIX = ".dat"
+
+def read_source_file(path):
+    """Topic records from a .json (list or single record) or .jsonl source file"""
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        records = json.load(f)
+    return records if isinstance(records, list) else [records]
+
+def iter_source_files(paths):
+    """Expand files and directories into sorted .json/.jsonl sources (synonyms.json excluded)"""
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(os.listdir(path))
+            candidates = [os.path.join(path, name) for name in names]
+        else:
+            candidates = [path]
+        for candidate in candidates:
+            name = os.path.basename(candidate)
+            if name != "synonyms.json" and name.endswith((".json", ".jsonl")):
+                yield candidate
+
+class CorpusStore:
+    """Read-only view of a compiled corpus
+
+    Topic names and aliases come from the small JSON index; section bodies
+    stay in the data file and are decoded from an mmap on demand, so the
+    pages are shared by every process reading the same store.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        self.records = index["records"]
+        self.data_path = os.path.join(os.path.dirname(os.path.abspath(index_path)), index["data_file"])
+        self._file = open(self.data_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a corpus data file: {self.data_path}")
+
+    def __len__(self):
+        return len(self.records)
+
+    def read_sections(self, offset, length):
+        with self._lock:
+            if offset + length > len(self._map):
+                # The writer appended since we mapped the file
+                self._map.close()
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            data = self._map[offset:offset + length]
+        return json.loads(data)
+
+    def loader(self, record):
+        """Zero-argument callable returning the sections of record"""
+        return functools.partial(self.read_sections, record["offset"], record["length"])
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+class CorpusWriter:
+    """Appends topic records to a corpus data file and maintains its offset index
+
+    Re-adding a topic appends a new copy and repoints the index; compact()
+    rewrites only the live records into a fresh data file.
+    """
+
+    def __init__(self, directory, name="research"):
+        self.directory = directory
+        self.index_path = os.path.join(directory, name + INDEX_SUFFIX)
+        self.name = name
+        os.makedirs(directory, exist_ok=True)
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            self.data_file = index["data_file"]
+            self.records = {record["key"]: record for record in index["records"]}
+        else:
+            self.data_file = self._new_data_file()
+            self.records = {}
+        self._data = open(os.path.join(directory, self.data_file), "ab")
+
+    def add(self, topic, sections, aliases=()):
+        key = normalize_topic(topic)
+        if not key or not sections:
+            raise ValueError(f"Topic record needs a name and sections: {topic!r}")
+
+        payload = json.dumps(sections, ensure_ascii=False).encode("utf-8") + b"\n"
+        offset = self._data.tell()
+        self._data.write(payload)
+
+        previous = self.records.get(key)
+        merged = list(previous["aliases"]) if previous else []
+        merged.extend(alias for alias in aliases if alias not in merged)
+        self.records[key] = {
+            "key": key,
+            "topic": topic,
+            "aliases": merged,
+            "offset": offset,
+            "length": len(payload) - 1,
+        }
+
+    def commit(self):
+        """Make appended records durable, then atomically publish the new index"""
+        self._data.flush()
+        os.fsync(self._data.fileno())
+        index = {
+            "version": 1,
+            "data_file": self.data_file,
+            "records": sorted(self.records.values(), key=lambda record: record["offset"]),
+        }
+        partial = self.index_path + ".part"
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial, self.index_path)
+
+    def compact(self):
+        """Copy live records into a new data file and drop the old one"""
+        old_path = os.path.join(self.directory, self.data_file)
+        self._data.flush()
+        records = sorted(self.records.values(), key=lambda record: record["offset"])
+
+        self.data_file = self._new_data_file()
+        new_data = open(os.path.join(self.directory, self.data_file), "ab")
+        with open(old_path, "rb") as old:
+            for record in records:
+                old.seek(record["offset"])
+                payload = old.read(record["length"] + 1)
+                record["offset"] = new_data.tell()
+                new_data.write(payload)
+        self._data.close()
+        self._data = new_data
+        self.commit()
+        # Readers that still map the old file keep their pages until they reopen
+        os.remove(old_path)
+
+    def close(self):
+        self._data.close()
+
+    def _new_data_file(self):
+        data_file = f"{self.name}-{uuid.uuid4().hex[:8]}{DATA_SUFFIX}"
+        with open(os.path.join(self.directory, data_file), "wb") as f:
+            f.write(MAGIC)
+        return data_file
+
+def build_corpus(sources, directory, name="research", compact=False):
+    """Compile JSON/JSONL topic sources into a corpus store; returns counts"""
+    writer = CorpusWriter(directory, name)
+    stats = {"files": 0, "records": 0, "skipped": 0}
+    synonyms = {}
+    try:
+        for path in iter_source_files(sources):
+            stats["files"] += 1
+            for record in read_source_file(path):
+                try:
+                    writer.add(record["topic"], record["sections"], record.get("aliases", ()))
+                    stats["records"] += 1
+                except (KeyError, TypeError, ValueError) as e:
+                    stats["skipped"] += 1
+                    logger.warning(f"⚠️ Skipping corpus record in {path}: {str(e)}")
+        for source in sources:
+            synonyms_path = os.path.join(source, "synonyms.json")
+            if os.path.isdir(source) and os.path.exists(synonyms_path):
+                with open(synonyms_path, encoding="utf-8") as f:
+                    synonyms.update(json.load(f))
+        writer.commit()
+        if compact:
+            writer.compact()
+    finally:
+        writer.close()
+
+    if synonyms:
+        with open(os.path.join(directory, "synonyms.json"), "w", encoding="utf-8") as f:
+            json.dump(synonyms, f, indent=2, ensure_ascii=False)
+    stats["topics"] = len(writer.records)
+    return stats
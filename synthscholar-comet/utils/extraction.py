@@ -0,0 +1,95 @@
+# (strategy name, XPath) in priority order; the first strategy with a
+# qualifying node wins, and within it the newest qualifying node
+STRATEGIES = [
+    ("prose", "//div[contains(@class, 'prose')]"),
+    ("answer", "//div[contains(@class, 'answer')]"),
+    ("message", "//div[contains(@class, 'message')]"),
+    ("content", "//div[contains(@class, 'content')]"),
+    ("text", "//div[contains(@class, 'text')]"),
+    ("nested-flex", "//main//div[contains(@class, 'flex')]//div[contains(@class, 'flex')]"),
+]
+
+MAX_LINKS = 20
+
+# Defines extractAnswer(strategies, minLength, maxLinks) -> {text, links, strategy, score} | null.
+# Scoring discounts link-heavy nodes (navigation, citation lists) so they
+# never win over prose of the same length.
+EXTRACT_JS = """
+function extractAnswer(strategies, minLength, maxLinks) {
+    function clean(text) {
+        return (text || '').replace(/[ \\t]+\\n/g, '\\n').replace(/\\n{3,}/g, '\\n\\n').trim();
+    }
+    function score(node, text) {
+        let linkChars = 0;
+        for (const link of node.querySelectorAll('a')) {
+            linkChars += (link.innerText || '').length;
+        }
+        return text.length * (1 - Math.min(1, linkChars / Math.max(1, text.length)));
+    }
+    function links(node) {
+        const seen = new Set();
+        const found = [];
+        for (const link of node.querySelectorAll('a[href]')) {
+            const url = link.href;
+            if (!/^https?:/.test(url) || seen.has(url)) {
+                continue;
+            }
+            seen.add(url);
+            found.push({url: url, title: clean(link.innerText || link.title || '')});
+            if (found.length >= maxLinks) {
+                break;
+            }
+        }
+        return found;
+    }
+    function result(node, text, strategy, points) {
+        return {text: text, links: links(node), strategy: strategy, score: Math.round(points)};
+    }
+
+    for (const [name, xpath] of strategies) {
+        const nodes = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (let i = nodes.snapshotLength - 1; i >= 0; i--) {
+            const node = nodes.snapshotItem(i);
+            const text = clean(node.innerText);
+            const points = text.length > minLength ? score(node, text) : 0;
+            if (points > minLength) {
+                return result(node, text, name, points);
+            }
+        }
+    }
+
+    // Fallback: everything in the main content area
+    const main = document.querySelector('main');
+    const text = main ? clean(main.innerText) : '';
+    if (text.length > 100) {
+        return result(main, text, 'main', score(main, text));
+    }
+    return null;
+}
+"""
+
+_EXTRACT_CALL_JS = EXTRACT_JS + "return extractAnswer(arguments[0], arguments[1], arguments[2]);"
+
+class ContentExtractor:
+    """Finds the answer on a page in a single WebDriver round-trip
+
+    One injected script walks every strategy, scores the candidates and
+    returns {"text", "links", "strategy", "score"}, instead of a
+    find_elements call per selector plus a .text call per element.
+    """
+
+    def __init__(self, strategies=STRATEGIES, min_length=200, max_links=MAX_LINKS):
+        self.strategies = [list(strategy) for strategy in strategies]
+        self.min_length = min_length
+        self.max_links = max_links
+
+    def script_args(self):
+        """Arguments for extractAnswer when it runs inside another script"""
+        return [self.strategies, self.min_length, self.max_links]
+
+    def extract(self, driver):
+        """Extraction dict for the current page, None if nothing qualifies
+
+        Raises WebDriverException when the script cannot run at all.
+        """
+        return driver.execute_script(_EXTRACT_CALL_JS, *self.script_args())
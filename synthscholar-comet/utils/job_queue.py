@@ -0,0 +1,443 @@
+import time
+import uuid
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from config import Config
+from utils.metrics import JOBS, STAGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ("research", "synthesis", "audio")
+
+TERMINAL_STATES = ("completed", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """Raised inside a job once cancellation has been requested"""
+
+
+class JobFailed(Exception):
+    """Raised by a stage with a message that is safe to show to the user"""
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue has no free slots left"""
+
+
+class Job:
+    """A single podcast request moving through the pipeline stages"""
+
+    def __init__(self, topic, stages=PIPELINE_STAGES):
+        self.id = uuid.uuid4().hex
+        self.topic = topic
+        self.status = "queued"
+        self.stage_order = list(stages)
+        self.stages = {
+            name: {"status": "pending", "started_at": None, "finished_at": None}
+            for name in self.stage_order
+        }
+        self.result = None
+        self.error = None
+        self.details = {}
+        self.events = []
+        self.created_at = time.time()
+        self.finished_at = None
+        self.future = None
+        self._attachments = set()
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._events_changed = threading.Condition(self._lock)
+        self._async_listeners = set()
+        # Attachment token of the requester that submitted the job
+        self.token = self.attach()
+
+    @property
+    def done(self):
+        return self.status in TERMINAL_STATES
+
+    @property
+    def cancel_event(self):
+        """Event set once cancellation is requested, for stages that poll it"""
+        return self._cancel_event
+
+    @property
+    def subscribers(self):
+        return len(self._attachments)
+
+    def attach(self):
+        """Register another requester sharing this job and return its attachment token"""
+        token = uuid.uuid4().hex
+        with self._lock:
+            self._attachments.add(token)
+        return token
+
+    def detach(self, token):
+        """Drop the requester holding token and return how many are still attached
+
+        Unknown or already detached tokens change nothing, so a requester
+        repeating its cancel still counts once.
+        """
+        with self._lock:
+            self._attachments.discard(token)
+            return len(self._attachments)
+
+    def request_cancel(self):
+        """Ask the job to stop at the next stage boundary"""
+        self._cancel_event.set()
+
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancellation has been requested"""
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.id)
+
+    @contextmanager
+    def stage(self, name):
+        """Track the status and timing of one pipeline stage"""
+        self.check_cancelled()
+        started = time.time()
+        self._set_stage(name, "running", started_at=started)
+        try:
+            yield
+        except BaseException as e:
+            # Anything that interrupts a stage after a cancel request counts as
+            # cancelled, as does a stage generator the pipeline abandons
+            cancelled = isinstance(e, (JobCancelled, GeneratorExit)) or self.cancel_requested()
+            outcome = "cancelled" if cancelled else "failed"
+            finished = time.time()
+            self._set_stage(name, outcome, finished_at=finished)
+            STAGE_SECONDS.labels(stage=name, outcome=outcome).observe(finished - started)
+            raise
+        finished = time.time()
+        self._set_stage(name, "completed", finished_at=finished)
+        STAGE_SECONDS.labels(stage=name, outcome="completed").observe(finished - started)
+
+    def set_detail(self, key, value):
+        """Publish intermediate output (e.g. a stream URL) to status polls"""
+        with self._lock:
+            self.details[key] = value
+
+    def publish_event(self, event, data):
+        """Append an event for Server-Sent Event listeners"""
+        with self._lock:
+            self.events.append((event, data))
+            self._notify()
+
+    async def aiter_events(self, start=0, timeout=None):
+        """iter_events() for event-loop listeners; waiting holds no thread"""
+        listener = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._async_listeners.add(listener)
+        try:
+            index = start
+            while True:
+                with self._lock:
+                    listener[1].clear()
+                    pending = self.events[index:]
+                    finished = self.done
+                for event, data in pending:
+                    yield index, event, data
+                    index += 1
+                if finished and index >= len(self.events):
+                    return
+                if pending:
+                    continue
+                try:
+                    await asyncio.wait_for(listener[1].wait(), timeout)
+                except asyncio.TimeoutError:
+                    yield index, None, None
+        finally:
+            with self._lock:
+                self._async_listeners.discard(listener)
+
+    def iter_events(self, start=0, timeout=None):
+        """Yield (index, event, data) from start until the job finishes"""
+        index = start
+        while True:
+            with self._lock:
+                if index >= len(self.events) and not self.done:
+                    self._events_changed.wait(timeout)
+                pending = self.events[index:]
+                finished = self.done
+            for event, data in pending:
+                yield index, event, data
+                index += 1
+            if finished and index >= len(self.events):
+                return
+            if not pending and timeout is not None:
+                # Timed out with nothing new; let the caller send a keep-alive
+                yield index, None, None
+
+    def _notify(self):
+        # Called with self._lock held
+        self._events_changed.notify_all()
+        for loop, changed in self._async_listeners:
+            loop.call_soon_threadsafe(changed.set)
+
+    def _set_stage(self, name, status, **timestamps):
+        with self._lock:
+            self.stages[name]["status"] = status
+            self.stages[name].update(timestamps)
+            self.events.append(("stage", {"name": name, "status": status}))
+            self._notify()
+
+    def _finish(self, status, result=None, error=None):
+        with self._lock:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.finished_at = time.time()
+            for info in self.stages.values():
+                if info["status"] in ("pending", "running") and status == "cancelled":
+                    info["status"] = "cancelled"
+            self.events.append(("done", {"status": status, "error": error}))
+            self._notify()
+        JOBS.labels(status=status).inc()
+
+    def progress(self):
+        """Percentage of stages completed"""
+        completed = sum(1 for info in self.stages.values() if info["status"] == "completed")
+        return int(100 * completed / len(self.stage_order)) if self.stage_order else 100
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "job_id": self.id,
+                "topic": self.topic,
+                "status": self.status,
+                "progress": self.progress(),
+                "stages": [dict(name=name, **self.stages[name]) for name in self.stage_order],
+                "details": dict(self.details),
+                "subscribers": self.subscribers,
+                "result": self.result,
+                "error": self.error,
+                "created_at": self.created_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class JobQueue:
+    """Bounded worker pool running podcast jobs in the background"""
+
+    def __init__(self, max_workers=None, max_pending=None, retention=None):
+        self.max_workers = max_workers or Config.JOB_WORKERS
+        self.max_pending = max_pending or Config.JOB_MAX_PENDING
+        self.retention = retention if retention is not None else Config.JOB_RETENTION
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="synthscholar-job"
+        )
+        self._jobs = {}
+        self._active = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, topic, runner):
+        """Queue runner(job) for execution and return the new Job"""
+        with self._lock:
+            self._prune()
+            if self._active >= self.max_pending:
+                raise QueueFullError(f"{self._active} jobs already in flight")
+            job = Job(topic)
+            self._jobs[job.id] = job
+            self._active += 1
+
+        job.future = self.executor.submit(self._run, job, runner)
+        job.future.add_done_callback(lambda _: self._release())
+        logger.info(f"📥 Queued job {job.id} for topic: {topic}")
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id, token=None):
+        """Request cancellation for the requester holding token; returns the job or None if unknown
+
+        Jobs shared by several requesters keep running until every attached
+        requester has cancelled. Without a token the job is cancelled
+        outright, for server-side callers that own it.
+        """
+        job = self.get(job_id)
+        if job is None or job.done:
+            return job
+
+        remaining = job.detach(token) if token is not None else 0
+        if remaining > 0:
+            logger.info(f"👋 Requester left job {job.id}, {remaining} still attached")
+            return job
+
+        job.request_cancel()
+        if job.future is not None and job.future.cancel():
+            # Never started, so no worker will record the outcome
+            job._finish("cancelled")
+        logger.info(f"🛑 Cancellation requested for job {job.id}")
+        return job
+
+    def stats(self):
+        with self._lock:
+            return {
+                "active": self._active,
+                "max_pending": self.max_pending,
+                "workers": self.max_workers,
+                "tracked": len(self._jobs),
+            }
+
+    def running_count(self):
+        """Jobs currently executing on a worker (the rest of active are waiting)"""
+        with self._lock:
+            return self._running
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _run(self, job, runner):
+        if job.cancel_requested():
+            job._finish("cancelled")
+            return
+
+        job.status = "running"
+        with self._lock:
+            self._running += 1
+        try:
+            result = runner(job)
+            job._finish("completed", result=result)
+            logger.info(f"✅ Job {job.id} completed")
+        except JobCancelled:
+            job._finish("cancelled")
+            logger.info(f"🛑 Job {job.id} cancelled")
+        except JobFailed as e:
+            job._finish("failed", error=str(e))
+            logger.warning(f"⚠️ Job {job.id} failed: {str(e)}")
+        except Exception as e:
+            job._finish("failed", error="Internal server error. Please try again.")
+            logger.error(f"❌ Job {job.id} crashed: {str(e)}")
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _release(self):
+        with self._lock:
+            self._active -= 1
+
+    def _prune(self):
+        """Forget finished jobs older than the retention window"""
+        cutoff = time.time() - self.retention
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.done and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+class AsyncJobQueue(JobQueue):
+    """Runs coroutine jobs as tasks on one event loop instead of worker threads
+
+    submit() may be called from any thread. job.future is a plain
+    concurrent.futures.Future resolved when the task ends, so done
+    callbacks, single-flight and BatchRunner work as with JobQueue. There
+    is no worker limit: max_pending caps jobs in flight and the pipeline's
+    stage caps bound the blocking work.
+    """
+
+    def __init__(self, loop, max_pending=None, retention=None):
+        self.loop = loop
+        self.max_workers = None
+        self.max_pending = max_pending or Config.ASYNC_JOB_MAX_PENDING
+        self.retention = retention if retention is not None else Config.JOB_RETENTION
+        self._jobs = {}
+        self._tasks = {}
+        self._active = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(self, topic, runner):
+        """Schedule runner(job) on the loop and return the new Job
+
+        runner may be a coroutine function or, for compatibility, a plain
+        function, which then runs in the loop's default executor.
+        """
+        with self._lock:
+            self._prune()
+            if self._active >= self.max_pending:
+                raise QueueFullError(f"{self._active} jobs already in flight")
+            job = Job(topic)
+            self._jobs[job.id] = job
+            self._active += 1
+
+        # Never "pending", so JobQueue.cancel() leaves finishing to the task
+        job.future = Future()
+        job.future.set_running_or_notify_cancel()
+        job.future.add_done_callback(lambda _: self._release())
+        self.loop.call_soon_threadsafe(self._start, job, runner)
+        logger.info(f"📥 Queued job {job.id} for topic: {topic}")
+        return job
+
+    def cancel(self, job_id, token=None):
+        job = super().cancel(job_id, token)
+        if job is not None and job.cancel_requested():
+            self.loop.call_soon_threadsafe(self._cancel_task, job.id)
+        return job
+
+    def shutdown(self, wait=True):
+        """Cancel every task; call from outside the loop or await drain() inside it"""
+        for job_id in list(self._tasks):
+            self.loop.call_soon_threadsafe(self._cancel_task, job_id)
+
+    async def drain(self):
+        """Cancel all jobs and wait for their tasks to finish"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start(self, job, runner):
+        task = self.loop.create_task(self._run_async(job, runner))
+        task.add_done_callback(lambda _: self._settle(job))
+        self._tasks[job.id] = task
+
+    def _settle(self, job):
+        # A task cancelled before its first step never runs _run_async at all
+        self._tasks.pop(job.id, None)
+        if not job.done:
+            job._finish("cancelled")
+        job.future.set_result(None)
+
+    def _cancel_task(self, job_id):
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+
+    async def _run_async(self, job, runner):
+        if job.cancel_requested():
+            job._finish("cancelled")
+            return
+
+        job.status = "running"
+        with self._lock:
+            self._running += 1
+        try:
+            if asyncio.iscoroutinefunction(runner):
+                result = await runner(job)
+            else:
+                result = await self.loop.run_in_executor(None, runner, job)
+            job._finish("completed", result=result)
+            logger.info(f"✅ Job {job.id} completed")
+        except (JobCancelled, asyncio.CancelledError):
+            job._finish("cancelled")
+            logger.info(f"🛑 Job {job.id} cancelled")
+        except JobFailed as e:
+            job._finish("failed", error=str(e))
+            logger.warning(f"⚠️ Job {job.id} failed: {str(e)}")
+        except Exception as e:
+            job._finish("failed", error="Internal server error. Please try again.")
+            logger.error(f"❌ Job {job.id} crashed: {str(e)}")
+        finally:
+            with self._lock:
+                self._running -= 1
@@ -0,0 +1,253 @@
+import time
+import asyncio
+import random
+import logging
+import threading
+import httpx
+import openai
+from config import Config
+from utils.metrics import ERRORS, LLM_RETRIES
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Rate limiter allowing bursts of `capacity` and `rate` requests per second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        if not self.rate:
+            return
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Like acquire(), but yields to the event loop while waiting"""
+        if not self.rate:
+            return
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def _take(self):
+        """Take a token and return 0, or return the seconds until one is due"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+def _is_retryable(error):
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError, openai.RateLimitError)):
+        return True
+    return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+def _backoff(attempt):
+    """Full jitter: uniform in [0, base * 2^attempt], capped"""
+    ceiling = min(Config.LLM_BACKOFF_MAX, Config.LLM_BACKOFF_BASE * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+class SynthesisClient:
+    """Long-lived OpenAI client with pooled connections, concurrency and rate limits
+
+    Retries 429, 5xx, timeouts and connection errors with jittered
+    exponential backoff; the SDK's own retries are disabled so limits apply
+    to every attempt.
+    """
+
+    def __init__(self, api_key=None, base_url=None, max_concurrency=None,
+                 rate_per_second=None, burst=None, max_retries=None, timeout=None):
+        self.max_retries = max_retries if max_retries is not None else Config.LLM_MAX_RETRIES
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=Config.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.LLM_MAX_CONNECTIONS
+            ),
+            timeout=timeout or Config.LLM_TIMEOUT
+        )
+        self.client = openai.OpenAI(
+            api_key=api_key or Config.OPENAI_API_KEY,
+            base_url=base_url or Config.OPENAI_BASE_URL or None,
+            http_client=self.http_client,
+            max_retries=0
+        )
+        self._slots = threading.BoundedSemaphore(max_concurrency or Config.LLM_MAX_CONCURRENCY)
+        self._bucket = TokenBucket(
+            rate_per_second if rate_per_second is not None else Config.LLM_RATE_PER_SECOND,
+            burst or Config.LLM_BURST
+        )
+
+    def chat(self, messages, model, max_tokens, temperature):
+        """Return the completion text for messages"""
+        with self._slots:
+            response = self._with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            )
+        return response.choices[0].message.content
+
+    def stream_chat(self, messages, model, max_tokens, temperature):
+        """Yield completion text deltas; retries only happen before the first one"""
+        with self._slots:
+            stream = self._with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True
+                )
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    def close(self):
+        self.http_client.close()
+
+    def _with_retries(self, request):
+        attempt = 0
+        while True:
+            self._bucket.acquire()
+            try:
+                return request()
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    ERRORS.labels(component="llm").inc()
+                    raise
+                delay = _backoff(attempt)
+                attempt += 1
+                LLM_RETRIES.inc()
+                logger.warning(f"⚠️ LLM request failed ({str(e)}), retry {attempt} in {delay:.2f}s")
+                time.sleep(delay)
+
+class AsyncSynthesisClient:
+    """Event-loop counterpart of SynthesisClient
+
+    Requests waiting for a concurrency slot, a rate-limit token or a
+    backoff sleep hold no thread, so one loop can drive hundreds of them.
+    Must be used from a single event loop.
+    """
+
+    def __init__(self, api_key=None, base_url=None, max_concurrency=None,
+                 rate_per_second=None, burst=None, max_retries=None, timeout=None):
+        self.max_retries = max_retries if max_retries is not None else Config.LLM_MAX_RETRIES
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=Config.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=Config.LLM_MAX_CONNECTIONS
+            ),
+            timeout=timeout or Config.LLM_TIMEOUT
+        )
+        self.client = openai.AsyncOpenAI(
+            api_key=api_key or Config.OPENAI_API_KEY,
+            base_url=base_url or Config.OPENAI_BASE_URL or None,
+            http_client=self.http_client,
+            max_retries=0
+        )
+        self._slots = asyncio.BoundedSemaphore(max_concurrency or Config.LLM_MAX_CONCURRENCY)
+        self._bucket = TokenBucket(
+            rate_per_second if rate_per_second is not None else Config.LLM_RATE_PER_SECOND,
+            burst or Config.LLM_BURST
+        )
+
+    async def chat(self, messages, model, max_tokens, temperature):
+        """Return the completion text for messages"""
+        async with self._slots:
+            response = await self._with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
+            )
+        return response.choices[0].message.content
+
+    async def stream_chat(self, messages, model, max_tokens, temperature):
+        """Async generator of completion text deltas; retries only happen before the first one"""
+        async with self._slots:
+            stream = await self._with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True
+                )
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    async def close(self):
+        await self.http_client.aclose()
+
+    async def _with_retries(self, request):
+        attempt = 0
+        while True:
+            await self._bucket.acquire_async()
+            try:
+                return await request()
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    ERRORS.labels(component="llm").inc()
+                    raise
+                delay = _backoff(attempt)
+                attempt += 1
+                LLM_RETRIES.inc()
+                logger.warning(f"⚠️ LLM request failed ({str(e)}), retry {attempt} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+def get_synthesis_client():
+    """Process-wide SynthesisClient, created on first use"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = SynthesisClient()
+        return _shared_client
+
+_shared_async_client = None
+
+def get_async_synthesis_client():
+    """Process-wide AsyncSynthesisClient for the serving event loop, created on first use"""
+    global _shared_async_client
+    with _shared_client_lock:
+        if _shared_async_client is None:
+            _shared_async_client = AsyncSynthesisClient()
+        return _shared_async_client
+
+async def close_async_synthesis_client():
+    """Close the shared AsyncSynthesisClient; the next get_async_synthesis_client() builds a new one"""
+    global _shared_async_client
+    with _shared_client_lock:
+        client, _shared_async_client = _shared_async_client, None
+    if client is not None:
+        await client.close()
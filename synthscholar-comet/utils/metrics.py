@@ -0,0 +1,388 @@
+import time
+import bisect
+import logging
+import functools
+import threading
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for name, value in labels:
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric:
+    """A metric family; labels(**values) returns the child for one label set"""
+
+    kind = None
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def _init_default(self):
+        # Unlabelled metrics are exported (as zero) before their first update
+        if not self.labelnames:
+            self.labels()
+
+    def labels(self, **values):
+        key = tuple((name, values[name]) for name in self.labelnames)
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+        return child
+
+    def samples(self):
+        with self._lock:
+            children = list(self._children.items())
+        for key, child in children:
+            yield from child.samples(self.name, key)
+
+    def _default(self):
+        """Child for metrics declared without labels"""
+        return self.labels()
+
+class _Value:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+    def set(self, value):
+        with self._lock:
+            self.value = value
+
+    def samples(self, name, key):
+        yield name, key, self.value
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+    def set(self, value):
+        self._default().set(value)
+
+    def inc(self, amount=1):
+        self._default().inc(amount)
+
+    def dec(self, amount=1):
+        self._default().dec(amount)
+
+class _HistogramValue:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if index < len(self.counts):
+                self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def samples(self, name, key):
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            yield f"{name}_bucket", key + (("le", _format_value(float(bound))),), cumulative
+        yield f"{name}_bucket", key + (("le", "+Inf"),), count
+        yield f"{name}_sum", key, total
+        yield f"{name}_count", key, count
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value):
+        self._default().observe(value)
+
+class _Callback:
+    """Metric family whose samples are read from fn() at scrape time"""
+
+    def __init__(self, name, help, kind, fn):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.fn = fn
+
+    def samples(self):
+        for labels, value in self.fn():
+            yield self.name, tuple(sorted(labels.items())), value
+
+class Registry:
+    """Holds metric families and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name, help, labelnames=()):
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name, help, labelnames=()):
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def register_callback(self, name, help, kind, fn):
+        """Expose fn() -> [(labels dict, value), ...] as a family read on every scrape"""
+        return self._register(_Callback(name, help, kind, fn))
+
+    def render(self):
+        with self._lock:
+            families = list(self._families.values())
+
+        lines = []
+        for family in families:
+            try:
+                samples = list(family.samples())
+            except Exception as e:
+                logger.warning(f"⚠️ Metric {family.name} could not be collected: {str(e)}")
+                continue
+            lines.append(f"# HELP {family.name} {family.help}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, family):
+        if isinstance(family, _Metric):
+            family._init_default()
+        with self._lock:
+            # Re-registering a name replaces the old family
+            self._families[family.name] = family
+        return family
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "synthscholar_stage_duration_seconds",
+    "Time jobs spend in each pipeline stage",
+    ("stage", "outcome")
+)
+CALL_SECONDS = REGISTRY.histogram(
+    "synthscholar_call_duration_seconds",
+    "Latency of instrumented calls",
+    ("function",)
+)
+CALLS = REGISTRY.counter(
+    "synthscholar_calls_total",
+    "Instrumented calls by outcome; returning None counts as an error",
+    ("function", "outcome")
+)
+ERRORS = REGISTRY.counter(
+    "synthscholar_errors_total",
+    "Errors by component",
+    ("component",)
+)
+JOBS = REGISTRY.counter(
+    "synthscholar_jobs_total",
+    "Finished jobs by final status",
+    ("status",)
+)
+AUDIO_BYTES = REGISTRY.counter(
+    "synthscholar_audio_bytes_total",
+    "Bytes of MP3 audio produced"
+)
+TTS_CHUNK_SECONDS = REGISTRY.histogram(
+    "synthscholar_tts_chunk_seconds",
+    "Latency of a single TTS chunk",
+    ("engine",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10)
+)
+RESEARCH_BACKEND_SECONDS = REGISTRY.histogram(
+    "synthscholar_research_backend_seconds",
+    "Time until each research backend answered, failed or missed its deadline in a fan-out",
+    ("backend", "outcome")
+)
+RESEARCH_TOKENS = REGISTRY.counter(
+    "synthscholar_research_tokens_total",
+    "Estimated research tokens scraped and kept for synthesis prompts after compaction",
+    ("stage",)
+)
+LLM_RETRIES = REGISTRY.counter(
+    "synthscholar_llm_retries_total",
+    "LLM requests retried after a transient failure"
+)
+
+def timed(function):
+    """Record latency and outcome of the decorated call under the given name"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = fn(*args, **kwargs)
+                if result is not None:
+                    outcome = "success"
+                return result
+            finally:
+                CALL_SECONDS.labels(function=function).observe(time.perf_counter() - started)
+                CALLS.labels(function=function, outcome=outcome).inc()
+                if outcome == "error":
+                    ERRORS.labels(component=function).inc()
+        return wrapper
+    return decorator
+
+def timed_async(function):
+    """timed() for coroutine functions"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await fn(*args, **kwargs)
+                if result is not None:
+                    outcome = "success"
+                return result
+            finally:
+                CALL_SECONDS.labels(function=function).observe(time.perf_counter() - started)
+                CALLS.labels(function=function, outcome=outcome).inc()
+                if outcome == "error":
+                    ERRORS.labels(component=function).inc()
+        return wrapper
+    return decorator
+
+def watch_cache(name, cache):
+    """Export a TieredCache's lookup statistics"""
+    if cache is None:
+        return
+
+    def lookups():
+        stats = cache.stats()
+        return [
+            ({"cache": name, "result": "memory_hit"}, stats["memory_hits"]),
+            ({"cache": name, "result": "disk_hit"}, stats["disk_hits"]),
+            ({"cache": name, "result": "miss"}, stats["misses"]),
+        ]
+
+    REGISTRY.register_callback(
+        f"synthscholar_{name}_cache_lookups_total", f"{name} cache lookups by result", "counter", lookups
+    )
+    REGISTRY.register_callback(
+        f"synthscholar_{name}_cache_hit_ratio", f"Share of {name} cache lookups served from cache", "gauge",
+        lambda: [({"cache": name}, cache.stats()["hit_ratio"])]
+    )
+
+def watch_audio_store(store):
+    def events():
+        stats = store.stats()
+        return [({"event": event}, value) for event, value in sorted(stats.items())]
+
+    REGISTRY.register_callback(
+        "synthscholar_audio_store_events_total", "Audio store hits, renders, coalesced waits, evictions and expirations",
+        "counter", events
+    )
+    REGISTRY.register_callback(
+        "synthscholar_audio_store_bytes", "Disk used by stored audio artifacts", "gauge",
+        lambda: [({}, store.usage()["bytes"])]
+    )
+    REGISTRY.register_callback(
+        "synthscholar_audio_store_artifacts", "Audio artifacts in the store", "gauge",
+        lambda: [({}, store.usage()["artifacts"])]
+    )
+
+def watch_browser_pool(pool):
+    """Export browser pool occupancy and lifecycle counters"""
+    if pool is None:
+        return
+
+    def sessions():
+        stats = pool.stats()
+        return [({"state": state}, stats[state]) for state in ("in_use", "idle", "total", "size")]
+
+    def utilization():
+        stats = pool.stats()
+        return [({}, stats["in_use"] / stats["size"] if stats["size"] else 0.0)]
+
+    def lifecycle():
+        stats = pool.stats()
+        return [({"event": event}, stats[event]) for event in ("created", "recycled", "leases", "create_failures")]
+
+    REGISTRY.register_callback("synthscholar_browser_sessions", "Browser sessions by state", "gauge", sessions)
+    REGISTRY.register_callback(
+        "synthscholar_browser_pool_utilization", "Share of pool sessions currently leased", "gauge", utilization
+    )
+    REGISTRY.register_callback(
+        "synthscholar_browser_pool_events_total", "Browser pool lifecycle events", "counter", lifecycle
+    )
+
+def watch_job_queue(job_queue):
+    def depth():
+        stats = job_queue.stats()
+        return [({}, stats["active"])]
+
+    def running():
+        return [({}, job_queue.running_count())]
+
+    REGISTRY.register_callback(
+        "synthscholar_jobs_in_flight", "Jobs queued or running", "gauge", depth
+    )
+    REGISTRY.register_callback(
+        "synthscholar_jobs_running", "Jobs currently executing on a worker", "gauge", running
+    )
+    REGISTRY.register_callback(
+        "synthscholar_job_queue_capacity", "Maximum jobs in flight before requests are rejected", "gauge",
+        lambda: [({}, job_queue.max_pending)]
+    )
+
+def watch_single_flight(flights):
+    def requests():
+        stats = flights.stats()
+        return [({"role": "leader"}, stats["leaders"]), ({"role": "coalesced"}, stats["coalesced"])]
+
+    REGISTRY.register_callback(
+        "synthscholar_research_requests_total", "Research requests by single-flight role", "counter", requests
+    )
+
+def render():
+    return REGISTRY.render()
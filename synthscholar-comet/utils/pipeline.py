@@ -0,0 +1,101 @@
+import queue
+import logging
+import threading
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+class PipelineCancelled(Exception):
+    """Raised when a pipeline is stopped by cancellation or a failing stage"""
+
+class Stage:
+    """A named pipeline step: fn(inputs) is a generator consuming the upstream items"""
+
+    def __init__(self, name, fn):
+        self.name = name
+        self.fn = fn
+
+class Pipeline:
+    """Runs stages in their own threads, connected by bounded queues
+
+    A full queue blocks the producer (backpressure). Cancelling the shared
+    event, a failing stage, or the consumer walking away stops every stage.
+    """
+
+    def __init__(self, stages, queue_size=None, cancel_event=None, poll_interval=0.1):
+        self.stages = stages
+        self.queue_size = queue_size or Config.PIPELINE_QUEUE_SIZE
+        self.cancel_event = cancel_event or threading.Event()
+        self.poll_interval = poll_interval
+
+    def run(self, source=()):
+        """Yield the outputs of the last stage as they are produced"""
+        stop = threading.Event()
+        errors = []
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+
+        def stopped():
+            return stop.is_set() or self.cancel_event.is_set()
+
+        def put(q, item):
+            while True:
+                if stopped():
+                    raise PipelineCancelled()
+                try:
+                    q.put(item, timeout=self.poll_interval)
+                    return
+                except queue.Full:
+                    continue
+
+        def drain(q):
+            while True:
+                if stopped():
+                    raise PipelineCancelled()
+                try:
+                    item = q.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+                if item is _DONE:
+                    return
+                yield item
+
+        def work(stage, inputs, output):
+            try:
+                for item in stage.fn(inputs):
+                    put(output, item)
+                put(output, _DONE)
+            except PipelineCancelled:
+                pass
+            except Exception as e:
+                logger.error(f"❌ Pipeline stage '{stage.name}' failed: {str(e)}")
+                errors.append(e)
+                stop.set()
+
+        threads = []
+        inputs = iter(source)
+        for stage, output in zip(self.stages, queues):
+            thread = threading.Thread(
+                target=work, args=(stage, inputs, output),
+                name=f"pipeline-{stage.name}", daemon=True
+            )
+            threads.append(thread)
+            inputs = drain(output)
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            yield from drain(queues[-1])
+        except PipelineCancelled:
+            pass
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+        if self.cancel_event.is_set():
+            raise PipelineCancelled()
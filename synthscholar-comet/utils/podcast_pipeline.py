@@ -0,0 +1,252 @@
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from config import Config
+from utils.content_synthesizer import iter_sentences
+from utils.job_queue import PIPELINE_STAGES, JobCancelled, JobFailed
+from utils.pipeline import Pipeline, PipelineCancelled, Stage
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_MODES = ("sequential", "streaming", "pipelined")
+
+class PodcastPipeline:
+    """Runs research, synthesis and audio generation for a job
+
+    Modes (Config.PIPELINE_MODE):
+        sequential  each stage finishes before the next starts
+        streaming   research first, then the script streams straight into TTS
+        pipelined   all three stages overlap, connected by bounded queues
+
+    stage_limits caps how many jobs may be inside each stage at once
+    (Config.STAGE_CONCURRENCY by default; 0 means unlimited).
+    """
+
+    def __init__(self, research, synthesizer, audio, mode=None, stage_limits=None):
+        self.research = research
+        self.synthesizer = synthesizer
+        self.audio = audio
+        self.mode = mode or Config.PIPELINE_MODE
+        if self.mode not in PIPELINE_MODES:
+            raise ValueError(f"Unknown pipeline mode: {self.mode}")
+        limits = stage_limits if stage_limits is not None else Config.STAGE_CONCURRENCY
+        self._stage_slots = {
+            name: threading.BoundedSemaphore(limit) for name, limit in limits.items() if limit
+        }
+        self._reserved_lock = threading.Lock()
+
+    def run(self, job):
+        """Produce the podcast for job.topic and return the API result"""
+        runner = {
+            "sequential": self.run_sequential,
+            "streaming": self.run_streaming,
+            "pipelined": self.run_pipelined,
+        }[self.mode]
+        return runner(job)
+
+    def run_sequential(self, job):
+        topic = job.topic
+        research_data = self._research(job)
+
+        # Step 2: Synthesize content
+        with self._stage(job, "synthesis"):
+            logger.info("✍️ Synthesizing podcast script...")
+            podcast_script = self.synthesizer.create_podcast_script(topic, research_data)
+            if not podcast_script:
+                raise JobFailed("Content synthesis failed.")
+            job.publish_event("script", podcast_script)
+
+        # Step 3: Generate audio
+        with self._stage(job, "audio"):
+            logger.info("🔊 Generating audio podcast...")
+            audio_file_path = self.audio.text_to_speech(
+                podcast_script, topic, on_start=self._stream_url_publisher(job)
+            )
+            if not audio_file_path:
+                raise JobFailed("Audio generation failed.")
+
+        return self._result(topic, podcast_script, audio_file_path, len(research_data))
+
+    def run_streaming(self, job):
+        """Stream the script to listeners and TTS at the same time"""
+        topic = job.topic
+        research_data = self._research(job)
+        fragments = []
+        interrupted = []
+
+        def script_fragments():
+            try:
+                for fragment in self.synthesizer.stream_podcast_script(topic, research_data):
+                    job.check_cancelled()
+                    fragments.append(fragment)
+                    job.publish_event("script", fragment)
+                    yield fragment
+            except JobCancelled:
+                raise
+            except Exception:
+                # text_to_speech_stream only returns None, so remember the script was cut off
+                interrupted.append(True)
+                raise
+
+        def sentences():
+            with self._stage(job, "synthesis", reserved):
+                logger.info("✍️ Streaming podcast script...")
+                yield from iter_sentences(script_fragments())
+
+        reserved = self._reserve(job, ("synthesis", "audio"))
+        try:
+            with self._stage(job, "audio", reserved):
+                logger.info("🔊 Generating audio podcast while the script streams...")
+                audio_file_path = self.audio.text_to_speech_stream(
+                    sentences(), topic, on_start=self._stream_url_publisher(job)
+                )
+                job.check_cancelled()
+                if interrupted:
+                    raise JobFailed("Content synthesis was interrupted.")
+                if not audio_file_path:
+                    raise JobFailed("Audio generation failed.")
+        finally:
+            self._release(reserved)
+
+        podcast_script = "".join(fragments).strip()
+        if not podcast_script:
+            raise JobFailed("Content synthesis failed.")
+        return self._result(topic, podcast_script, audio_file_path, len(research_data))
+
+    def run_pipelined(self, job):
+        """Overlap all stages: sections feed synthesis, sentences feed TTS"""
+        topic = job.topic
+        sections = []
+        fragments = []
+
+        def research_stage(_):
+            with self._stage(job, "research", reserved):
+                logger.info("🔍 Starting COMET research...")
+                for section in self.research.iter_research(topic, cancel_event=job.cancel_event):
+                    sections.append(section)
+                    yield section
+                if not sections:
+                    raise JobFailed("Research failed. Please try a different topic.")
+
+        def synthesis_stage(research_sections):
+            with self._stage(job, "synthesis", reserved):
+                logger.info("✍️ Synthesizing podcast script section by section...")
+                try:
+                    for fragment in self.synthesizer.stream_sectioned_script(topic, research_sections):
+                        fragments.append(fragment)
+                        job.publish_event("script", fragment)
+                        yield fragment
+                except (JobFailed, PipelineCancelled):
+                    raise
+                except Exception as e:
+                    raise JobFailed("Content synthesis was interrupted.") from e
+
+        def audio_stage(script_fragments):
+            with self._stage(job, "audio", reserved):
+                logger.info("🔊 Generating audio as sentences arrive...")
+                chunks = self.audio.group_sentences(iter_sentences(script_fragments))
+                yield from self.audio.iter_segments(chunks)
+
+        pipeline = Pipeline(
+            [
+                Stage("research", research_stage),
+                Stage("synthesis", synthesis_stage),
+                Stage("audio", audio_stage),
+            ],
+            cancel_event=job.cancel_event
+        )
+
+        reserved = self._reserve(job, PIPELINE_STAGES)
+        try:
+            audio_file_path = self.audio.save_segments(
+                pipeline.run(), topic, on_start=self._stream_url_publisher(job)
+            )
+        except PipelineCancelled:
+            job.check_cancelled()
+            raise JobFailed("Podcast generation was interrupted.")
+        finally:
+            self._release(reserved)
+
+        podcast_script = "".join(fragments).strip()
+        if not podcast_script:
+            raise JobFailed("Content synthesis failed.")
+        return self._result(topic, podcast_script, audio_file_path, len(sections))
+
+    def _research(self, job):
+        # Step 1: Research with COMET Browser
+        with self._stage(job, "research"):
+            logger.info("🔍 Starting COMET research...")
+            research_data = self.research.research_topic(job.topic)
+            if not research_data:
+                raise JobFailed("Research failed. Please try a different topic.")
+        return research_data
+
+    @contextmanager
+    def _stage(self, job, name, reserved=None):
+        """job.stage(name) while holding a slot for that stage
+        
+        Slots already taken by _reserve() are used instead of waiting again.
+        """
+        slots = self._stage_slots.get(name)
+        if slots is not None and not self._claim(reserved, name):
+            self._acquire(job, slots)
+        try:
+            with job.stage(name):
+                yield
+        finally:
+            if slots is not None:
+                slots.release()
+    
+    def _reserve(self, job, names):
+        """Take the slots of overlapping stages up front, always in pipeline order
+        
+        Waiting for one stage while holding another could otherwise deadlock
+        two jobs whose queues feed each other's blocked stages.
+        """
+        reserved = []
+        try:
+            for name in names:
+                slots = self._stage_slots.get(name)
+                if slots is not None:
+                    self._acquire(job, slots)
+                    reserved.append(name)
+        except BaseException:
+            self._release(reserved)
+            raise
+        return reserved
+    
+    def _claim(self, reserved, name):
+        """Take over a reserved slot; False if it was never reserved or already given back"""
+        with self._reserved_lock:
+            if reserved is not None and name in reserved:
+                reserved.remove(name)
+                return True
+        return False
+    
+    def _release(self, reserved):
+        """Give back reserved slots whose stage never ran"""
+        with self._reserved_lock:
+            names = list(reserved)
+            del reserved[:]
+        for name in names:
+            self._stage_slots[name].release()
+    
+    def _acquire(self, job, slots):
+        # Wait for a slot without missing a cancellation
+        while not slots.acquire(timeout=0.5):
+            job.check_cancelled()
+    
+    def _stream_url_publisher(self, job):
+        return lambda name: job.set_detail("stream_url", f"/api/stream/{name}")
+
+    def _result(self, topic, podcast_script, audio_file_path, sections):
+        return {
+            "success": True,
+            "audio_url": f"/api/download/{os.path.basename(audio_file_path)}",
+            "script_preview": podcast_script[:400] + "..." if len(podcast_script) > 400 else podcast_script,
+            "topic": topic,
+            "research_summary": f"Researched {sections} key aspects",
+            "script_length": len(podcast_script),
+            "demo_mode": True
+        }
@@ -0,0 +1,273 @@
+import re
+import time
+import hashlib
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from config import Config
+from utils.metrics import RESEARCH_BACKEND_SECONDS, timed, watch_browser_pool
+from utils.sub_queries import SUB_QUERY_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+# A research backend is any object with
+#     name                    registry name, used in logs, metrics and cache keys
+#     research_topic(topic)   list of {"sub_query", "content"[, "sources"]} sections, or None,
+#                             sources being a list of {"url", "title"} links
+# and optionally iter_research(topic, cancel_event=None) to yield sections as
+# they arrive (stopping early once cancel_event is set) and
+# close_browser() to release resources. CometAutomation ("comet") and
+# MockCometAutomation ("corpus") already fit; the factories below set them up.
+
+class HTTPResearchBackend:
+    """Research sections from a plain HTTP JSON endpoint
+
+    GET <url>?topic=... must answer with a list of sections or an object
+    with a "sections" list, each section carrying at least "content".
+    """
+
+    name = "http"
+
+    def __init__(self, url=None, timeout=None, cache=None):
+        self.url = url or Config.RESEARCH_HTTP_URL
+        if not self.url:
+            raise ValueError("The http research backend needs RESEARCH_HTTP_URL")
+        self.timeout = timeout or Config.RESEARCH_BACKEND_TIMEOUTS.get(self.name, Config.RESEARCH_TIMEOUT)
+        self.cache = cache
+        self._session = None
+        self._cache_templates = ["backend:" + self.name, self.url]
+
+    @timed("http_research_topic")
+    def research_topic(self, topic):
+        if self.cache is not None:
+            cached = self.cache.get_research(topic, self._cache_templates)
+            if cached is not None:
+                return cached
+
+        try:
+            # requests is only loaded when this backend is configured
+            import requests
+
+            if self._session is None:
+                self._session = requests.Session()
+            response = self._session.get(self.url, params={"topic": topic}, timeout=self.timeout)
+            response.raise_for_status()
+            payload = response.json()
+        except Exception as e:
+            logger.error(f"❌ HTTP research failed: {str(e)}")
+            return None
+
+        items = payload.get("sections", []) if isinstance(payload, dict) else payload
+        research_data = []
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict) or not isinstance(item.get("content"), str) or not item["content"].strip():
+                continue
+            section = {"sub_query": str(item.get("sub_query") or topic), "content": item["content"].strip()}
+            sources = normalize_sources(item.get("sources"))
+            if sources:
+                section["sources"] = sources
+            research_data.append(section)
+
+        if not research_data:
+            return None
+        if self.cache is not None:
+            self.cache.put_research(topic, self._cache_templates, research_data)
+        return research_data
+
+    def iter_research(self, topic, cancel_event=None):
+        yield from self.research_topic(topic) or []
+
+    def close_browser(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+def create_comet_backend(cache=None):
+    """Selenium research against COMET, leasing warm sessions from a browser pool"""
+    from browser_pool import BrowserPool
+    from comet_automation import CometAutomation
+
+    automation = CometAutomation(cache=cache)
+
+    def prepare_session(driver):
+        automation.login_to_comet(Config.COMET_EMAIL, Config.COMET_PASSWORD, driver=driver)
+
+    automation.pool = BrowserPool(automation._create_driver, prepare=prepare_session)
+    automation.pool.start()
+    watch_browser_pool(automation.pool)
+    return automation
+
+def create_corpus_backend(cache=None):
+    """Canned research from the local corpus (Config.MOCK_CORPUS_DIR)"""
+    from mock_comet_automation import MockCometAutomation
+
+    return MockCometAutomation(cache=cache)
+
+RESEARCH_BACKENDS = {
+    "comet": create_comet_backend,
+    "corpus": create_corpus_backend,
+    HTTPResearchBackend.name: lambda cache=None: HTTPResearchBackend(cache=cache),
+}
+
+def create_research(names=None, cache=None):
+    """Build the configured research backend, fanning out when several are named
+
+    names defaults to Config.RESEARCH_BACKENDS, or to 'corpus' in demo mode
+    and 'comet' otherwise when that is empty.
+    """
+    names = list(names or Config.RESEARCH_BACKENDS or ["corpus" if Config.DEMO_MODE else "comet"])
+    unknown = [name for name in names if name not in RESEARCH_BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown research backend: {', '.join(unknown)}")
+
+    if len(names) == 1:
+        return RESEARCH_BACKENDS[names[0]](cache=cache)
+    # Each backend would store its own answer under the same topic key, so
+    # only the merged result is cached
+    return FanOutResearch([RESEARCH_BACKENDS[name]() for name in names], cache=cache)
+
+def normalize_sources(sources):
+    """{"url", "title"} links from a list of URL strings or link objects, one per URL"""
+    links = []
+    seen = set()
+    for source in sources if isinstance(sources, list) else []:
+        if isinstance(source, dict):
+            url, title = source.get("url"), source.get("title") or ""
+        else:
+            url, title = source, ""
+        if not isinstance(url, str) or not url or url in seen:
+            continue
+        seen.add(url)
+        links.append({"url": url, "title": str(title)})
+    return links
+
+def _fingerprint(text):
+    return hashlib.sha1(" ".join(re.findall(r"\w+", text.lower())).encode("utf-8")).hexdigest()
+
+def merge_sections(results):
+    """Concatenate section lists in order, dropping repeated content
+
+    When the same content arrives from several backends the first copy is
+    kept and the source links of the others are added to it, one per URL.
+    """
+    merged = []
+    seen = {}
+    for sections in results:
+        for section in sections:
+            key = _fingerprint(section["content"])
+            if key in seen:
+                kept = seen[key]
+                sources = normalize_sources(kept.get("sources", []) + section.get("sources", []))
+                if sources:
+                    kept["sources"] = sources
+                continue
+            seen[key] = dict(section)
+            if "sources" in section:
+                seen[key]["sources"] = normalize_sources(section["sources"])
+            merged.append(seen[key])
+    return merged
+
+class FanOutResearch:
+    """Runs several research backends concurrently for one topic
+
+    Backends are listed in order of preference; later ones act as hedges.
+    research_topic() returns as soon as the most preferred backend still
+    in the running has answered (or every backend has finished, or the
+    latency budget is spent), with the sections of every backend that
+    answered by then merged and deduplicated in preference order. A
+    backend that fails, returns nothing or exceeds its own timeout is
+    skipped, so a slow or broken source degrades the result instead of
+    failing it.
+    """
+
+    name = "fanout"
+
+    def __init__(self, backends, budget=None, timeouts=None, cache=None):
+        self.backends = list(backends)
+        self.budget = budget if budget is not None else Config.RESEARCH_BUDGET
+        self.timeouts = timeouts if timeouts is not None else Config.RESEARCH_BACKEND_TIMEOUTS
+        self.cache = cache
+        # One worker per backend for every topic the research stage admits,
+        # plus a spare each: a call that missed its deadline keeps its thread
+        # until the backend returns
+        topics = Config.STAGE_CONCURRENCY.get("research") or 4
+        self.executor = ThreadPoolExecutor(
+            max_workers=len(self.backends) * (topics + 1), thread_name_prefix="research-fanout"
+        )
+        self._cache_templates = SUB_QUERY_TEMPLATES + ["backends:" + ",".join(self.names)]
+
+    @property
+    def names(self):
+        return [getattr(backend, "name", type(backend).__name__) for backend in self.backends]
+
+    @timed("fanout_research_topic")
+    def research_topic(self, topic):
+        if self.cache is not None:
+            cached = self.cache.get_research(topic, self._cache_templates)
+            if cached is not None:
+                logger.info(f"⚡ Research cache hit for: {topic}")
+                return cached
+
+        started = time.monotonic()
+        budget_deadline = started + self.budget
+        pending = {}
+        for rank, (name, backend) in enumerate(zip(self.names, self.backends)):
+            deadline = min(budget_deadline, started + self.timeouts.get(name, self.budget))
+            future = self.executor.submit(self._call, backend, topic)
+            pending[future] = (rank, name, deadline)
+
+        results = {}
+        while pending:
+            # Everything ranked above the best answer so far has given up
+            best = min(results) if results else None
+            if best is not None and all(rank > best for rank, _, _ in pending.values()):
+                break
+
+            now = time.monotonic()
+            expired = [future for future, (_, _, deadline) in pending.items() if deadline <= now]
+            for future in expired:
+                rank, name, _ = pending.pop(future)
+                future.cancel()
+                RESEARCH_BACKEND_SECONDS.labels(backend=name, outcome="timeout").observe(now - started)
+                logger.warning(f"⚠️ Research backend {name} missed its deadline for: {topic}")
+            if not pending:
+                break
+
+            next_deadline = min(deadline for _, _, deadline in pending.values())
+            done, _ = wait(list(pending), timeout=max(0, next_deadline - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                rank, name, _ = pending.pop(future)
+                sections = future.result()
+                outcome = "success" if sections else "empty"
+                RESEARCH_BACKEND_SECONDS.labels(backend=name, outcome=outcome).observe(time.monotonic() - started)
+                if sections:
+                    results[rank] = sections
+
+        if not results:
+            logger.error(f"❌ No research backend answered for: {topic}")
+            return None
+
+        research_data = merge_sections(results[rank] for rank in sorted(results))
+        answered = [self.names[rank] for rank in sorted(results)]
+        logger.info(
+            f"✅ Research merged from {', '.join(answered)}: {len(research_data)} sections "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        if self.cache is not None:
+            self.cache.put_research(topic, self._cache_templates, research_data)
+        return research_data
+
+    def iter_research(self, topic, cancel_event=None):
+        yield from self.research_topic(topic) or []
+
+    def close_browser(self):
+        for backend in self.backends:
+            if hasattr(backend, "close_browser"):
+                backend.close_browser()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _call(self, backend, topic):
+        try:
+            return backend.research_topic(topic)
+        except Exception as e:
+            logger.error(f"❌ Research backend {getattr(backend, 'name', backend)} failed: {str(e)}")
+            return None
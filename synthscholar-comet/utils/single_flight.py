@@ -0,0 +1,44 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+class SingleFlight:
+    """Collapse concurrent requests for the same key onto one in-flight computation
+
+    join() either starts the computation (the caller becomes the leader) or
+    hands back the one already running. forget() is called once it finishes
+    so the next request starts fresh.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    def join(self, key, start, is_active=None):
+        """Return (value, shared); start() runs only when nothing is in flight for key"""
+        with self._lock:
+            current = self._inflight.get(key)
+            if current is not None and (is_active is None or is_active(current)):
+                self._stats["coalesced"] += 1
+                return current, True
+
+            value = start()
+            self._inflight[key] = value
+            self._stats["leaders"] += 1
+            return value, False
+
+    def forget(self, key, value):
+        """Drop key, unless a newer computation has already replaced value"""
+        with self._lock:
+            if self._inflight.get(key) is value:
+                del self._inflight[key]
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._inflight)
+        requests = stats["leaders"] + stats["coalesced"]
+        stats["coalesce_ratio"] = round(stats["coalesced"] / requests, 4) if requests else 0.0
+        return stats
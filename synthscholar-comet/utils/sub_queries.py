@@ -0,0 +1,12 @@
+# Sub-queries for comprehensive research
+SUB_QUERY_TEMPLATES = [
+    "comprehensive analysis of {topic} with key benefits and advantages",
+    "main criticisms and challenges of {topic}",
+    "recent research and developments about {topic} in 2024",
+    "practical applications and real-world examples of {topic}",
+    "expert opinions and future outlook for {topic}"
+]
+
+def build_sub_queries(topic):
+    """Expand the sub-query templates for a topic"""
+    return [template.format(topic=topic) for template in SUB_QUERY_TEMPLATES]
@@ -0,0 +1,197 @@
+import re
+from collections import namedtuple
+
+# Speaker labels the synthesizer writes in front of a turn
+SPEAKERS = ("HOST", "CONCLUSION")
+
+BULLET_CHARS = "•◦▪‣●·*-"
+
+EMOJI = r"\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D\u20E3"
+
+BULLET = r"[ \t]*[%s][ \t]+" % re.escape(BULLET_CHARS)
+
+# Placed right after a token's first character: that character starts a
+# word, i.e. it is at the start of the text or follows a non-word character
+WORD_START = r"(?<!\w.)"
+
+# The rest of a number after its first digit: 1,200 or 12.5
+NUMBER = r"\d*(?:,\d{3})*(?:\.\d+)?"
+
+# Leading signs read as "minus": hyphen and the Unicode minus
+SIGNS = "-\u2212"
+
+# How a number's unit is read out
+UNITS = {"%": " percent", "°C": " degrees Celsius", "°F": " degrees Fahrenheit", "x": " times"}
+UNIT = r"%|°[CF]|x\b"
+
+# A number with a unit, or a range. The first character is a digit or a
+# sign that is not glued to a word ("-5%", not "COVID-19"); each end of a
+# range may carry a unit, and longer dash chains (dates, phone numbers) are
+# left alone.
+SIGNED_NUMBER = (
+    r"(?<![\w.,\-–].)(?:(?<=[%s])\d|(?<=\d))(?P<digits>%s)(?:(?P<unit>%s)|(?=[-–]\d))"
+    r"(?:[-–](?P<upper>\d%s)(?P<upper_unit>%s)?(?![-–]?\d))?" % (SIGNS, NUMBER, UNIT, NUMBER, UNIT)
+)
+
+# A full stop after these does not end the sentence ("Dr. Smith")
+ABBREVIATIONS = ("Dr", "Mr", "Mrs", "Ms", "Prof", "Sr", "Jr", "St", "vs")
+NOT_ABBREVIATION = "".join(r"(?<!\b%s\.)" % word for word in ABBREVIATIONS)
+
+# (name, characters a token can start with, rest of the token). Bullets are
+# matched together with the line break in front of them. Plain numbers need
+# no rule: glue only fires before a letter, so 3.5 and 1,200 pass untouched;
+# only numbers with a unit or sign, dollar amounts and ranges are rewritten.
+RULES = [
+    ("stage", r"\[", r"[^\]\n]*\]"),
+    ("heading", "R", WORD_START + r"ESEARCH AREA \d+:"),
+    ("speaker", "".join(label[0] for label in SPEAKERS),
+     WORD_START + "(?:%s)" % "|".join(f"(?<={label[0]}){label[1:]}:" for label in SPEAKERS)),
+    ("money", r"\$", r"(?P<amount>\d%s)(?P<scale>[ \t]+(?:thousand|million|billion|trillion)\b)?" % NUMBER),
+    ("number", r"\d" + re.escape(SIGNS), SIGNED_NUMBER),
+    ("emoji", EMOJI, f"[{EMOJI}]*"),
+    ("markdown", "*#`", "[*#`]*"),
+    ("glue", r"\.", r"(?=[^\W\d_])"),
+    ("end", ".!?", NOT_ABBREVIATION + r"[.!?]*[\"')\u201D\u2019]*(?=\s|$)"),
+    ("newline", r"\n", r"(?:[ \t]*\n)*(?P<bullet>%s)?" % BULLET),
+]
+
+# All rules in one pattern, so the script is rewritten in a single scan.
+# It opens with a plain character class of every possible first character,
+# which lets the regex engine skip ordinary text without trying each rule;
+# a lookbehind then picks the rule the consumed character belongs to.
+TOKEN_PATTERN = re.compile("[%s](?:%s)" % (
+    "".join(first for _, first, _ in RULES),
+    "|".join(f"(?<=[{first}])(?P<{name}>{rest})" for name, first, rest in RULES)
+))
+LEADING_BULLET = re.compile(BULLET)
+
+Segment = namedtuple("Segment", "speaker sentences")
+Normalized = namedtuple("Normalized", "text segments")
+
+def _reads_as_range(lower, upper):
+    """False for digit groups that are phone or ID numbers rather than ranges
+
+    Zero-padded groups, descending pairs and the 3-4 digit shape of a local
+    phone number ("555-1234", but not a round "100-1500") are kept as written.
+    """
+    if not (lower.isdigit() and upper.isdigit()):
+        return True
+    if (len(lower) > 1 and lower[0] == "0") or (len(upper) > 1 and upper[0] == "0"):
+        return False
+    if int(upper) <= int(lower):
+        return False
+    return not (len(lower) == 3 and len(upper) == 4 and not upper.endswith("00"))
+
+def read_number(match):
+    """Spoken form of a number token, or the token unchanged when it is not a quantity"""
+    text = match.string
+    signed = text[match.start()] in SIGNS
+    lower = text[match.start() + signed:match.end("digits")]
+    unit, upper, upper_unit = match.group("unit", "upper", "upper_unit")
+    minus = "minus " if signed else ""
+    if upper is None:
+        return f"{minus}{lower}{UNITS[unit]}" if unit else match.group()
+    if not (signed or unit or upper_unit or _reads_as_range(lower, upper)):
+        return match.group()
+    # A unit written once applies to both ends: "5-10%" is 5 to 10 percent
+    lower_unit, upper_unit = unit or upper_unit, upper_unit or unit
+    return f"{minus}{lower}{UNITS.get(lower_unit, '')} to {upper}{UNITS.get(upper_unit, '')}"
+
+class TextNormalizer:
+    """Single-pass cleanup of podcast scripts for speech synthesis
+
+    Drops stage directions ("[Music fades out]"), research headings,
+    markdown markers and emoji, reads bullets as sentences, spells out
+    units, signs, dollar amounts and ranges ("-12.5%" -> "minus 12.5
+    percent", "$3 million" -> "3 million dollars", "5-10%" -> "5 percent
+    to 10 percent") while leaving decimals, thousands separators, dates
+    and phone numbers intact, keeps "Dr." and similar titles inside their
+    sentence, and starts a new segment at every speaker label. normalize() returns those speaker/sentence segments
+    along with the text, so chunked TTS does not need to split it again.
+    """
+
+    def clean(self, text):
+        return self.normalize(text).text
+
+    def normalize(self, text):
+        """Normalized(text, segments) where segments is a list of Segment(speaker, sentences)
+
+        The text has one sentence per line and a blank line between speaker turns.
+        """
+        pieces = []
+        append = pieces.append
+        sentences = []
+        segments = []
+        speaker = None
+
+        def close_sentence():
+            sentence = " ".join("".join(pieces).split())
+            if sentence:
+                sentences.append(sentence)
+            pieces.clear()
+
+        leading = LEADING_BULLET.match(text)
+        bullet = leading is not None
+        position = leading.end() if bullet else 0
+        for match in TOKEN_PATTERN.finditer(text, position):
+            start = match.start()
+            if start > position:
+                append(text[position:start])
+            position = match.end()
+
+            kind = match.lastgroup
+            if kind == "newline" or kind == "bullet":
+                if bullet:
+                    # A bullet is read as its own sentence, so give it a full stop
+                    tail = "".join(pieces).rstrip()
+                    if tail and tail[-1] not in ".!?:;":
+                        append(".")
+                close_sentence()
+                bullet = match.group("bullet") is not None
+            elif kind == "end":
+                append(match.group())
+                close_sentence()
+            elif kind == "speaker":
+                close_sentence()
+                if sentences:
+                    segments.append(Segment(speaker, sentences))
+                    sentences = []
+                speaker = match.group()[:-1]
+                append(match.group())
+            elif kind == "glue":
+                append(". ")
+            elif kind == "money":
+                append(f"{match.group('amount')}{match.group('scale') or ''} dollars")
+            elif kind == "number":
+                append(read_number(match))
+            # stage, heading, emoji and markdown tokens are dropped
+
+        if position < len(text):
+            append(text[position:])
+        if bullet and "".join(pieces).rstrip()[-1:] not in ("", ".", "!", "?", ":", ";"):
+            append(".")
+        close_sentence()
+        if sentences:
+            segments.append(Segment(speaker, sentences))
+
+        text = "\n\n".join("\n".join(segment.sentences) for segment in segments)
+        return Normalized(text, segments)
+
+def chunk_segments(segments, max_chars):
+    """Pack each segment's sentences into chunks of at most max_chars
+
+    Chunks never span two speakers. A single sentence longer than max_chars
+    stays whole.
+    """
+    chunks = []
+    for segment in segments:
+        current = ""
+        for sentence in segment.sentences:
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                chunks.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            chunks.append(current)
+    return chunks
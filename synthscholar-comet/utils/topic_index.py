@@ -0,0 +1,314 @@
+import os
+import re
+import json
+import math
+import logging
+import threading
+from collections import namedtuple
+from config import Config
+from utils.cache import normalize_topic
+from utils.corpus_store import INDEX_SUFFIX, CorpusStore, read_source_file
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = frozenset((
+    "a", "an", "and", "are", "about", "for", "how", "i", "in", "is", "of", "on",
+    "or", "the", "to", "what", "why", "with",
+))
+
+# "A.I." or "u.s.a." -> "ai", "usa"; otherwise punctuation splits them into letters
+DOTTED_ACRONYM = re.compile(r"\b(?:[a-z]\.){2,}", re.IGNORECASE)
+
+# Synonym phrases must keep a token at least this long, so they cannot
+# fire on pronouns, articles and other letters common in any query
+MIN_SYNONYM_TOKEN = 3
+
+TopicMatch = namedtuple("TopicMatch", "topic score matched_name sections")
+
+def _stem(token):
+    # Light plural folding: "computers" -> "computer", but keep "class", "gas"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+def tokenize(text):
+    text = DOTTED_ACRONYM.sub(lambda match: match.group(0).replace(".", "") + " ", text)
+    return [_stem(token) for token in normalize_topic(text).split() if token not in STOPWORDS]
+
+def _trigrams(token):
+    padded = f"#{token}#"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class TopicIndex:
+    """Inverted index over topic names and aliases for the canned research corpus
+
+    Unknown query tokens are first corrected through a character trigram
+    index. Contiguous query spans are then looked up as whole names (word
+    order ignored), so "latest AI news" finds "ai" in a few dict lookups.
+    Only when no span names a topic are names whose distinctive tokens all
+    appear somewhere in the query ranked by the IDF-weighted share covered;
+    one word of a longer name ("energy" of "renewable energy") is not enough.
+    """
+
+    def __init__(self, min_score=0.5, fuzzy_threshold=0.4, max_postings=2000):
+        self.min_score = min_score
+        self.fuzzy_threshold = fuzzy_threshold
+        self.max_postings = max_postings
+        self.docs = []
+        self._doc_ids = {}
+        self._names = []
+        self._name_keys = set()
+        self._postings = {}
+        self._phrases = {}
+        self._longest_name = 0
+        self._trigrams = {}
+        self._synonyms = {}
+        self._idf = {}
+        self._name_weight = []
+        self._distinctive = []
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.stores = []
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, topic, sections, aliases=()):
+        """Index a topic; adding a known topic replaces its sections and extends its aliases
+
+        sections may be a list or a zero-argument callable that loads it on
+        demand (see CorpusStore.loader).
+        """
+        key = normalize_topic(topic)
+        if not key or not sections:
+            raise ValueError(f"Topic record needs a name and sections: {topic!r}")
+
+        with self._lock:
+            doc_id = self._doc_ids.get(key)
+            if doc_id is None:
+                doc_id = len(self.docs)
+                self._doc_ids[key] = doc_id
+                self.docs.append({"topic": key, "aliases": [], "sections": sections})
+            else:
+                self.docs[doc_id]["sections"] = sections
+
+            for position, name in enumerate((topic,) + tuple(aliases)):
+                tokens = tuple(tokenize(name))
+                if not tokens or (doc_id, tokens) in self._name_keys:
+                    continue
+                if position > 0:
+                    self.docs[doc_id]["aliases"].append(normalize_topic(name))
+                self._name_keys.add((doc_id, tokens))
+                name_id = len(self._names)
+                self._names.append((doc_id, tokens))
+                self._phrases.setdefault(tuple(sorted(tokens)), []).append(name_id)
+                self._longest_name = max(self._longest_name, len(tokens))
+                for token in set(tokens):
+                    if token not in self._postings:
+                        self._postings[token] = []
+                        for gram in _trigrams(token):
+                            self._trigrams.setdefault(gram, set()).add(token)
+                    self._postings[token].append(name_id)
+            self._dirty = True
+        return doc_id
+
+    def add_synonyms(self, synonyms):
+        """Map query phrases onto indexed vocabulary, e.g. {"global warming": "climate change"}
+
+        Phrases that reduce to stopwords or only one- and two-letter tokens
+        would match unrelated queries and are skipped; short acronyms
+        belong in a topic's aliases instead.
+        """
+        with self._lock:
+            for text, canonical in synonyms.items():
+                phrase = tuple(tokenize(text))
+                if not any(len(token) >= MIN_SYNONYM_TOKEN for token in phrase):
+                    logger.warning(f"⚠️ Skipping synonym {text!r}: too short to match safely")
+                    continue
+                # Keyed by first token so a query only checks phrases it could contain
+                self._synonyms.setdefault(phrase[0], {})[phrase] = tuple(tokenize(canonical))
+
+    def best_match(self, query):
+        matches = self.search(query, limit=1)
+        return matches[0] if matches else None
+
+    def search(self, query, limit=5):
+        """Ranked TopicMatch list for query, best first, above min_score"""
+        with self._lock:
+            if self._dirty:
+                self._refresh_idf()
+            tokens, similarity = self._correct(tokenize(query))
+            synonyms = self._synonym_phrases(tokens)
+            candidates = self._phrase_matches(tokens, similarity, synonyms)
+            if not candidates:
+                candidates = self._partial_matches(tokens, similarity, synonyms)
+            return self._rank(candidates, limit)
+
+    def _correct(self, tokens):
+        """Replace unknown tokens by their closest indexed spelling, with its similarity"""
+        corrected, similarity = [], []
+        for token in tokens:
+            score = 1.0
+            if token not in self._postings:
+                token, score = self._closest(token)
+            corrected.append(token)
+            similarity.append(score)
+        return corrected, similarity
+
+    def _closest(self, token):
+        if len(token) < 4:
+            return token, 0.0
+        grams = _trigrams(token)
+        counts = {}
+        for gram in grams:
+            for candidate in self._trigrams.get(gram, ()):
+                counts[candidate] = counts.get(candidate, 0) + 1
+        best, best_score = token, 0.0
+        for candidate, shared in counts.items():
+            score = shared / len(grams | _trigrams(candidate))
+            if score > best_score:
+                best, best_score = candidate, score
+        if best_score < self.fuzzy_threshold:
+            return token, 0.0
+        return best, best_score
+
+    def _synonym_phrases(self, tokens):
+        """Canonical token tuples of every synonym phrase found in the query"""
+        found = []
+        for start, token in enumerate(tokens):
+            for phrase, canonical in self._synonyms.get(token, {}).items():
+                if tuple(tokens[start:start + len(phrase)]) == phrase:
+                    found.append(canonical)
+        return found
+
+    def _phrase_matches(self, tokens, similarity, synonyms):
+        """Names spelled out (in any word order) by a contiguous span of the query"""
+        candidates = {}
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(len(tokens), start + self._longest_name) + 1):
+                if not similarity[end - 1]:
+                    break
+                name_ids = self._phrases.get(tuple(sorted(tokens[start:end])))
+                if name_ids:
+                    score = sum(similarity[start:end]) / (end - start)
+                    for name_id in name_ids:
+                        candidates[name_id] = max(score, candidates.get(name_id, 0.0))
+        for canonical in synonyms:
+            for name_id in self._phrases.get(tuple(sorted(canonical)), ()):
+                candidates[name_id] = 1.0
+        return candidates
+
+    def _partial_matches(self, tokens, similarity, synonyms):
+        """IDF-weighted coverage of names whose distinctive tokens the query all contains
+
+        Tokens too common to identify a topic on their own are skipped, which
+        keeps this bounded on large corpora, and need not be covered.
+        """
+        hits = {}
+        for token, score in zip(tokens, similarity):
+            if score:
+                hits[token] = max(score, hits.get(token, 0.0))
+        for canonical in synonyms:
+            for token in canonical:
+                hits[token] = 1.0
+
+        covered, counts = {}, {}
+        for token, score in hits.items():
+            postings = self._postings.get(token, ())
+            if len(postings) > self.max_postings:
+                continue
+            for name_id in postings:
+                covered[name_id] = covered.get(name_id, 0.0) + self._idf[token] * score
+                counts[name_id] = counts.get(name_id, 0) + 1
+
+        return {
+            name_id: mass / self._name_weight[name_id]
+            for name_id, mass in covered.items()
+            if counts[name_id] == self._distinctive[name_id]
+        }
+
+    def _rank(self, candidates, limit):
+        best = {}
+        for name_id, score in candidates.items():
+            if score < self.min_score:
+                continue
+            doc_id, tokens = self._names[name_id]
+            # Prefer better matches, then more specific (heavier, longer) names
+            rank = (score, self._name_weight[name_id], len(tokens))
+            if doc_id not in best or rank > best[doc_id][0]:
+                best[doc_id] = (rank, name_id)
+
+        ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+        return [
+            TopicMatch(
+                self.docs[doc_id]["topic"],
+                round(rank[0], 4),
+                " ".join(self._names[name_id][1]),
+                self._sections(doc_id)
+            )
+            for doc_id, (rank, name_id) in ranked
+        ]
+
+    def _sections(self, doc_id):
+        sections = self.docs[doc_id]["sections"]
+        return sections() if callable(sections) else sections
+
+    def _refresh_idf(self):
+        total = len(self._names)
+        self._idf = {
+            token: math.log(1 + total / len(name_ids)) for token, name_ids in self._postings.items()
+        }
+        self._name_weight = [sum(self._idf[token] for token in tokens) for _, tokens in self._names]
+        self._distinctive = [
+            sum(1 for token in set(tokens) if len(self._postings[token]) <= self.max_postings)
+            for _, tokens in self._names
+        ]
+        self._dirty = False
+
+    @classmethod
+    def from_directory(cls, path, **options):
+        """Load compiled corpus stores (*.idx), *.json / *.jsonl sources and synonyms.json"""
+        index = cls(**options)
+        if not os.path.isdir(path):
+            logger.warning(f"⚠️ Mock corpus directory not found: {path}")
+            return index
+
+        for name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, name)
+            try:
+                if name == "synonyms.json":
+                    with open(file_path, encoding="utf-8") as f:
+                        index.add_synonyms(json.load(f))
+                elif name.endswith(INDEX_SUFFIX):
+                    index.add_store(CorpusStore(file_path))
+                elif name.endswith((".json", ".jsonl")):
+                    index._add_records(read_source_file(file_path), file_path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"❌ Could not load mock corpus file {file_path}: {str(e)}")
+
+        logger.info(f"📚 Indexed {len(index)} mock research topics from {path}")
+        return index
+
+    def add_store(self, store):
+        """Index every topic of a compiled CorpusStore; sections stay on disk until matched"""
+        self.stores.append(store)
+        for record in store.records:
+            self.add(record["topic"], store.loader(record), record.get("aliases", ()))
+
+    def _add_records(self, records, source):
+        for record in records:
+            try:
+                self.add(record["topic"], record["sections"], record.get("aliases", ()))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"⚠️ Skipping mock corpus record in {source}: {str(e)}")
+
+_default_indexes = {}
+_default_lock = threading.Lock()
+
+def default_index(path=None):
+    """Process-wide index for a corpus directory, loaded on first use"""
+    path = path or Config.MOCK_CORPUS_DIR
+    with _default_lock:
+        if path not in _default_indexes:
+            _default_indexes[path] = TopicIndex.from_directory(path)
+        return _default_indexes[path]
@@ -0,0 +1,49 @@
+import io
+import time
+import logging
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# One silent MPEG-1 Layer III frame (32 kbps, 44.1 kHz, mono, ~26 ms)
+SILENT_MP3_FRAME = b"\xff\xfb\x10\xc4" + b"\x00" * 100
+
+class GTTSEngine:
+    """Google Translate TTS, the production engine"""
+
+    name = "gtts"
+
+    def synthesize(self, text, language):
+        """Return MP3 bytes for text"""
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=language, slow=False, lang_check=False).write_to_fp(buffer)
+        return buffer.getvalue()
+
+class StubTTSEngine:
+    """Offline engine emitting silent MP3 frames, for tests and benchmarks"""
+
+    name = "stub"
+
+    def __init__(self, latency=0.0, chars_per_frame=15):
+        self.latency = latency
+        self.chars_per_frame = chars_per_frame
+
+    def synthesize(self, text, language):
+        if self.latency:
+            time.sleep(self.latency)
+        return SILENT_MP3_FRAME * max(1, len(text) // self.chars_per_frame)
+
+TTS_ENGINES = {
+    GTTSEngine.name: GTTSEngine,
+    StubTTSEngine.name: StubTTSEngine,
+}
+
+def create_engine(name=None):
+    """Build a TTS engine by name, defaulting to Config.TTS_ENGINE"""
+    name = name or Config.TTS_ENGINE
+    try:
+        return TTS_ENGINES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown TTS engine: {name}")